@@ -5,37 +5,298 @@ Arquivo: analise_hw_sw.py
 Descrição: Análise teórica e prática de desempenho entre implementações
 Autor: Equipe Processador Vetorial - INE5406
 Data: 26/11/2025
+
+O matplotlib só é importado ao gerar os gráficos: importar o módulo ou pedir
+apenas os números (--sem-graficos, --formato json) não o carrega. As saídas
+(relatório, resumo JSON e gráficos) são refeitas apenas quando o hash das
+entradas muda: ciclos da FSM, tempos de software, potência, recursos, eixos
+das curvas e o código deste arquivo. Os ciclos da FSM ficam no mesmo cache,
+indexados pelo hash de simulador_fsmd.py, e não são ressimulados.
 """
 
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+import simulador_fsmd
+from simulador_fsmd import BRAM_PALAVRAS, OPERACOES, VARIANTES_DOT, ciclos_por_operacao
+
+# Estilo dos gráficos, aplicado apenas durante gerar_graficos()
+ESTILO_GRAFICOS = 'seaborn-v0_8-darkgrid'
+PARAMETROS_GRAFICOS = {
+    'figure.figsize': (12, 8),
+    'font.size': 11,
+    'axes.labelsize': 12,
+    'axes.titlesize': 14,
+    'legend.fontsize': 10,
+}
+
+# Nomes das saídas de main() dentro de --saida-dir
+ARQUIVO_RELATORIO = 'comparativo_hw_sw_relatorio.txt'
+ARQUIVO_RESUMO = 'comparativo_hw_sw_resumo.json'
+ARQUIVO_GRAFICOS = 'comparativo_hw_sw_graficos.png'
+ARQUIVO_CACHE = '.comparativo_hw_sw_cache.json'
+
+# Tempos do SOFTWARE medidos na versão 2.0 (processador_vetorial_sw.py,
+# backend escalar). Usados apenas quando nenhum resultado da suíte de
+# benchmark é informado.
+SW_TEMPO_US_REFERENCIA = {
+    'soma': 2.365,
+    'subtracao': 2.268,
+    'produto_escalar': 1.469
+}
+
+# Eixos padrão das curvas de escalonamento
+TAMANHOS_LOTE_PADRAO = np.logspace(0, 6, 7)
+FREQUENCIAS_MHZ_PADRAO = np.array([50.0, 100.0, 250.0, 500.0])
+
+# Lotes são executados em rajadas; A, B e resultados dividem a BRAM
+PARES_POR_RAJADA = BRAM_PALAVRAS // 3
+
+# Fmax do datapath atual (serial) reportado pelo TimeQuest
+FMAX_MEDIDO_MHZ = 964.32
+
+# Pesos relativos (ns) dos elementos do caminho crítico do produto escalar.
+# Valores típicos de ordem de grandeza para Cyclone IV E -8; só as proporções
+# entre eles importam, pois a escala é calibrada abaixo.
+ATRASOS_TIPICOS_NS = {
+    'registrador': 0.6,      # tco + tsu
+    'multiplicador': 3.5,    # multiplicador embarcado 9x9 combinacional
+    'mux4': 0.45,            # mux 4:1 (uma LUT por bit)
+    'somador_base': 0.4,     # entrada e saída da cadeia de carry
+    'carry_por_bit': 0.05,
+}
+
+# Escala que faz o caminho serial (reg -> multiplicador -> mux 4:1 ->
+# acumulador de 24 bits) reproduzir FMAX_MEDIDO_MHZ
+ESCALA_ATRASOS = (1000 / FMAX_MEDIDO_MHZ) / (
+    ATRASOS_TIPICOS_NS['registrador'] + ATRASOS_TIPICOS_NS['multiplicador']
+    + ATRASOS_TIPICOS_NS['mux4'] + ATRASOS_TIPICOS_NS['somador_base']
+    + 24 * ATRASOS_TIPICOS_NS['carry_por_bit']
+)
+
+# Modelo de atrasos calibrado (ns)
+ATRASOS_NS = {nome: atraso * ESCALA_ATRASOS for nome, atraso in ATRASOS_TIPICOS_NS.items()}
+
+
+def atraso_somador(bits: int) -> float:
+    """Atraso de um somador de `bits` bits na cadeia de carry."""
+    return ATRASOS_NS['somador_base'] + bits * ATRASOS_NS['carry_por_bit']
+
+
+def estimar_fmax_dot(variante: str) -> float:
+    """
+    Estima o Fmax do caminho do produto escalar para uma variante do datapath.
+    
+    Args:
+        variante: 'serial', 'arvore' ou 'arvore_pipeline'
+        
+    Returns:
+        Frequência máxima estimada (MHz); 'serial' devolve FMAX_MEDIDO_MHZ
+    """
+    multiplicador = ATRASOS_NS['multiplicador']
+    acumulador = atraso_somador(24)
+    if variante == 'serial':
+        # reg -> multiplicador -> mux 4:1 -> acumulador
+        caminhos = [multiplicador + ATRASOS_NS['mux4'] + acumulador]
+    elif variante == 'arvore':
+        # reg -> multiplicador -> 17 bits -> 18 bits -> acumulador
+        caminhos = [multiplicador + atraso_somador(17) + atraso_somador(18) + acumulador]
+    elif variante == 'arvore_pipeline':
+        # Registrador após o primeiro nível da árvore divide o caminho
+        caminhos = [multiplicador + atraso_somador(17), atraso_somador(18) + acumulador]
+    else:
+        raise ValueError(f"Variante desconhecida: {variante}")
+    return 1000 / (ATRASOS_NS['registrador'] + max(caminhos))
+
+
+def carregar_tempos_sw(caminho: str, backend: str = 'escalar') -> Dict[str, float]:
+    """
+    Carrega os tempos por operação de um arquivo JSON da suíte de benchmark.
+    
+    Args:
+        caminho: Arquivo gerado por suite_benchmark.py --saida
+        backend: Backend cujos tempos serão usados
+        
+    Returns:
+        Dicionário operação -> tempo mediano por operação (µs)
+    """
+    with open(caminho, encoding='utf-8') as f:
+        suite = json.load(f)
+    medidas = suite['resultados'][backend]
+    return {op: medidas[op]['mediana_ns'] / 1000 for op in OPERACOES}
+
+
+def carregar_curvas_sw(caminho: str, backend: str = 'lote') -> Optional[Dict[str, Dict[str, List[float]]]]:
+    """
+    Carrega o tempo por operação em função do tamanho do lote de um arquivo
+    JSON da suíte de benchmark (gerado com --tamanhos-lote).
+    
+    Args:
+        caminho: Arquivo gerado por suite_benchmark.py --saida
+        backend: Backend em lote cujas curvas serão usadas
+        
+    Returns:
+        Dicionário operação -> {'tamanhos', 'tempo_us'} (tempo por operação),
+        ou None se o arquivo não tiver medidas por tamanho desse backend
+    """
+    with open(caminho, encoding='utf-8') as f:
+        suite = json.load(f)
+    curvas = suite.get('por_tamanho', {}).get(backend)
+    if curvas is None:
+        return None
+    return {op: {'tamanhos': curvas[op]['tamanhos'],
+                 'tempo_us': [t / 1000 for t in curvas[op]['mediana_ns']]}
+            for op in OPERACOES}
+
+
+def hash_conteudo(*partes: Any) -> str:
+    """
+    Hash SHA-256 de valores serializáveis em JSON (chaves ordenadas).
+
+    Args:
+        partes: Valores a combinar; arrays NumPy entram como listas
+
+    Returns:
+        Digest hexadecimal
+    """
+    texto = json.dumps(partes, sort_keys=True, default=lambda v: np.asarray(v).tolist())
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def hash_arquivo(caminho: str) -> str:
+    """Hash SHA-256 do conteúdo de um arquivo."""
+    with open(caminho, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def medir_ciclos_fsm(contagem: int = PARES_POR_RAJADA) -> Dict[str, Dict[str, int]]:
+    """
+    Simula a FSM para obter todos os ciclos usados pela análise.
+
+    Args:
+        contagem: Pares por rajada nas variantes do produto escalar
+
+    Returns:
+        Dicionário com 'operacao' (ciclos por operação única, datapath
+        serial), 'rajada' (operação -> ciclos de rajadas de 0 a
+        PARES_POR_RAJADA pares, datapath serial), 'dot_unica' e
+        'dot_rajada' (ciclos do produto escalar por variante, em operação
+        única e numa rajada de `contagem` pares) e 'contagem'
+    """
+    rajadas = [ciclos_por_operacao(pares) for pares in range(1, PARES_POR_RAJADA + 1)]
+    return {
+        'operacao': ciclos_por_operacao(),
+        'rajada': {op: [0] + [ciclos[op] for ciclos in rajadas] for op in OPERACOES},
+        'dot_unica': {v: ciclos_por_operacao(variante_dot=v)['produto_escalar'] for v in VARIANTES_DOT},
+        'dot_rajada': {v: ciclos_por_operacao(contagem, v)['produto_escalar'] for v in VARIANTES_DOT},
+        'contagem': contagem,
+    }
+
+
+def escrever_texto(caminho: str, texto: str):
+    """Grava `texto` em `caminho` (UTF-8)."""
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write(texto)
+
+
+class CacheSaidas:
+    """
+    Manifesto JSON com o hash das entradas de cada saída gerada e os ciclos
+    da FSM indexados pelo hash do simulador.
+    """
+
+    def __init__(self, caminho: Optional[str]):
+        """
+        Args:
+            caminho: Arquivo do manifesto (None desativa o cache)
+        """
+        self.caminho = caminho
+        self.dados = {'ciclos_fsm': {}, 'saidas': {}}
+        if caminho is not None and os.path.exists(caminho):
+            try:
+                with open(caminho, encoding='utf-8') as f:
+                    self.dados.update(json.load(f))
+            except (OSError, ValueError):
+                pass  # manifesto corrompido: tudo é refeito
+
+    def ciclos_fsm(self, contagem: int = PARES_POR_RAJADA) -> Dict[str, Dict[str, int]]:
+        """
+        Ciclos da FSM do cache, ou simulados se o simulador mudou.
+
+        Args:
+            contagem: Pares por rajada (ver medir_ciclos_fsm)
+
+        Returns:
+            Saída de medir_ciclos_fsm()
+        """
+        chave = hash_conteudo(hash_arquivo(simulador_fsmd.__file__), inspect.getsource(medir_ciclos_fsm),
+                              PARES_POR_RAJADA, contagem)
+        if chave not in self.dados['ciclos_fsm']:
+            # Só a versão atual do simulador é mantida
+            self.dados['ciclos_fsm'] = {chave: medir_ciclos_fsm(contagem)}
+            self.salvar()
+        return self.dados['ciclos_fsm'][chave]
+
+    def atualizado(self, saida: str, chave: str) -> bool:
+        """Indica se `saida` existe e foi gerada a partir das entradas de hash `chave`."""
+        return (self.caminho is not None and os.path.exists(saida)
+                and self.dados['saidas'].get(os.path.abspath(saida)) == chave)
+
+    def registrar(self, saida: str, chave: str):
+        """Registra que `saida` foi gerada a partir das entradas de hash `chave`."""
+        self.dados['saidas'][os.path.abspath(saida)] = chave
+        self.salvar()
+
+    def salvar(self):
+        """Grava o manifesto (sem efeito com o cache desativado)."""
+        if self.caminho is None:
+            return
+        diretorio = os.path.dirname(self.caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        temporario = f"{self.caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.dados, f, indent=2, sort_keys=True)
+        os.replace(temporario, self.caminho)
 
-# Configurações de estilo para gráficos profissionais
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['legend.fontsize'] = 10
 
 class AnalisadorDesempenho:
     """Classe para análise comparativa de desempenho HW vs SW."""
     
-    def __init__(self):
-        """Inicializa o analisador com dados de hardware e software."""
+    def __init__(self, resultados_sw: Optional[str] = None, backend_sw: str = 'escalar',
+                 tamanhos_lote: Optional[np.ndarray] = None,
+                 frequencias_mhz: Optional[np.ndarray] = None,
+                 ciclos_fsm: Optional[Dict[str, Dict[str, int]]] = None,
+                 backend_lote: str = 'lote'):
+        """
+        Inicializa o analisador com dados de hardware e software.
+        
+        Args:
+            resultados_sw: JSON da suíte de benchmark (padrão: tempos da v2.0)
+            backend_sw: Backend de software usado na comparação por operação
+            tamanhos_lote: Números de operações para as curvas de escalonamento
+            frequencias_mhz: Frequências de clock para as curvas de escalonamento
+            ciclos_fsm: Saída de medir_ciclos_fsm() (ex.: de CacheSaidas);
+                se omitido, a FSM é simulada
+            backend_lote: Backend cujas medidas por tamanho de lote (se
+                presentes no JSON) definem o software nas curvas de
+                escalonamento
+        """
         
         # Dados do HARDWARE (FPGA Cyclone IV E)
-        self.hw_fmax = 964.32  # MHz
+        self.hw_fmax = FMAX_MEDIDO_MHZ  # MHz
         self.hw_fmax_restricted = 250.0  # MHz (limitado por I/O)
         self.hw_clock_period_ns = 1000 / self.hw_fmax_restricted  # ns
         
-        # Ciclos de clock por operação (baseado na FSM)
-        self.hw_ciclos = {
-            'soma': 6,        # IDLE -> LOAD_A -> LOAD_B -> EXEC -> WRITE -> DONE
-            'subtracao': 6,   # IDLE -> LOAD_A -> LOAD_B -> EXEC -> WRITE -> DONE
-            'produto_escalar': 9  # IDLE -> LOAD_A -> LOAD_B -> DOT0 -> DOT1 -> DOT2 -> DOT3 -> WRITE -> DONE
-        }
+        # Ciclos de clock por operação, obtidos simulando a FSM
+        self.ciclos_fsm = medir_ciclos_fsm() if ciclos_fsm is None else ciclos_fsm
+        self.hw_ciclos = dict(self.ciclos_fsm['operacao'])
         
         # Tempo por operação em hardware (ns)
         self.hw_tempo_ns = {
@@ -49,12 +310,27 @@ class AnalisadorDesempenho:
             for op, tempo in self.hw_tempo_ns.items()
         }
         
-        # Dados do SOFTWARE (Python - medidos)
-        self.sw_tempo_us = {
-            'soma': 2.365,
-            'subtracao': 2.268,
-            'produto_escalar': 1.469
-        }
+        # Dados do SOFTWARE (medidos pela suíte de benchmark)
+        if resultados_sw is not None:
+            self.sw_tempo_us = carregar_tempos_sw(resultados_sw, backend_sw)
+            self.sw_origem = f"{resultados_sw} (backend {backend_sw})"
+        else:
+            self.sw_tempo_us = dict(SW_TEMPO_US_REFERENCIA)
+            self.sw_origem = "valores de referência da v2.0 (backend escalar)"
+        
+        # Tempo por operação em função do tamanho do lote; sem medidas por
+        # tamanho, o lote é uma sequência de chamadas do backend acima
+        self.sw_curvas = None if resultados_sw is None else carregar_curvas_sw(resultados_sw, backend_lote)
+        if self.sw_curvas is not None:
+            self.sw_origem_lote = f"{resultados_sw} (backend {backend_lote}, por tamanho de lote)"
+        else:
+            self.sw_origem_lote = f"{self.sw_origem}, uma chamada por operação"
+        
+        # Eixos das curvas de escalonamento
+        self.tamanhos_lote = np.asarray(
+            TAMANHOS_LOTE_PADRAO if tamanhos_lote is None else tamanhos_lote, dtype=np.float64)
+        self.frequencias_mhz = np.asarray(
+            FREQUENCIAS_MHZ_PADRAO if frequencias_mhz is None else frequencias_mhz, dtype=np.float64)
         
         # Recursos utilizados
         self.hw_recursos = {
@@ -117,6 +393,186 @@ class AnalisadorDesempenho:
         
         return eficiencia
     
+    def ciclos_lote(self, op: str, n: np.ndarray) -> np.ndarray:
+        """
+        Ciclos da FSM para executar lotes de n operações em rajadas de até
+        PARES_POR_RAJADA pares.
+        
+        Args:
+            op: Nome da operação
+            n: Tamanhos de lote
+            
+        Returns:
+            Ciclos de computação por lote (sem a transferência pela porta do host)
+        """
+        rajada = np.asarray(self.ciclos_fsm['rajada'][op], dtype=np.float64)
+        completas, resto = np.divmod(np.rint(n).astype(np.int64), PARES_POR_RAJADA)
+        return completas * rajada[PARES_POR_RAJADA] + rajada[resto]
+    
+    def tempo_sw_lote_us(self, op: str, n: np.ndarray) -> np.ndarray:
+        """
+        Tempo de software por operação em lotes de n operações.
+        
+        Interpola (em log n) as medidas por tamanho de lote da suíte; fora
+        da faixa medida usa o tamanho mais próximo. Sem essas medidas, o
+        tempo por operação é constante (self.sw_tempo_us).
+        
+        Args:
+            op: Nome da operação
+            n: Tamanhos de lote
+            
+        Returns:
+            Tempo por operação (µs) para cada tamanho
+        """
+        n = np.asarray(n, dtype=np.float64)
+        if self.sw_curvas is None:
+            return np.full(n.shape, self.sw_tempo_us[op])
+        curva = self.sw_curvas[op]
+        return np.interp(np.log(n), np.log(curva['tamanhos']), curva['tempo_us'])
+    
+    def calcular_escalonamento(self, tamanhos_lote: Optional[np.ndarray] = None,
+                               frequencias_mhz: Optional[np.ndarray] = None
+                               ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Calcula latência, throughput e eficiência energética para todas as
+        combinações de tamanho de lote e frequência de clock.
+        
+        O hardware executa o lote em rajadas de até PARES_POR_RAJADA pares,
+        com os ciclos de cada rajada obtidos da simulação da FSM; o software
+        usa o tempo por operação medido para cada tamanho de lote
+        (tempo_sw_lote_us).
+        
+        Args:
+            tamanhos_lote: Números de operações (padrão: self.tamanhos_lote)
+            frequencias_mhz: Frequências de clock (padrão: self.frequencias_mhz)
+            
+        Returns:
+            Dicionário operação -> métricas. As métricas de hardware têm
+            formato (len(frequencias_mhz), len(tamanhos_lote)) e as de
+            software formato (len(tamanhos_lote),)
+        """
+        n = np.asarray(self.tamanhos_lote if tamanhos_lote is None else tamanhos_lote,
+                       dtype=np.float64)
+        f = np.asarray(self.frequencias_mhz if frequencias_mhz is None else frequencias_mhz,
+                       dtype=np.float64)
+        
+        escalonamento = {}
+        for op in self.sw_tempo_us.keys():
+            # Ciclos / MHz = µs
+            latencia_hw_us = self.ciclos_lote(op, n)[np.newaxis, :] / f[:, np.newaxis]
+            latencia_sw_us = n * self.tempo_sw_lote_us(op, n)
+            energia_hw_j = (self.hw_potencia_mw / 1000) * latencia_hw_us / 1e6
+            energia_sw_j = self.sw_potencia_w * latencia_sw_us / 1e6
+            escalonamento[op] = {
+                'latencia_hw_us': latencia_hw_us,
+                'latencia_sw_us': latencia_sw_us,
+                'throughput_hw_ops': n / latencia_hw_us * 1e6,
+                'throughput_sw_ops': n / latencia_sw_us * 1e6,
+                'eficiencia_hw_ops_j': n / energia_hw_j,
+                'eficiencia_sw_ops_j': n / energia_sw_j,
+                'speedup': latencia_sw_us[np.newaxis, :] / latencia_hw_us,
+            }
+        return escalonamento
+    
+    def comparar_variantes_dot(self, contagem: int = PARES_POR_RAJADA) -> Dict[str, Dict[str, float]]:
+        """
+        Compara as variantes do datapath do produto escalar (generics
+        ARVORE_SOMA / ARVORE_PIPELINE) em ciclos e Fmax estimado.
+        
+        Args:
+            contagem: Pares por rajada usados para os ciclos por operação
+            
+        Returns:
+            Dicionário variante -> métricas (ciclos em operação única e em
+            rajada, Fmax estimado e relativo ao serial, latência e throughput
+            na frequência operacional, limitada ao Fmax da variante, e no
+            Fmax estimado)
+        """
+        if contagem == self.ciclos_fsm['contagem']:
+            unica, rajada = self.ciclos_fsm['dot_unica'], self.ciclos_fsm['dot_rajada']
+        else:
+            ciclos = medir_ciclos_fsm(contagem)
+            unica, rajada = ciclos['dot_unica'], ciclos['dot_rajada']
+        variantes = {}
+        for variante in VARIANTES_DOT:
+            ciclos_unica = unica[variante]
+            ciclos_rajada = rajada[variante] / contagem
+            fmax = estimar_fmax_dot(variante)
+            # A variante não roda acima do próprio Fmax
+            frequencia = min(self.hw_fmax_restricted, fmax)
+            variantes[variante] = {
+                'ciclos_unica': ciclos_unica,
+                'ciclos_rajada': ciclos_rajada,
+                'fmax_estimado_mhz': fmax,
+                'fmax_relativo': fmax / FMAX_MEDIDO_MHZ,
+                'frequencia_mhz': frequencia,
+                'latencia_ns': ciclos_unica * 1000 / frequencia,
+                'latencia_fmax_ns': ciclos_unica * 1000 / fmax,
+                'throughput_rajada_mops': frequencia / ciclos_rajada,
+                'throughput_rajada_fmax_mops': fmax / ciclos_rajada,
+            }
+        return variantes
+    
+    def explorar_espaco_projeto(self, espaco: Optional[Dict[str, List]] = None) -> Dict[str, np.ndarray]:
+        """
+        Avalia configurações alternativas do datapath (lanes, largura,
+        multiplicadores, pipeline, rajada e clock) com a potência deste
+        analisador como referência de calibração.
+        
+        Args:
+            espaco: Eixos a sobrescrever em exploracao_projeto.ESPACO_PADRAO
+            
+        Returns:
+            Parâmetros e métricas por configuração, com a fronteira de Pareto
+        """
+        from exploracao_projeto import explorar
+        return explorar(espaco, potencia_referencia_mw=self.hw_potencia_mw)
+    
+    def entradas(self) -> Dict[str, Any]:
+        """
+        Dados dos quais todas as métricas derivam (base do hash do cache).
+        
+        Returns:
+            Dicionário serializável em JSON
+        """
+        return {
+            'hw_fmax_mhz': self.hw_fmax,
+            'hw_frequencia_mhz': self.hw_fmax_restricted,
+            'ciclos_fsm': self.ciclos_fsm,
+            'sw_tempo_us': self.sw_tempo_us,
+            'sw_origem': self.sw_origem,
+            'sw_curvas': self.sw_curvas,
+            'sw_origem_lote': self.sw_origem_lote,
+            'pares_por_rajada': PARES_POR_RAJADA,
+            'tamanhos_lote': self.tamanhos_lote.tolist(),
+            'frequencias_mhz': self.frequencias_mhz.tolist(),
+            'hw_recursos': self.hw_recursos,
+            'hw_potencia_mw': self.hw_potencia_mw,
+            'sw_potencia_w': self.sw_potencia_w,
+            'fmax_medido_mhz': FMAX_MEDIDO_MHZ,
+            'atrasos_ns': ATRASOS_NS,
+        }
+    
+    def resumo(self) -> Dict[str, Any]:
+        """
+        Todas as métricas numéricas da análise, sem texto nem gráficos.
+        
+        Returns:
+            Dicionário serializável em JSON com as entradas, speedup,
+            throughput, eficiência, escalonamento e variantes do produto escalar
+        """
+        escalonamento = self.calcular_escalonamento()
+        return {
+            'entradas': self.entradas(),
+            'hw_tempo_us': self.hw_tempo_us,
+            'speedup': self.calcular_speedup(),
+            'throughput_ops': self.calcular_throughput(),
+            'eficiencia_ops_j': self.calcular_eficiencia_energetica(),
+            'escalonamento': {op: {nome: valores.tolist() for nome, valores in metricas.items()}
+                              for op, metricas in escalonamento.items()},
+            'variantes_dot': self.comparar_variantes_dot(),
+        }
+    
     def gerar_relatorio_texto(self) -> str:
         """
         Gera relatório textual completo da análise.
@@ -149,6 +605,7 @@ class AnalisadorDesempenho:
         relatorio.append("")
         relatorio.append("SOFTWARE (Python 3.11 + NumPy):")
         relatorio.append(f"  • Processador: CPU x86_64 genérico")
+        relatorio.append(f"  • Tempos medidos: {self.sw_origem}")
         relatorio.append(f"  • Potência típica: {self.sw_potencia_w} W")
         relatorio.append("")
         
@@ -218,8 +675,50 @@ class AnalisadorDesempenho:
             )
         relatorio.append("")
         
-        # Seção 6: Conclusões
-        relatorio.append("6. CONCLUSÕES")
+        # Seção 6: Escalonamento com a frequência de clock
+        escalonamento = self.calcular_escalonamento()
+        relatorio.append("6. SPEEDUP POR TAMANHO DE LOTE E FREQUÊNCIA DE CLOCK")
+        relatorio.append("-" * 80)
+        relatorio.append("")
+        relatorio.append(f"Hardware: rajadas de até {PARES_POR_RAJADA} pares (ciclos simulados da FSM)")
+        relatorio.append(f"Software: {self.sw_origem_lote}")
+        relatorio.append("")
+        cabecalho = f"{'':<20} " + " ".join(f"{int(n):>9,}" for n in self.tamanhos_lote)
+        for op in ['soma', 'subtracao', 'produto_escalar']:
+            relatorio.append(f"{op.upper()} (speedup por pares no lote)")
+            relatorio.append(cabecalho)
+            for fr, valores in zip(self.frequencias_mhz, escalonamento[op]['speedup']):
+                relatorio.append(f"{fr:>16.0f} MHz " + " ".join(f"{v:>8.1f}x" for v in valores))
+            relatorio.append("")
+        
+        # Seção 7: Variantes do produto escalar
+        variantes = self.comparar_variantes_dot()
+        relatorio.append("7. VARIANTES DO PRODUTO ESCALAR (ÁRVORE DE SOMADORES)")
+        relatorio.append("-" * 80)
+        relatorio.append("")
+        relatorio.append(f"{'Variante':<18} {'Ciclos':>7} {'Ciclos/op':>10} {'Fmax est.':>11} "
+                         f"{'Lat. @Fop':>11} {'Lat. @Fmax':>11} {'Mops @Fmax':>11}")
+        relatorio.append(f"{'':<18} {'(única)':>7} {'(rajada)':>10} {'(MHz)':>11} "
+                         f"{'(ns)':>11} {'(ns)':>11} {'(rajada)':>11}")
+        relatorio.append("-" * 80)
+        for variante, m in variantes.items():
+            relatorio.append(
+                f"{variante:<18} {m['ciclos_unica']:>7} {m['ciclos_rajada']:>10.2f} "
+                f"{m['fmax_estimado_mhz']:>11.1f} {m['latencia_ns']:>11.1f} "
+                f"{m['latencia_fmax_ns']:>11.1f} {m['throughput_rajada_fmax_mops']:>11.1f}"
+            )
+        relatorio.append("")
+        relatorio.append(f"Fmax estimado pelo modelo ATRASOS_NS calibrado para o serial reproduzir "
+                         f"{FMAX_MEDIDO_MHZ:.2f} MHz")
+        relatorio.append("(seção 1): " + ", ".join(
+            f"{variante} {m['fmax_relativo']:.2f}x" for variante, m in variantes.items()
+        ) + " do serial;")
+        relatorio.append(f"rajada de {PARES_POR_RAJADA} pares; Fop = {self.hw_fmax_restricted:.0f} MHz "
+                         f"(ou o Fmax da variante, se menor).")
+        relatorio.append("")
+        
+        # Seção 8: Conclusões
+        relatorio.append("8. CONCLUSÕES")
         relatorio.append("-" * 80)
         relatorio.append("")
         relatorio.append("A implementação em hardware (FPGA) apresenta vantagens significativas:")
@@ -241,138 +740,187 @@ class AnalisadorDesempenho:
         
         return "\n".join(relatorio)
     
-    def gerar_graficos(self):
-        """Gera gráficos comparativos de desempenho."""
-        speedup = self.calcular_speedup()
-        throughput = self.calcular_throughput()
-        eficiencia = self.calcular_eficiencia_energetica()
+    def gerar_graficos(self, caminho: str = ARQUIVO_GRAFICOS, dpi: int = 300):
+        """
+        Gera gráficos comparativos de desempenho.
         
-        # Criar figura com 4 subplots
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-        fig.suptitle('Análise Comparativa: Hardware vs Software\nProcessador Vetorial de 4 Elementos', 
-                     fontsize=16, fontweight='bold')
-        
-        operacoes = ['SOMA', 'SUBTRAÇÃO', 'PRODUTO\nESCALAR']
-        operacoes_keys = ['soma', 'subtracao', 'produto_escalar']
-        cores_hw = '#2E86AB'
-        cores_sw = '#A23B72'
-        
-        # Gráfico 1: Latência
-        ax1.set_title('Latência por Operação', fontweight='bold')
-        x = np.arange(len(operacoes))
-        width = 0.35
-        
-        latencias_hw = [self.hw_tempo_us[op] for op in operacoes_keys]
-        latencias_sw = [self.sw_tempo_us[op] for op in operacoes_keys]
-        
-        bars1 = ax1.bar(x - width/2, latencias_hw, width, label='Hardware (FPGA)', color=cores_hw)
-        bars2 = ax1.bar(x + width/2, latencias_sw, width, label='Software (Python)', color=cores_sw)
-        
-        ax1.set_ylabel('Tempo (µs)', fontweight='bold')
-        ax1.set_xlabel('Operação', fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(operacoes)
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # Adicionar valores nas barras
-        for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.3f}',
-                        ha='center', va='bottom', fontsize=9)
-        
-        # Gráfico 2: Speedup
-        ax2.set_title('Speedup (Aceleração)', fontweight='bold')
-        speedup_valores = [speedup[op] for op in operacoes_keys]
-        bars = ax2.bar(operacoes, speedup_valores, color=cores_hw, alpha=0.8)
-        ax2.axhline(y=1, color='red', linestyle='--', linewidth=2, label='Baseline (SW)')
-        ax2.set_ylabel('Speedup (x)', fontweight='bold')
-        ax2.set_xlabel('Operação', fontweight='bold')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3, axis='y')
-        
-        # Adicionar valores nas barras
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}x',
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        # Gráfico 3: Throughput
-        ax3.set_title('Throughput (Operações por Segundo)', fontweight='bold')
-        x = np.arange(len(operacoes))
-        
-        throughput_hw = [throughput['hardware'][op] / 1e6 for op in operacoes_keys]
-        throughput_sw = [throughput['software'][op] / 1e6 for op in operacoes_keys]
-        
-        bars1 = ax3.bar(x - width/2, throughput_hw, width, label='Hardware (FPGA)', color=cores_hw)
-        bars2 = ax3.bar(x + width/2, throughput_sw, width, label='Software (Python)', color=cores_sw)
-        
-        ax3.set_ylabel('Throughput (Mops/s)', fontweight='bold')
-        ax3.set_xlabel('Operação', fontweight='bold')
-        ax3.set_xticks(x)
-        ax3.set_xticklabels(operacoes)
-        ax3.legend()
-        ax3.grid(True, alpha=0.3)
-        
-        # Adicionar valores nas barras
-        for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax3.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
-                        ha='center', va='bottom', fontsize=9)
-        
-        # Gráfico 4: Eficiência Energética
-        ax4.set_title('Eficiência Energética (Operações por Joule)', fontweight='bold')
-        
-        eficiencia_hw = [eficiencia['hardware'][op] / 1e9 for op in operacoes_keys]
-        eficiencia_sw = [eficiencia['software'][op] / 1e3 for op in operacoes_keys]
-        
-        # Usar escala logarítmica devido à grande diferença
-        ax4.set_yscale('log')
-        
-        bars1 = ax4.bar(x - width/2, eficiencia_hw, width, label='Hardware (Gops/J)', color=cores_hw)
-        bars2 = ax4.bar(x + width/2, eficiencia_sw, width, label='Software (Kops/J)', color=cores_sw)
-        
-        ax4.set_ylabel('Eficiência (escala log)', fontweight='bold')
-        ax4.set_xlabel('Operação', fontweight='bold')
-        ax4.set_xticks(x)
-        ax4.set_xticklabels(operacoes)
-        ax4.legend()
-        ax4.grid(True, alpha=0.3, which='both')
-        
-        plt.tight_layout()
-        plt.savefig('/home/ubuntu/comparativo_hw_sw_graficos.png', dpi=300, bbox_inches='tight')
-        print("Gráficos salvos em: comparativo_hw_sw_graficos.png")
+        Args:
+            caminho: Arquivo de imagem
+            dpi: Resolução da imagem
+            
+        Returns:
+            Figura do matplotlib, já fechada após salvar a imagem
+        """
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
         
+        with plt.style.context(ESTILO_GRAFICOS), plt.rc_context(PARAMETROS_GRAFICOS):
+            eficiencia = self.calcular_eficiencia_energetica()
+            escalonamento = self.calcular_escalonamento()
+
+            # Criar figura com 4 subplots
+            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            fig.suptitle('Análise Comparativa: Hardware vs Software\nProcessador Vetorial de 4 Elementos', 
+                         fontsize=16, fontweight='bold')
+
+            operacoes = ['SOMA', 'SUBTRAÇÃO', 'PRODUTO\nESCALAR']
+            operacoes_keys = ['soma', 'subtracao', 'produto_escalar']
+            cores_hw = '#2E86AB'
+            cores_sw = '#A23B72'
+
+            # Gráfico 1: Latência
+            ax1.set_title('Latência por Operação', fontweight='bold')
+            x = np.arange(len(operacoes))
+            width = 0.35
+
+            latencias_hw = [self.hw_tempo_us[op] for op in operacoes_keys]
+            latencias_sw = [self.sw_tempo_us[op] for op in operacoes_keys]
+
+            bars1 = ax1.bar(x - width/2, latencias_hw, width, label='Hardware (FPGA)', color=cores_hw)
+            bars2 = ax1.bar(x + width/2, latencias_sw, width, label='Software (Python)', color=cores_sw)
+
+            ax1.set_ylabel('Tempo (µs)', fontweight='bold')
+            ax1.set_xlabel('Operação', fontweight='bold')
+            ax1.set_xticks(x)
+            ax1.set_xticklabels(operacoes)
+            ax1.legend()
+            ax1.grid(True, alpha=0.3)
+
+            # Adicionar valores nas barras
+            for bars in [bars1, bars2]:
+                for bar in bars:
+                    height = bar.get_height()
+                    ax1.text(bar.get_x() + bar.get_width()/2., height,
+                            f'{height:.3f}',
+                            ha='center', va='bottom', fontsize=9)
+
+            # Gráfico 2: Speedup por tamanho de lote e frequência
+            ax2.set_title('Speedup por Tamanho de Lote', fontweight='bold')
+            n = self.tamanhos_lote
+            cores_freq = plt.cm.viridis(np.linspace(0, 0.85, len(self.frequencias_mhz)))
+            estilos = {'soma': '-', 'subtracao': ':', 'produto_escalar': '--'}
+            for op in operacoes_keys:
+                for fr, cor, valores in zip(self.frequencias_mhz, cores_freq, escalonamento[op]['speedup']):
+                    ax2.plot(n, valores, estilos[op], color=cor, marker='o', markersize=3,
+                             label=f'{op} @ {fr:.0f} MHz')
+            ax2.axhline(y=1, color='red', linestyle='--', linewidth=2, label='Baseline (SW)')
+            ax2.set_xscale('log')
+            ax2.set_yscale('log')
+            ax2.set_ylabel('Speedup (x)', fontweight='bold')
+            ax2.set_xlabel('Pares no lote', fontweight='bold')
+            ax2.legend(fontsize=7, ncol=2)
+            ax2.grid(True, alpha=0.3, which='both')
+
+            # Gráfico 3: Throughput do produto escalar por tamanho de lote
+            ax3.set_title('Throughput do Produto Escalar por Tamanho de Lote', fontweight='bold')
+            dot = escalonamento['produto_escalar']
+            for fr, cor, valores in zip(self.frequencias_mhz, cores_freq, dot['throughput_hw_ops']):
+                ax3.plot(n, valores / 1e6, '-', color=cor, marker='o', markersize=3,
+                         label=f'Hardware @ {fr:.0f} MHz')
+            ax3.plot(n, dot['throughput_sw_ops'] / 1e6, '--', color=cores_sw, marker='s', markersize=3,
+                     label='Software')
+            ax3.set_xscale('log')
+            ax3.set_yscale('log')
+            ax3.set_ylabel('Throughput (Mops/s)', fontweight='bold')
+            ax3.set_xlabel('Pares no lote', fontweight='bold')
+            ax3.legend()
+            ax3.grid(True, alpha=0.3, which='both')
+
+            # Gráfico 4: Eficiência Energética
+            ax4.set_title('Eficiência Energética (Operações por Joule)', fontweight='bold')
+
+            eficiencia_hw = [eficiencia['hardware'][op] / 1e9 for op in operacoes_keys]
+            eficiencia_sw = [eficiencia['software'][op] / 1e3 for op in operacoes_keys]
+
+            # Usar escala logarítmica devido à grande diferença
+            ax4.set_yscale('log')
+
+            bars1 = ax4.bar(x - width/2, eficiencia_hw, width, label='Hardware (Gops/J)', color=cores_hw)
+            bars2 = ax4.bar(x + width/2, eficiencia_sw, width, label='Software (Kops/J)', color=cores_sw)
+
+            ax4.set_ylabel('Eficiência (escala log)', fontweight='bold')
+            ax4.set_xlabel('Operação', fontweight='bold')
+            ax4.set_xticks(x)
+            ax4.set_xticklabels(operacoes)
+            ax4.legend()
+            ax4.grid(True, alpha=0.3, which='both')
+
+            plt.tight_layout()
+            plt.savefig(caminho, dpi=dpi, bbox_inches='tight')
+            plt.close(fig)
+
         return fig
 
 
 def main():
     """Função principal."""
-    print("Gerando análise comparativa Hardware vs Software...")
-    print()
+    parser = argparse.ArgumentParser(description="Análise comparativa Hardware vs Software")
+    parser.add_argument('--resultados-sw', help="JSON gerado por suite_benchmark.py --saida")
+    parser.add_argument('--backend-sw', default='escalar', help="Backend de software comparado")
+    parser.add_argument('--backend-lote', default='lote',
+                        help="Backend das medidas por tamanho de lote (suite_benchmark.py --tamanhos-lote)")
+    parser.add_argument('--frequencias', type=float, nargs='+',
+                        help="Frequências de clock (MHz) das curvas de escalonamento")
+    parser.add_argument('--tamanhos-lote', type=int, nargs='+',
+                        help="Pares por lote nas curvas de escalonamento (padrão: 1 a 10^6)")
+    parser.add_argument('--saida-dir', default='.', help="Diretório do relatório, do resumo e dos gráficos")
+    parser.add_argument('--relatorio', help=f"Relatório em texto (padrão: <saida-dir>/{ARQUIVO_RELATORIO})")
+    parser.add_argument('--resumo', help=f"Resumo numérico em JSON (padrão: <saida-dir>/{ARQUIVO_RESUMO})")
+    parser.add_argument('--graficos', help=f"Imagem dos gráficos (padrão: <saida-dir>/{ARQUIVO_GRAFICOS})")
+    parser.add_argument('--dpi', type=int, default=300, help="Resolução dos gráficos")
+    parser.add_argument('--sem-graficos', action='store_true', help="Apenas números (não importa o matplotlib)")
+    parser.add_argument('--formato', choices=['texto', 'json'], default='texto',
+                        help="Saída no terminal: relatório ou resumo JSON")
+    parser.add_argument('--cache', help=f"Manifesto do cache (padrão: <saida-dir>/{ARQUIVO_CACHE})")
+    parser.add_argument('--sem-cache', action='store_true', help="Refaz tudo e não grava o manifesto")
+    args = parser.parse_args()
     
-    # Criar analisador
-    analisador = AnalisadorDesempenho()
+    os.makedirs(args.saida_dir, exist_ok=True)
+    caminho_relatorio = args.relatorio or os.path.join(args.saida_dir, ARQUIVO_RELATORIO)
+    caminho_resumo = args.resumo or os.path.join(args.saida_dir, ARQUIVO_RESUMO)
+    caminho_graficos = args.graficos or os.path.join(args.saida_dir, ARQUIVO_GRAFICOS)
+    cache = CacheSaidas(None if args.sem_cache else (args.cache or os.path.join(args.saida_dir, ARQUIVO_CACHE)))
     
-    # Gerar relatório textual
-    relatorio = analisador.gerar_relatorio_texto()
-    print(relatorio)
+    # Mensagens de progresso vão para stderr com --formato json
+    log = (lambda *a: print(*a, file=sys.stderr)) if args.formato == 'json' else print
+    log("Gerando análise comparativa Hardware vs Software...")
+    log()
     
-    # Salvar relatório
-    with open('/home/ubuntu/comparativo_hw_sw_relatorio.txt', 'w', encoding='utf-8') as f:
-        f.write(relatorio)
-    print("\nRelatório salvo em: comparativo_hw_sw_relatorio.txt")
+    # Criar analisador (ciclos da FSM do cache, se o simulador não mudou)
+    analisador = AnalisadorDesempenho(args.resultados_sw, args.backend_sw,
+                                      tamanhos_lote=args.tamanhos_lote,
+                                      frequencias_mhz=args.frequencias,
+                                      ciclos_fsm=cache.ciclos_fsm(),
+                                      backend_lote=args.backend_lote)
+    # O código deste arquivo também é entrada: mudar o formato refaz as saídas
+    chave = hash_conteudo(analisador.entradas(), hash_arquivo(__file__))
+    
+    resumo = analisador.resumo()
+    relatorio = analisador.gerar_relatorio_texto()
+    if args.formato == 'json':
+        print(json.dumps(resumo, indent=2))
+    else:
+        print(relatorio)
+        print()
     
-    # Gerar gráficos
-    print("\nGerando gráficos...")
-    analisador.gerar_graficos()
+    saidas = [(caminho_relatorio, chave, lambda c: escrever_texto(c, relatorio)),
+              (caminho_resumo, chave, lambda c: escrever_texto(c, json.dumps(resumo, indent=2)))]
+    if not args.sem_graficos:
+        saidas.append((caminho_graficos, hash_conteudo(chave, args.dpi),
+                       lambda c: analisador.gerar_graficos(c, args.dpi)))
+    for caminho, chave_saida, gerar in saidas:
+        if cache.atualizado(caminho, chave_saida):
+            log(f"Inalterado (entradas com o mesmo hash): {caminho}")
+            continue
+        diretorio = os.path.dirname(caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        gerar(caminho)
+        cache.registrar(caminho, chave_saida)
+        log(f"Salvo em: {caminho}")
     
-    print("\n✓ Análise completa!")
+    log("\n✓ Análise completa!")
 
 
 if __name__ == "__main__":
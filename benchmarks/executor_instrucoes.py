@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Executor de Fila de Instruções sobre a BRAM
+Arquivo: executor_instrucoes.py
+Descrição: Formato de instrução do host (LOAD/ADD/SUB/DOT/STORE com
+           endereços da BRAM), executor sobre um modelo NumPy da
+           BRAMDualPort de 32 palavras com cargas e leituras em bloco (DMA),
+           agrupamento de instruções independentes por análise de
+           dependências de endereço e relatório dos ciclos da FSM
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Instruções (uma por linha no formato texto; '#' inicia um comentário):
+
+    LOAD  destino, valor       # host escreve a palavra na BRAM (1 ciclo)
+    ADD   destino, fonte_a, fonte_b
+    SUB   destino, fonte_a, fonte_b
+    DOT   destino, fonte_a, fonte_b
+    STORE fonte                # host lê a palavra da BRAM (1 ciclo)
+
+ADD/SUB/DOT têm a semântica de soma_swar/subtracao_swar/produto_escalar_swar
+e são emitidas ao FPGA como rajadas (o modo de operação única usa endereços
+fixos); os STOREs produzem as palavras de saída na ordem do programa.
+
+O executor renomeia as escritas (como a renomeação de registradores): cada
+LOAD/ADD/SUB/DOT produz uma versão nova do endereço de destino e cada fonte
+aponta para a última versão escrita antes dela, o que elimina as falsas
+dependências (WAR e WAW) entre instruções que reutilizam endereços. Os LOADs
+viram uma única escrita vetorizada, os STOREs e o conteúdo final da BRAM uma
+única leitura, e as instruções aritméticas executam em níveis de dependência
+verdadeira (RAW), cada nível agrupado por opcode numa chamada dos kernels
+SWAR, com o mesmo resultado da execução em ordem de programa.
+"""
+
+import argparse
+import functools
+import re
+import time
+import numpy as np
+from typing import Dict, Iterable, Tuple, Union
+
+from processador_vetorial_sw import (
+    PALAVRA_DTYPE,
+    ProcessadorVetorialEscalar,
+    empacotar,
+    produto_escalar_swar,
+    soma_swar,
+    subtracao_swar,
+)
+from simulador_fsmd import (
+    BRAM_PALAVRAS,
+    OP_PRODUTO_ESCALAR,
+    OP_SOMA,
+    OP_SUBTRACAO,
+    VARIANTES_DOT,
+    SimuladorFSMD,
+    ciclos_por_operacao,
+)
+
+# Operações aritméticas usam o código de op_sel da FSM
+OP_LOAD = 0b100
+OP_STORE = 0b101
+
+OPCODES = {
+    'LOAD': OP_LOAD,
+    'ADD': OP_SOMA,
+    'SUB': OP_SUBTRACAO,
+    'DOT': OP_PRODUTO_ESCALAR,
+    'STORE': OP_STORE,
+}
+
+NOMES_OPERACOES = {
+    OP_SOMA: 'soma',
+    OP_SUBTRACAO: 'subtracao',
+    OP_PRODUTO_ESCALAR: 'produto_escalar',
+}
+
+KERNELS = {
+    OP_SOMA: soma_swar,
+    OP_SUBTRACAO: subtracao_swar,
+    OP_PRODUTO_ESCALAR: lambda a, b: produto_escalar_swar(a, b).view(np.uint32),
+}
+
+INSTRUCAO_DTYPE = np.dtype([
+    ('opcode', np.uint8),
+    ('destino', np.uint8),
+    ('fonte_a', np.uint8),
+    ('fonte_b', np.uint8),
+    ('valor', PALAVRA_DTYPE),  # palavra do LOAD
+])
+
+Programa = Union[np.ndarray, str, Iterable[str]]
+
+# Abaixo desta média de instruções aritméticas por nível, o custo fixo de
+# cada chamada dos kernels supera o laço escalar em ordem de programa
+LARGURA_MINIMA_LOTE = 32
+
+# Instruções iniciais analisadas para escolher o modo: os níveis de um prefixo
+# são exatos (dependências só apontam para trás), e num programa estreito a
+# análise completa custaria mais que a própria execução sequencial
+AMOSTRA_MODO = 4096
+
+
+def montar(linhas: Union[str, Iterable[str]]) -> np.ndarray:
+    """
+    Converte um programa em texto no array de instruções.
+
+    Args:
+        linhas: Texto do programa ou sequência de linhas
+
+    Returns:
+        Array (K,) de INSTRUCAO_DTYPE
+    """
+    if isinstance(linhas, str):
+        linhas = linhas.splitlines()
+    instrucoes = []
+    for numero, linha in enumerate(linhas, start=1):
+        campos = re.split(r'[\s,]+', linha.split('#', 1)[0].strip())
+        if campos == ['']:
+            continue
+        mnemonico, argumentos = campos[0].upper(), [int(campo, 0) for campo in campos[1:]]
+        esperados = {'LOAD': 2, 'STORE': 1}.get(mnemonico, 3)
+        if mnemonico not in OPCODES or len(argumentos) != esperados:
+            raise ValueError(f"Linha {numero}: instrução inválida: {linha.strip()!r}")
+        enderecos = argumentos[:1] if mnemonico == 'LOAD' else argumentos
+        if any(not 0 <= endereco < BRAM_PALAVRAS for endereco in enderecos):
+            raise ValueError(f"Linha {numero}: endereço fora da BRAM: {linha.strip()!r}")
+        if mnemonico == 'LOAD':
+            instrucoes.append((OP_LOAD, argumentos[0], 0, 0, argumentos[1] & 0xFFFFFFFF))
+        elif mnemonico == 'STORE':
+            instrucoes.append((OP_STORE, 0, argumentos[0], 0, 0))
+        else:
+            instrucoes.append((OPCODES[mnemonico], *argumentos, 0))
+    return np.array(instrucoes, dtype=INSTRUCAO_DTYPE)
+
+
+def _como_programa(programa: Programa) -> np.ndarray:
+    """Aceita um array de INSTRUCAO_DTYPE ou o texto do programa."""
+    if isinstance(programa, np.ndarray) and programa.dtype == INSTRUCAO_DTYPE:
+        return programa
+    return montar(programa)
+
+
+def renomear(programa: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve cada leitura para a versão do endereço que ela observa.
+
+    As versões são numeradas como 0..31 (conteúdo inicial da BRAM) e
+    32 + i (valor escrito pela instrução i).
+
+    Args:
+        programa: Array (K,) de INSTRUCAO_DTYPE
+
+    Returns:
+        Tupla (versão lida por fonte_a, por fonte_b, versão final de cada
+        endereço da BRAM)
+    """
+    n = len(programa)
+    escritores = np.flatnonzero(programa['opcode'] != OP_STORE)
+    # Chave (endereço, posição): a última escrita antes de uma leitura é a
+    # maior chave estritamente menor que a chave da leitura. A ordenação
+    # estável por endereço (uint8, radix sort) já deixa as chaves ordenadas
+    escritores = escritores[np.argsort(programa['destino'][escritores], kind='stable')]
+    chaves = programa['destino'][escritores].astype(np.int64) * (n + 1) + escritores
+
+    def versao(enderecos: np.ndarray, posicoes: np.ndarray) -> np.ndarray:
+        ordem = np.argsort(enderecos, kind='stable')
+        enderecos = enderecos[ordem].astype(np.int64)
+        k = np.searchsorted(chaves, enderecos * (n + 1) + posicoes[ordem]) - 1
+        k_valido = np.maximum(k, 0)
+        escrito = k >= 0
+        if len(chaves):
+            escrito &= chaves[k_valido] // (n + 1) == enderecos
+        resultado = np.empty(len(ordem), dtype=np.int64)
+        resultado[ordem] = np.where(escrito, BRAM_PALAVRAS + escritores[k_valido] if len(chaves) else 0,
+                                    enderecos)
+        return resultado
+
+    posicoes = np.arange(n)
+    return (versao(programa['fonte_a'], posicoes), versao(programa['fonte_b'], posicoes),
+            versao(np.arange(BRAM_PALAVRAS, dtype=np.uint8), np.full(BRAM_PALAVRAS, n)))
+
+
+def niveis_dependencia(programa: np.ndarray, versao_a: np.ndarray, versao_b: np.ndarray,
+                       relaxacoes: int = 8) -> np.ndarray:
+    """
+    Calcula o nível (lote) de cada instrução aritmética: 1 + o maior nível
+    entre as instruções que escreveram as versões lidas (0 para versões
+    iniciais e LOADs).
+
+    Programas rasos (o caso típico: carregar, calcular, ler) convergem em
+    poucas relaxações vetorizadas sobre todas as instruções; cadeias mais
+    longas que `relaxacoes` são resolvidas por um laço em ordem de programa.
+
+    Args:
+        programa: Array (K,) de INSTRUCAO_DTYPE
+        versao_a: Versões lidas por fonte_a (ver renomear)
+        versao_b: Versões lidas por fonte_b
+        relaxacoes: Iterações vetorizadas antes de recorrer ao laço
+
+    Returns:
+        Array (K,) int32 com o nível de cada instrução (0 para LOAD/STORE)
+    """
+    opcode = programa['opcode']
+    aritmeticas = np.flatnonzero((opcode != OP_LOAD) & (opcode != OP_STORE))
+    fonte_a, fonte_b = versao_a[aritmeticas], versao_b[aritmeticas]
+    nivel = np.zeros(BRAM_PALAVRAS + len(programa), dtype=np.int32)
+    for _ in range(relaxacoes):
+        novo = np.maximum(nivel[fonte_a], nivel[fonte_b]) + 1
+        if np.array_equal(novo, nivel[BRAM_PALAVRAS + aritmeticas]):
+            return nivel[BRAM_PALAVRAS:]
+        nivel[BRAM_PALAVRAS + aritmeticas] = novo
+    lista = nivel.tolist()
+    for i, a, b in zip(aritmeticas.tolist(), fonte_a.tolist(), fonte_b.tolist()):
+        lista[BRAM_PALAVRAS + i] = max(lista[a], lista[b]) + 1
+    return np.array(lista[BRAM_PALAVRAS:], dtype=np.int32)
+
+
+@functools.lru_cache(maxsize=None)
+def _ciclos_rajada(contagem: int, variante_dot: str) -> Dict[str, int]:
+    """Ciclos de uma rajada de `contagem` pares (medidos uma vez no simulador)."""
+    return ciclos_por_operacao(contagem, variante_dot)
+
+
+def rajadas(programa: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Agrupa instruções aritméticas consecutivas em rajadas da FSM.
+
+    Uma rajada continua enquanto o opcode se repete, os três endereços
+    avançam de 1 (módulo 32), a contagem não passa de 32 e nenhuma fonte foi
+    escrita por uma instrução anterior da mesma rajada (no produto escalar o
+    par seguinte é lido antes da escrita do resultado). Como fontes e
+    destino avançam juntos, a distância d = (fonte - destino) mod 32 é
+    constante numa sequência e a primeira fonte já escrita aparece na
+    instrução 32 - d: cada sequência é dividida em rajadas de
+    32 - max(d_a, d_b) instruções.
+
+    Args:
+        programa: Array (K,) de INSTRUCAO_DTYPE
+
+    Returns:
+        Tupla (índice da primeira instrução, contagem) de cada rajada
+    """
+    opcode = programa['opcode']
+    destino, fonte_a, fonte_b = (programa[campo].astype(np.int64) for campo in ('destino', 'fonte_a', 'fonte_b'))
+    aritmetica = (opcode != OP_LOAD) & (opcode != OP_STORE)
+    continua = np.zeros(len(programa), dtype=bool)
+    continua[1:] = (aritmetica[1:] & aritmetica[:-1] & (opcode[1:] == opcode[:-1])
+                    & ((destino[1:] - destino[:-1]) % BRAM_PALAVRAS == 1)
+                    & ((fonte_a[1:] - fonte_a[:-1]) % BRAM_PALAVRAS == 1)
+                    & ((fonte_b[1:] - fonte_b[:-1]) % BRAM_PALAVRAS == 1))
+    sequencias = np.flatnonzero(aritmetica & ~continua)
+    fronteiras = np.append(np.flatnonzero(~continua), len(programa))
+    comprimento = fronteiras[np.searchsorted(fronteiras, sequencias, side='right')] - sequencias
+    distancia = np.maximum((fonte_a[sequencias] - destino[sequencias]) % BRAM_PALAVRAS,
+                           (fonte_b[sequencias] - destino[sequencias]) % BRAM_PALAVRAS)
+    maximo = BRAM_PALAVRAS - distancia
+    # Divide cada sequência em rajadas de até `maximo` instruções
+    n_rajadas = -(-comprimento // maximo)
+    deslocamento = (np.arange(n_rajadas.sum()) - np.repeat(np.cumsum(n_rajadas) - n_rajadas, n_rajadas)
+                    ) * np.repeat(maximo, n_rajadas)
+    inicios = np.repeat(sequencias, n_rajadas) + deslocamento
+    contagens = np.minimum(np.repeat(maximo, n_rajadas), np.repeat(comprimento, n_rajadas) - deslocamento)
+    return inicios, contagens
+
+
+def estimar_ciclos(programa: Programa, variante_dot: str = 'serial') -> Dict[str, int]:
+    """
+    Estima os ciclos que o FPGA gasta executando o programa.
+
+    LOAD e STORE usam a porta do host (1 ciclo, FSM em IDLE). Cada
+    instrução aritmética é uma rajada de 1 par; com rajadas agrupadas, as
+    sequências de rajadas() são emitidas como uma única rajada.
+
+    Args:
+        programa: Array de INSTRUCAO_DTYPE ou texto do programa
+        variante_dot: Datapath do produto escalar (chave de VARIANTES_DOT)
+
+    Returns:
+        Dicionário com ciclos de host, da FSM por instrução e com rajadas
+        agrupadas, e os totais correspondentes
+    """
+    programa = _como_programa(programa)
+    opcode = programa['opcode']
+    host = int(np.count_nonzero((opcode == OP_LOAD) | (opcode == OP_STORE)))
+    unitario = _ciclos_rajada(1, variante_dot)
+    fsm = sum(unitario[nome] * int(np.count_nonzero(opcode == codigo))
+              for codigo, nome in NOMES_OPERACOES.items())
+    inicios, contagens = rajadas(programa)
+    fsm_rajadas = 0
+    for codigo, nome in NOMES_OPERACOES.items():
+        valores, repeticoes = np.unique(contagens[opcode[inicios] == codigo], return_counts=True)
+        fsm_rajadas += sum(_ciclos_rajada(contagem, variante_dot)[nome] * vezes
+                           for contagem, vezes in zip(valores.tolist(), repeticoes.tolist()))
+    return {
+        'ciclos_host': host,
+        'ciclos_fsm': fsm,
+        'ciclos_fsm_rajadas': fsm_rajadas,
+        'rajadas': len(inicios),
+        'ciclos_total': host + fsm,
+        'ciclos_total_rajadas': host + fsm_rajadas,
+    }
+
+
+class ExecutorInstrucoes:
+    """
+    Executor de programas do host sobre um modelo da BRAM de 32 palavras.
+
+    A BRAM persiste entre chamadas de executar(), como no FPGA; cargas e
+    leituras em bloco (DMA) também passam pela porta do host e somam
+    ciclos_dma.
+    """
+
+    def __init__(self, variante_dot: str = 'serial', frequencia_mhz: float = 250.0,
+                 largura_minima_lote: int = LARGURA_MINIMA_LOTE):
+        """
+        Args:
+            variante_dot: Datapath do produto escalar (chave de VARIANTES_DOT)
+            frequencia_mhz: Clock do FPGA usado para converter ciclos em tempo
+            largura_minima_lote: Média mínima de instruções aritméticas por
+                nível para executar em lotes; abaixo dela (cadeias longas de
+                dependências), executa em ordem de programa
+        """
+        if variante_dot not in VARIANTES_DOT:
+            raise ValueError(f"Variante desconhecida: {variante_dot}")
+        self.variante_dot = variante_dot
+        self.frequencia_mhz = frequencia_mhz
+        self.largura_minima_lote = largura_minima_lote
+        self.bram = np.zeros(BRAM_PALAVRAS, dtype=PALAVRA_DTYPE)
+        self.ciclos_dma = 0
+
+    @staticmethod
+    def _faixa(endereco: int, quantidade: int):
+        if endereco < 0 or quantidade < 0 or endereco + quantidade > BRAM_PALAVRAS:
+            raise ValueError(f"Faixa [{endereco}, {endereco + quantidade}) fora da BRAM")
+
+    def carregar_dma(self, palavras: np.ndarray, endereco: int = 0):
+        """
+        Escreve um bloco de palavras na BRAM (1 ciclo por palavra).
+
+        Args:
+            palavras: Palavras (K,) uint32 ou lote (K, 4) int8
+            endereco: Primeiro endereço escrito
+        """
+        palavras = np.asarray(palavras)
+        if palavras.ndim == 2:
+            palavras = empacotar(palavras)
+        self._faixa(endereco, len(palavras))
+        self.bram[endereco:endereco + len(palavras)] = palavras
+        self.ciclos_dma += len(palavras)
+
+    def ler_dma(self, endereco: int = 0, quantidade: int = BRAM_PALAVRAS) -> np.ndarray:
+        """
+        Lê um bloco de palavras da BRAM (1 ciclo por palavra).
+
+        Args:
+            endereco: Primeiro endereço lido
+            quantidade: Número de palavras
+
+        Returns:
+            Cópia (quantidade,) das palavras uint32
+        """
+        self._faixa(endereco, quantidade)
+        self.ciclos_dma += quantidade
+        return self.bram[endereco:endereco + quantidade].copy()
+
+    def _executar_lotes(self, programa: np.ndarray, niveis: np.ndarray, aritmeticas: np.ndarray,
+                        versao_a: np.ndarray, versao_b: np.ndarray, versao_final: np.ndarray) -> np.ndarray:
+        """Executa o programa renomeado nível a nível e devolve as palavras dos STOREs."""
+        opcode = programa['opcode']
+        valores = np.empty(BRAM_PALAVRAS + len(programa), dtype=PALAVRA_DTYPE)
+        valores[:BRAM_PALAVRAS] = self.bram
+        cargas = np.flatnonzero(opcode == OP_LOAD)
+        valores[BRAM_PALAVRAS + cargas] = programa['valor'][cargas]
+        # Instruções aritméticas ordenadas por nível e, dentro do nível, por opcode
+        chave = niveis[aritmeticas].astype(np.int64) * 4 + opcode[aritmeticas]
+        ordem = np.argsort(chave, kind='stable')
+        limites = np.flatnonzero(np.diff(chave[ordem])) + 1
+        for grupo in np.split(aritmeticas[ordem], limites) if len(aritmeticas) else ():
+            kernel = KERNELS[int(opcode[grupo[0]])]
+            valores[BRAM_PALAVRAS + grupo] = kernel(valores[versao_a[grupo]], valores[versao_b[grupo]])
+        self.bram[:] = valores[versao_final]
+        return valores[versao_a[opcode == OP_STORE]]
+
+    @staticmethod
+    def _analisar(programa: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]:
+        """Renomeia o programa e devolve (níveis, índices das aritméticas, versões)."""
+        versoes = renomear(programa)
+        niveis = niveis_dependencia(programa, versoes[0], versoes[1])
+        return niveis, np.flatnonzero(niveis > 0), versoes
+
+    def _lotes_compensam(self, niveis: np.ndarray, aritmeticas: np.ndarray) -> bool:
+        """Média de instruções aritméticas por nível >= largura_minima_lote."""
+        return len(aritmeticas) >= self.largura_minima_lote * int(niveis.max(initial=0))
+
+    def executar(self, programa: Programa) -> Tuple[np.ndarray, Dict[str, float]]:
+        """
+        Executa um programa em lotes de instruções independentes.
+
+        Args:
+            programa: Array de INSTRUCAO_DTYPE ou texto do programa
+
+        O modo é escolhido pelas primeiras AMOSTRA_MODO instruções: se já
+        nelas os níveis são estreitos demais, o programa é executado em modo
+        sequencial sem analisar o restante.
+
+        Returns:
+            Tupla (palavras lidas pelos STOREs na ordem do programa, relatório
+            com lotes (None se o modo sequencial foi escolhido pela amostra),
+            modo ('lotes' ou 'sequencial'), tempo de software, ciclos
+            estimados do FPGA e o tempo correspondente em frequencia_mhz)
+        """
+        programa = _como_programa(programa)
+        inicio = time.perf_counter()
+        if len(programa) > AMOSTRA_MODO and not self._lotes_compensam(*self._analisar(programa[:AMOSTRA_MODO])[:2]):
+            modo, n_lotes = 'sequencial', None
+            saida = executar_sequencial(programa, self.bram)
+        else:
+            niveis, aritmeticas, versoes = self._analisar(programa)
+            n_lotes = int(niveis.max(initial=0))
+            if self._lotes_compensam(niveis, aritmeticas):
+                modo = 'lotes'
+                saida = self._executar_lotes(programa, niveis, aritmeticas, *versoes)
+            else:
+                modo = 'sequencial'
+                saida = executar_sequencial(programa, self.bram)
+        tempo = time.perf_counter() - inicio
+
+        relatorio = {'instrucoes': len(programa), 'lotes': n_lotes, 'modo': modo, 'tempo_sw_s': tempo}
+        relatorio.update(estimar_ciclos(programa, self.variante_dot))
+        relatorio['tempo_fpga_s'] = relatorio['ciclos_total'] / (self.frequencia_mhz * 1e6)
+        relatorio['tempo_fpga_rajadas_s'] = relatorio['ciclos_total_rajadas'] / (self.frequencia_mhz * 1e6)
+        return saida, relatorio
+
+
+def executar_sequencial(programa: Programa, bram: np.ndarray) -> np.ndarray:
+    """
+    Referência: executa uma instrução por vez, em ordem de programa, com o
+    caminho rápido escalar (ProcessadorVetorialEscalar).
+
+    Args:
+        programa: Array de INSTRUCAO_DTYPE ou texto do programa
+        bram: Palavras (32,) uint32, alteradas no lugar
+
+    Returns:
+        Palavras lidas pelos STOREs
+    """
+    programa = _como_programa(programa)
+    escalar = ProcessadorVetorialEscalar()
+    operacoes = {
+        OP_SOMA: escalar.soma_empacotada,
+        OP_SUBTRACAO: escalar.subtracao_empacotada,
+        OP_PRODUTO_ESCALAR: lambda a, b: escalar.produto_escalar_empacotado(a, b) & 0xFFFFFFFF,
+    }
+    memoria = bram.tolist()
+    saida = []
+    for opcode, destino, fonte_a, fonte_b, valor in programa.tolist():
+        if opcode == OP_LOAD:
+            memoria[destino] = valor
+        elif opcode == OP_STORE:
+            saida.append(memoria[fonte_a])
+        else:
+            memoria[destino] = operacoes[opcode](memoria[fonte_a], memoria[fonte_b])
+    bram[:] = memoria
+    return np.array(saida, dtype=PALAVRA_DTYPE)
+
+
+def executar_simulador(programa: Programa, bram: np.ndarray, variante_dot: str = 'serial',
+                       agrupar_rajadas: bool = False) -> Tuple[np.ndarray, int]:
+    """
+    Reexecuta o programa no simulador ciclo a ciclo, com cada instrução
+    aritmética emitida como uma rajada de 1 par ou, com agrupar_rajadas,
+    com as rajadas de rajadas().
+
+    Args:
+        programa: Array de INSTRUCAO_DTYPE ou texto do programa
+        bram: Conteúdo inicial (32,) da BRAM, alterado no lugar
+        variante_dot: Datapath do produto escalar (chave de VARIANTES_DOT)
+        agrupar_rajadas: Emite as sequências agrupadas como uma rajada
+
+    Returns:
+        Tupla (palavras lidas pelos STOREs, ciclos gastos, incluindo 1 ciclo
+        da porta do host por LOAD/STORE)
+    """
+    programa = _como_programa(programa)
+    contagem = np.ones(len(programa), dtype=np.int64)
+    if agrupar_rajadas:
+        inicios, contagens = rajadas(programa)
+        contagem[:] = 0
+        contagem[inicios] = contagens
+    simulador = SimuladorFSMD(1, variante_dot)
+    simulador.reset()
+    simulador.carregar_bram(bram)
+    ciclo_inicial = simulador.ciclo
+    host = 0
+    saida = []
+    for (opcode, destino, fonte_a, fonte_b, valor), pares in zip(programa.tolist(), contagem.tolist()):
+        if opcode == OP_LOAD:
+            simulador.bram[0, destino] = valor
+            host += 1
+        elif opcode == OP_STORE:
+            saida.append(simulador.bram[0, fonte_a])
+            host += 1
+        elif pares:
+            simulador.configurar_burst(fonte_a, fonte_b, destino, pares)
+            simulador.executar(opcode, burst=True)
+    bram[:] = simulador.bram[0]
+    return np.array(saida, dtype=PALAVRA_DTYPE), simulador.ciclo - ciclo_inicial + host
+
+
+def gerar_programa(n_instrucoes: int, semente: int = 0, proporcao_host: float = 0.3) -> np.ndarray:
+    """
+    Gera um programa aleatório (endereços e palavras uniformes).
+
+    Args:
+        n_instrucoes: Número de instruções
+        semente: Semente do gerador pseudoaleatório
+        proporcao_host: Fração de LOADs e STOREs (divididos igualmente)
+
+    Returns:
+        Array (n_instrucoes,) de INSTRUCAO_DTYPE
+    """
+    rng = np.random.default_rng(semente)
+    programa = np.zeros(n_instrucoes, dtype=INSTRUCAO_DTYPE)
+    p_host = proporcao_host / 2
+    p_aritmetica = (1 - proporcao_host) / 3
+    programa['opcode'] = rng.choice([OP_LOAD, OP_STORE, OP_SOMA, OP_SUBTRACAO, OP_PRODUTO_ESCALAR],
+                                    size=n_instrucoes, p=[p_host, p_host] + [p_aritmetica] * 3)
+    for campo in ('destino', 'fonte_a', 'fonte_b'):
+        programa[campo] = rng.integers(0, BRAM_PALAVRAS, size=n_instrucoes)
+    programa['valor'] = rng.integers(0, 1 << 32, size=n_instrucoes, dtype=np.uint32)
+    return programa
+
+
+def programa_blocos(n_blocos: int, pares: int = 8) -> np.ndarray:
+    """
+    Programa típico do host: por bloco, carrega `pares` vetores A e B,
+    calcula soma, subtração e produto escalar de cada par e lê os resultados.
+
+    Args:
+        n_blocos: Número de blocos
+        pares: Pares por bloco (até 8: A em 0.., B em 8.., resultados em 16..)
+
+    Returns:
+        Array de INSTRUCAO_DTYPE
+    """
+    rng = np.random.default_rng(21)
+    linhas = []
+    for _ in range(n_blocos):
+        valores = rng.integers(0, 1 << 32, size=2 * pares).tolist()
+        linhas += [f"LOAD {i}, {valores[i]}" for i in range(pares)]
+        linhas += [f"LOAD {8 + i}, {valores[pares + i]}" for i in range(pares)]
+        for mnemonico in ('ADD', 'SUB', 'DOT'):
+            linhas += [f"{mnemonico} {16 + i}, {i}, {8 + i}" for i in range(pares)]
+            linhas += [f"STORE {16 + i}" for i in range(pares)]
+    return montar(linhas)
+
+
+def main():
+    """Função principal: confere o executor e compara software e FPGA."""
+    parser = argparse.ArgumentParser(description="Executor de fila de instruções sobre a BRAM")
+    parser.add_argument('--instrucoes', type=int, default=200_000, help="Instruções do programa aleatório")
+    parser.add_argument('--variante', choices=list(VARIANTES_DOT), default='serial')
+    parser.add_argument('--frequencia', type=float, default=250.0, help="Clock do FPGA em MHz")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - EXECUTOR DE FILA DE INSTRUÇÕES")
+    print("=" * 80)
+    print()
+
+    # Conferência contra o simulador ciclo a ciclo (programas curtos)
+    for nome, programa in (('aleatório', gerar_programa(1000, semente=1)), ('blocos', programa_blocos(8))):
+        for agrupar in (False, True):
+            executor = ExecutorInstrucoes(args.variante, args.frequencia)
+            saida, relatorio = executor.executar(programa)
+            bram_simulador = np.zeros(BRAM_PALAVRAS, dtype=PALAVRA_DTYPE)
+            saida_simulador, ciclos = executar_simulador(programa, bram_simulador, args.variante, agrupar)
+            estimados = relatorio['ciclos_total_rajadas' if agrupar else 'ciclos_total']
+            conferido = (np.array_equal(saida, saida_simulador) and np.array_equal(executor.bram, bram_simulador)
+                         and ciclos == estimados)
+            print(f"Conferência com o simulador ({nome}, {len(programa)} instruções, "
+                  f"{'rajadas agrupadas' if agrupar else 'uma rajada por instrução'}): "
+                  f"{'OK' if conferido else 'FALHOU'} ({ciclos} ciclos simulados, {estimados} estimados)")
+    print()
+
+    cargas = {
+        'aleatório': gerar_programa(args.instrucoes, semente=2),
+        'blocos de 8 pares': programa_blocos(max(1, args.instrucoes // 64)),
+    }
+    print(f"{'Programa':<19} {'Instr.':>8} {'Lotes':>7} {'Modo':>11} {'Seq. (ms)':>10} {'Executor (ms)':>14} "
+          f"{'Speedup':>8} {'FPGA (ms)':>10} {'Rajadas (ms)':>13}")
+    print("-" * 108)
+    for nome, programa in cargas.items():
+        bram = np.zeros(BRAM_PALAVRAS, dtype=PALAVRA_DTYPE)
+        inicio = time.perf_counter()
+        referencia = executar_sequencial(programa, bram)
+        tempo_sequencial = time.perf_counter() - inicio
+        executor = ExecutorInstrucoes(args.variante, args.frequencia)
+        saida, relatorio = executor.executar(programa)
+        assert np.array_equal(saida, referencia) and np.array_equal(executor.bram, bram)
+        lotes = '-' if relatorio['lotes'] is None else f"{relatorio['lotes']:,}"
+        print(f"{nome:<19} {relatorio['instrucoes']:>8,} {lotes:>7} {relatorio['modo']:>11} "
+              f"{tempo_sequencial * 1e3:>10.2f} {relatorio['tempo_sw_s'] * 1e3:>14.2f} "
+              f"{tempo_sequencial / relatorio['tempo_sw_s']:>7.2f}x {relatorio['tempo_fpga_s'] * 1e3:>10.2f} "
+              f"{relatorio['tempo_fpga_rajadas_s'] * 1e3:>13.2f}")
+    print()
+    print(f"FPGA a {args.frequencia:.0f} MHz: uma rajada por instrução aritmética ou, em 'Rajadas',")
+    print("instruções consecutivas com endereços sequenciais agrupadas em uma rajada;")
+    print("LOAD/STORE custam 1 ciclo da porta do host")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
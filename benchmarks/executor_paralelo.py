@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Executor Paralelo com Memória Compartilhada
+Arquivo: executor_paralelo.py
+Descrição: Distribui lotes (N, 4) int8 entre um pool de processos usando
+           multiprocessing.shared_memory: os processos mapeiam os mesmos
+           buffers de entrada e saída, executam os kernels em lote do
+           processador em software sobre sua fatia e escrevem o resultado
+           no lugar, sem serializar os dados
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+"""
+
+import multiprocessing as mp
+import os
+import time
+import numpy as np
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from processador_vetorial_sw import ProcessadorVetorialSW
+
+TAMANHO_BLOCO_PADRAO = 1 << 18  # pares por tarefa
+MAX_ANEXOS_POR_PROCESSO = 8
+
+# (formato por par, dtype) do resultado de cada operação
+SAIDAS = {
+    'soma': ((4,), np.int8),
+    'subtracao': ((4,), np.int8),
+    'produto_escalar': ((), np.int32),
+}
+
+# Estado de cada processo do pool
+_processador: Optional[ProcessadorVetorialSW] = None
+_anexos: 'OrderedDict[str, shared_memory.SharedMemory]' = OrderedDict()
+
+
+def _inicializar_processo():
+    """Inicializa o processador em software de um processo do pool."""
+    global _processador
+    _processador = ProcessadorVetorialSW()
+
+
+def _anexar(nome: str) -> shared_memory.SharedMemory:
+    """Mapeia (uma única vez por processo) um bloco de memória compartilhada."""
+    shm = _anexos.get(nome)
+    if shm is None:
+        # O resource tracker é compartilhado com o processo principal, dono
+        # do bloco e responsável por liberá-lo (unlink)
+        shm = shared_memory.SharedMemory(name=nome)
+        _anexos[nome] = shm
+        if len(_anexos) > MAX_ANEXOS_POR_PROCESSO:
+            _anexos.popitem(last=False)[1].close()
+    else:
+        _anexos.move_to_end(nome)
+    return shm
+
+
+def _visao(nome: str, formato: Tuple[int, ...], dtype) -> np.ndarray:
+    """Cria um ndarray sobre um bloco de memória compartilhada anexado."""
+    return np.ndarray(formato, dtype=dtype, buffer=_anexar(nome).buf)
+
+
+def _executar_fatia(tarefa: Tuple[str, str, str, str, int, int, int]) -> int:
+    """Executa um kernel em lote sobre a fatia [inicio, fim) e grava no lugar."""
+    operacao, nome_a, nome_b, nome_saida, n, inicio, fim = tarefa
+    lote_a = _visao(nome_a, (n, 4), np.int8)
+    lote_b = _visao(nome_b, (n, 4), np.int8)
+    formato, dtype = SAIDAS[operacao]
+    saida = _visao(nome_saida, (n,) + formato, dtype)
+    kernel = {
+        'soma': _processador.soma_vetorial_lote,
+        'subtracao': _processador.subtracao_vetorial_lote,
+        'produto_escalar': _processador.produto_escalar_lote,
+    }[operacao]
+    saida[inicio:fim] = kernel(lote_a[inicio:fim], lote_b[inicio:fim])
+    return fim - inicio
+
+
+class ExecutorParalelo:
+    """
+    Executor multiprocesso para lotes grandes do processador vetorial.
+
+    Os lotes devem residir em memória compartilhada alocada por alocar()
+    para que nada seja copiado; lotes comuns são copiados uma vez para
+    blocos compartilhados temporários. Deve ser usado como gerenciador de
+    contexto (with) ou encerrado com fechar().
+    """
+
+    def __init__(self, processos: Optional[int] = None,
+                 tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+        """
+        Inicializa o pool de processos.
+
+        Args:
+            processos: Número de processos (padrão: os.cpu_count())
+            tamanho_bloco: Pares de vetores por tarefa
+        """
+        self.processos = processos or os.cpu_count()
+        self.tamanho_bloco = tamanho_bloco
+        # Os processos do pool precisam herdar o resource tracker do processo
+        # principal; caso contrário, cada um iniciaria o seu e removeria os
+        # blocos compartilhados ao terminar
+        resource_tracker.ensure_running()
+        self._pool = mp.Pool(self.processos, initializer=_inicializar_processo)
+        self._blocos: Dict[str, shared_memory.SharedMemory] = {}
+        self._pendentes: List[shared_memory.SharedMemory] = []
+
+    def __enter__(self) -> 'ExecutorParalelo':
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def alocar(self, formato: Tuple[int, ...], dtype=np.int8) -> np.ndarray:
+        """
+        Aloca um array em memória compartilhada visível pelos processos.
+
+        Args:
+            formato: Formato do array
+            dtype: Tipo dos elementos
+
+        Returns:
+            ndarray cujo buffer é um bloco de memória compartilhada
+        """
+        tamanho = max(int(np.prod(formato)) * np.dtype(dtype).itemsize, 1)
+        shm = shared_memory.SharedMemory(create=True, size=tamanho)
+        self._blocos[shm.name] = shm
+        return np.ndarray(formato, dtype=dtype, buffer=shm.buf)
+
+    def liberar(self, array: np.ndarray):
+        """
+        Libera o bloco de memória compartilhada de um array de alocar().
+        O array não deve ser usado depois desta chamada.
+        """
+        nome = self._nome_bloco(array)
+        del array
+        if nome is not None:
+            self._liberar_bloco(nome)
+
+    def fechar(self):
+        """Encerra o pool e libera todos os blocos de memória compartilhada."""
+        self._pool.close()
+        self._pool.join()
+        for nome in list(self._blocos):
+            self._liberar_bloco(nome)
+        for shm in self._pendentes:
+            shm.close()
+        self._pendentes.clear()
+
+    def _liberar_bloco(self, nome: str):
+        """Remove o nome do bloco e desfaz o mapeamento se não houver views vivas."""
+        shm = self._blocos.pop(nome)
+        shm.unlink()
+        try:
+            shm.close()
+        except BufferError:
+            # Ainda existem arrays sobre o bloco; o mapeamento é desfeito depois
+            self._pendentes.append(shm)
+
+    def _nome_bloco(self, array: np.ndarray) -> Optional[str]:
+        """Retorna o nome do bloco compartilhado que começa no array."""
+        if not array.flags.c_contiguous:
+            return None
+        endereco = array.__array_interface__['data'][0]
+        for nome, shm in self._blocos.items():
+            if np.frombuffer(shm.buf, dtype=np.uint8).ctypes.data == endereco:
+                return nome
+        return None
+
+    def _compartilhado(self, array: np.ndarray, formato: Tuple[int, ...], dtype) -> Tuple[np.ndarray, str, bool]:
+        """
+        Retorna o array em memória compartilhada, copiando-o se necessário.
+
+        Um bloco de alocar() só é reaproveitado se tiver exatamente o formato
+        e o tipo que os processos vão mapear; senão o array é copiado (e
+        convertido) para um bloco temporário.
+        """
+        nome = self._nome_bloco(array)
+        if nome is not None and array.dtype == dtype and array.shape == formato:
+            return array, nome, False
+        copia = self.alocar(formato, dtype)
+        copia[...] = array
+        return copia, self._nome_bloco(copia), True
+
+    def executar(self, operacao: str, lote_a: np.ndarray, lote_b: np.ndarray,
+                 saida: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Executa uma operação sobre lotes (N, 4) int8, dividindo-os entre os processos.
+
+        Args:
+            operacao: 'soma', 'subtracao' ou 'produto_escalar'
+            lote_a: Lote A (N, 4) int8, de preferência obtido de alocar()
+            lote_b: Lote B (N, 4) int8, de preferência obtido de alocar()
+            saida: Array de resultado obtido de alocar() (opcional)
+
+        Returns:
+            Array de resultado: (N, 4) int8 ou (N,) int32
+        """
+        n = len(lote_a)
+        formato, dtype = SAIDAS[operacao]
+        lote_a, nome_a, temp_a = self._compartilhado(lote_a, (n, 4), np.int8)
+        lote_b, nome_b, temp_b = self._compartilhado(lote_b, (n, 4), np.int8)
+        if saida is None:
+            saida = self.alocar((n,) + formato, dtype)
+        nome_saida = self._nome_bloco(saida)
+        if nome_saida is None:
+            raise ValueError("O array de saída deve ser alocado com ExecutorParalelo.alocar()")
+        if saida.dtype != dtype or saida.shape != (n,) + formato:
+            raise ValueError(f"Saída de {operacao} deve ter formato {(n,) + formato} e tipo "
+                             f"{np.dtype(dtype)}, não {saida.shape} {saida.dtype}")
+
+        tarefas = [(operacao, nome_a, nome_b, nome_saida, n, inicio, min(inicio + self.tamanho_bloco, n))
+                   for inicio in range(0, n, self.tamanho_bloco)]
+        for _ in self._pool.imap_unordered(_executar_fatia, tarefas):
+            pass
+
+        del lote_a, lote_b
+        for nome, temporario in ((nome_a, temp_a), (nome_b, temp_b)):
+            if temporario:
+                self._liberar_bloco(nome)
+        return saida
+
+    def soma_vetorial_lote(self, lote_a: np.ndarray, lote_b: np.ndarray,
+                           saida: Optional[np.ndarray] = None) -> np.ndarray:
+        """Soma vetorial com saturação em paralelo (ver executar)."""
+        return self.executar('soma', lote_a, lote_b, saida)
+
+    def subtracao_vetorial_lote(self, lote_a: np.ndarray, lote_b: np.ndarray,
+                                saida: Optional[np.ndarray] = None) -> np.ndarray:
+        """Subtração vetorial com saturação em paralelo (ver executar)."""
+        return self.executar('subtracao', lote_a, lote_b, saida)
+
+    def produto_escalar_lote(self, lote_a: np.ndarray, lote_b: np.ndarray,
+                             saida: Optional[np.ndarray] = None) -> np.ndarray:
+        """Produto escalar em paralelo (ver executar)."""
+        return self.executar('produto_escalar', lote_a, lote_b, saida)
+
+
+def curva_escalonamento(tamanho: int, operacao: str = 'produto_escalar',
+                        processos: Optional[List[int]] = None, repeticoes: int = 5,
+                        tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                        semente: int = 0) -> List[Dict[str, float]]:
+    """
+    Mede o tempo por operação do executor de 1 até todos os núcleos.
+
+    Args:
+        tamanho: Pares de vetores do conjunto de dados
+        operacao: Operação medida
+        processos: Números de processos (padrão: 1..os.cpu_count())
+        repeticoes: Repetições por ponto (usa a mediana)
+        tamanho_bloco: Pares por tarefa
+        semente: Semente do conjunto de dados
+
+    Returns:
+        Lista de pontos com processos, mediana (ns/op), vazão e eficiência
+    """
+    processos = processos or list(range(1, os.cpu_count() + 1))
+    rng = np.random.default_rng(semente)
+    curva = []
+    for p in processos:
+        with ExecutorParalelo(p, tamanho_bloco) as executor:
+            lote_a = executor.alocar((tamanho, 4))
+            lote_b = executor.alocar((tamanho, 4))
+            lote_a[:] = rng.integers(-128, 128, size=(tamanho, 4), dtype=np.int8)
+            lote_b[:] = rng.integers(-128, 128, size=(tamanho, 4), dtype=np.int8)
+            formato, dtype = SAIDAS[operacao]
+            saida = executor.alocar((tamanho,) + formato, dtype)
+            executor.executar(operacao, lote_a, lote_b, saida)  # aquecimento
+            tempos = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter_ns()
+                executor.executar(operacao, lote_a, lote_b, saida)
+                tempos.append((time.perf_counter_ns() - inicio) / tamanho)
+            del lote_a, lote_b, saida
+        mediana = float(np.median(tempos))
+        curva.append({'processos': p, 'mediana_ns': mediana, 'vazao_mops': 1e3 / mediana})
+    for ponto in curva:
+        ponto['speedup'] = curva[0]['mediana_ns'] / ponto['mediana_ns']
+        ponto['eficiencia'] = ponto['speedup'] / ponto['processos'] * curva[0]['processos']
+    return curva
+
+
+def main():
+    """Função principal: imprime a curva de escalonamento do produto escalar."""
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - EXECUTOR PARALELO (MEMÓRIA COMPARTILHADA)")
+    print("=" * 80)
+    print()
+    tamanho = 20_000_000
+    print(f"Produto escalar de {tamanho:,} pares, {os.cpu_count()} núcleos")
+    print()
+    print(f"{'Processos':>10} {'ns/op':>10} {'Mops/s':>10} {'Speedup':>10} {'Eficiência':>12}")
+    print("-" * 56)
+    for ponto in curva_escalonamento(tamanho):
+        print(f"{ponto['processos']:>10} {ponto['mediana_ns']:>10.2f} {ponto['vazao_mops']:>10.1f} "
+              f"{ponto['speedup']:>9.2f}x {ponto['eficiencia']:>11.0%}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
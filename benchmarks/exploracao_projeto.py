@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Exploração do Espaço de Projeto
+Arquivo: exploracao_projeto.py
+Descrição: Avalia de uma só vez, com NumPy vetorizado, milhares de
+           configurações do datapath (lanes, largura do elemento, número de
+           multiplicadores, acumulação sequencial ou com pipeline,
+           comprimento da rajada e clock) em latência, vazão, energia por
+           operação e recursos, e extrai a fronteira de Pareto
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Modelo de ciclos (modo rajada de B pares, FSMCompleta generalizada):
+    soma/subtração:  2B + 3
+    produto escalar: (ceil(L/M) + 1 + P) * B + 4
+com L lanes, M multiplicadores e P = 1 para acumulação com pipeline. Com
+L = 4 e M = 1 (mux 4:1) ou M = 4 (árvore) o modelo reproduz exatamente
+ciclos_por_operacao() de simulador_fsmd.py.
+
+O caminho crítico usa o modelo de atrasos ATRASOS_NS de analise_hw_sw.py,
+calibrado para que o datapath atual reproduza o Fmax medido
+(FMAX_MEDIDO_MHZ). As demais configurações não têm medida e o Fmax delas é
+heurístico; ainda assim, por padrão, configurações com clock acima do Fmax
+estimado são inviáveis e ficam fora da fronteira (--ignorar-fmax as inclui).
+Recursos e potência são estimativas de ordem de grandeza para Cyclone IV E,
+úteis para comparar configurações entre si e não como substitutos da síntese.
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+from analise_hw_sw import ATRASOS_NS, ESCALA_ATRASOS, FMAX_MEDIDO_MHZ, atraso_somador
+from simulador_fsmd import BRAM_PALAVRAS, VARIANTES_DOT, ciclos_por_operacao
+
+# Em rajada, A, B e resultados dividem a BRAM
+PARES_POR_RAJADA = BRAM_PALAVRAS // 3
+
+# Eixos padrão da exploração (produto cartesiano, M deve dividir L)
+ESPACO_PADRAO: Dict[str, Sequence] = {
+    'lanes': (1, 2, 4, 8, 16, 32),
+    'largura': (4, 8, 12, 16),
+    'multiplicadores': (1, 2, 4, 8, 16, 32),
+    'pipeline': (False, True),
+    'rajada': (1, 2, 4, 8, PARES_POR_RAJADA),
+    'frequencia_mhz': (50.0, 100.0, 150.0, 200.0, 250.0, 300.0, 400.0, 500.0),
+}
+
+# Configuração atual do processador (serial, operação única, 250 MHz)
+CONFIGURACAO_ATUAL = {
+    'lanes': 4, 'largura': 8, 'multiplicadores': 1, 'pipeline': False,
+    'rajada': 1, 'frequencia_mhz': 250.0,
+}
+
+# Capacidade do EP4CE6E22C8
+DISPOSITIVO = {
+    'logic_elements': 6272,
+    'multiplicadores_9x9': 30,
+    'blocos_m9k': 30,
+}
+
+# Multiplicador embarcado: modo 9x9 até 9 bits, 18x18 (dois elementos 9x9)
+# acima; valor típico na mesma escala calibrada de ATRASOS_NS
+ATRASO_MULTIPLICADOR_18X18_NS = 4.3 * ESCALA_ATRASOS
+
+# Registradores fora do datapath: estado da FSM, bases e contadores da rajada
+REGISTRADORES_CONTROLE = 38
+LES_CONTROLE = 40
+
+# Potência: parcela estática + parcela dinâmica proporcional a f * recursos,
+# calibrada para que a configuração atual consuma POTENCIA_REFERENCIA_MW
+POTENCIA_ESTATICA_MW = 30.0
+POTENCIA_REFERENCIA_MW = 50.0
+PESO_MULTIPLICADOR_LE = 20.0  # um elemento 9x9 equivale a ~20 LEs em atividade
+PESO_M9K_LE = 10.0
+
+# Objetivos padrão da fronteira de Pareto: (métrica, True se maximizar)
+OBJETIVOS_PADRAO = (('throughput_gmacs', True), ('energia_pj_mac', False), ('logic_elements', False))
+
+
+def gerar_configuracoes(espaco: Optional[Dict[str, Sequence]] = None) -> Dict[str, np.ndarray]:
+    """
+    Gera o produto cartesiano dos eixos, descartando combinações em que o
+    número de multiplicadores não divide o número de lanes.
+
+    Args:
+        espaco: Eixos a sobrescrever em ESPACO_PADRAO
+
+    Returns:
+        Nome do parâmetro -> array (N,)
+    """
+    eixos = dict(ESPACO_PADRAO, **(espaco or {}))
+    grade = np.array(list(itertools.product(*eixos.values())), dtype=np.float64)
+    configuracoes = {nome: grade[:, i] for i, nome in enumerate(eixos)}
+    for nome in ('lanes', 'largura', 'multiplicadores', 'rajada'):
+        configuracoes[nome] = configuracoes[nome].astype(np.int64)
+    configuracoes['pipeline'] = configuracoes['pipeline'].astype(bool)
+
+    lanes, multiplicadores = configuracoes['lanes'], configuracoes['multiplicadores']
+    validas = (multiplicadores <= lanes) & (lanes % multiplicadores == 0)
+    return {nome: valores[validas] for nome, valores in configuracoes.items()}
+
+
+def _log2_teto(x: np.ndarray) -> np.ndarray:
+    """ceil(log2(x)) exato para inteiros positivos."""
+    return np.frexp(np.asarray(x, dtype=np.float64) - 1)[1].astype(np.int64)  # bit_length(x - 1)
+
+
+def _largura_acumulador(L: np.ndarray, W: np.ndarray) -> np.ndarray:
+    """Largura do acumulador: produto + soma das lanes + 6 bits de folga (24 para L = 4, W = 8)."""
+    return 2 * W + _log2_teto(L) + 6
+
+
+def _recursos(L: np.ndarray, W: np.ndarray, M: np.ndarray, P: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Estima os recursos de cada configuração.
+
+    Returns:
+        logic_elements, registradores, multiplicadores_9x9, blocos_m9k e a
+        carga (LEs equivalentes) usada no modelo de potência
+    """
+    largura_produto = 2 * W
+    largura_acc = _largura_acumulador(L, W)
+    niveis = _log2_teto(M)
+    passos = -(-L // M)
+    les_arvore = np.sum([(M >> k) * (largura_produto + k) * (niveis >= k) for k in range(1, 7)], axis=0)
+    les_mux = M * largura_produto * (passos - 1) / 2
+    combinacional = (L * (2 * W + 2)            # somadores/subtratores com saturação
+                     + 2 * L * W                # mux de saída
+                     + les_arvore + les_mux + largura_acc + LES_CONTROLE)
+    registradores = (2 * L * W + largura_acc + REGISTRADORES_CONTROLE
+                     + P * np.where(M > 1, (M // 2) * (largura_produto + 1), largura_produto))
+    logic_elements = np.maximum(combinacional, registradores).astype(np.int64)
+    multiplicadores_9x9 = M * np.where(W <= 9, 1, 2)
+    blocos_m9k = -(-(L * W) // 36)  # palavra de L * W bits, M9K no modo x36
+    return {
+        'logic_elements': logic_elements,
+        'registradores': registradores.astype(np.int64),
+        'multiplicadores_9x9': multiplicadores_9x9,
+        'blocos_m9k': blocos_m9k,
+        'carga': logic_elements + PESO_MULTIPLICADOR_LE * multiplicadores_9x9 + PESO_M9K_LE * blocos_m9k,
+    }
+
+
+def avaliar(configuracoes: Dict[str, np.ndarray],
+            potencia_referencia_mw: float = POTENCIA_REFERENCIA_MW,
+            limitar_fmax: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Calcula ciclos, Fmax, vazão, energia e recursos de todas as configurações.
+
+    Args:
+        configuracoes: Saída de gerar_configuracoes()
+        potencia_referencia_mw: Potência da configuração atual (calibração)
+        limitar_fmax: Descarta também configurações com clock acima do Fmax
+            estimado (heurístico fora da configuração atual); False as
+            mantém, com vazão e energia calculadas no clock pedido
+
+    Returns:
+        Parâmetros e métricas, cada um como array (N,). 'viavel' indica que
+        os recursos cabem no dispositivo (e, com limitar_fmax, que o clock
+        não excede o Fmax estimado); 'dentro_fmax' traz apenas a comparação
+        com o Fmax estimado
+    """
+    L = configuracoes['lanes']
+    W = configuracoes['largura']
+    M = configuracoes['multiplicadores']
+    P = configuracoes['pipeline'].astype(np.int64)
+    B = configuracoes['rajada']
+    f = configuracoes['frequencia_mhz']
+
+    # Ciclos
+    passos = -(-L // M)
+    ciclos_dot = (passos + 1 + P) * B + 4
+    ciclos_soma = 2 * B + 3
+
+    # Caminho crítico do produto escalar
+    largura_produto = 2 * W
+    largura_acc = _largura_acumulador(L, W)
+    niveis = _log2_teto(M)
+    multiplicador = np.where(W <= 9, ATRASOS_NS['multiplicador'], ATRASO_MULTIPLICADOR_18X18_NS)
+    mux = ATRASOS_NS['mux4'] * ((_log2_teto(passos) + 1) // 2)  # níveis de mux 4:1
+    # Níveis da árvore: o nível k produz uma soma de 2W + k bits
+    arvore = niveis * ATRASOS_NS['somador_base'] + ATRASOS_NS['carry_por_bit'] * (
+        niveis * largura_produto + niveis * (niveis + 1) / 2)
+    primeiro_nivel = np.where(niveis > 0, atraso_somador(largura_produto + 1), 0.0)
+    acumulador = atraso_somador(largura_acc)
+    sequencial = multiplicador + mux + arvore + acumulador
+    # Com pipeline, um registrador após o primeiro nível (ou após o multiplicador)
+    com_pipeline = np.maximum(multiplicador + mux + primeiro_nivel, arvore - primeiro_nivel + acumulador)
+    soma_sub = atraso_somador(W + 1) + 2 * ATRASOS_NS['mux4']
+    caminho = np.maximum(np.where(P == 1, com_pipeline, sequencial), soma_sub)
+    fmax = 1000 / (ATRASOS_NS['registrador'] + caminho)
+
+    recursos = _recursos(L, W, M, P)
+
+    # Potência e energia
+    referencia = _recursos(*(np.array([CONFIGURACAO_ATUAL[nome]], dtype=np.int64)
+                             for nome in ('lanes', 'largura', 'multiplicadores', 'pipeline')))
+    coeficiente = (potencia_referencia_mw - POTENCIA_ESTATICA_MW) / (
+        CONFIGURACAO_ATUAL['frequencia_mhz'] * referencia['carga'][0])
+    potencia_mw = POTENCIA_ESTATICA_MW + coeficiente * f * recursos.pop('carga')
+
+    throughput_gmacs = f * B * L / ciclos_dot / 1e3
+    throughput_soma = f * B * L / ciclos_soma / 1e3
+    dentro_fmax = f <= fmax
+    viavel = dentro_fmax.copy() if limitar_fmax else np.ones(len(f), dtype=bool)
+    for nome, capacidade in DISPOSITIVO.items():
+        viavel &= recursos[nome] <= capacidade
+
+    resultado = dict(configuracoes)
+    resultado.update({
+        'ciclos_dot': ciclos_dot,
+        'ciclos_soma': ciclos_soma,
+        'fmax_mhz': fmax,
+        'latencia_dot_ns': ciclos_dot * 1000 / f,
+        'latencia_soma_ns': ciclos_soma * 1000 / f,
+        'throughput_gmacs': throughput_gmacs,
+        'throughput_soma_gelem_s': throughput_soma,
+        'potencia_mw': potencia_mw,
+        'energia_pj_mac': potencia_mw / throughput_gmacs,  # mW / (GMAC/s) = pJ/MAC
+        **recursos,
+        'dentro_fmax': dentro_fmax,
+        'viavel': viavel,
+    })
+    return resultado
+
+
+def fronteira_pareto(objetivos: np.ndarray, tamanho_bloco: int = 1024) -> np.ndarray:
+    """
+    Marca os pontos não dominados (todos os objetivos minimizados).
+
+    Um ponto é dominado se outro é menor ou igual em todos os objetivos e
+    estritamente menor em ao menos um. A comparação é feita em blocos de
+    linhas para limitar a matriz temporária a tamanho_bloco x N.
+
+    Args:
+        objetivos: Array (N, K)
+        tamanho_bloco: Pontos comparados por bloco
+
+    Returns:
+        Array (N,) booleano
+    """
+    objetivos = np.asarray(objetivos, dtype=np.float64)
+    pareto = np.ones(len(objetivos), dtype=bool)
+    for inicio in range(0, len(objetivos), tamanho_bloco):
+        bloco = objetivos[inicio:inicio + tamanho_bloco, np.newaxis, :]
+        menor_igual = np.all(objetivos[np.newaxis, :, :] <= bloco, axis=2)
+        menor = np.any(objetivos[np.newaxis, :, :] < bloco, axis=2)
+        pareto[inicio:inicio + tamanho_bloco] = ~np.any(menor_igual & menor, axis=1)
+    return pareto
+
+
+def explorar(espaco: Optional[Dict[str, Sequence]] = None, objetivos=OBJETIVOS_PADRAO,
+             agrupar_por: Sequence[str] = ('largura',),
+             potencia_referencia_mw: float = POTENCIA_REFERENCIA_MW,
+             limitar_fmax: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Gera, avalia e marca a fronteira de Pareto entre as configurações viáveis.
+
+    Args:
+        espaco: Eixos a sobrescrever em ESPACO_PADRAO
+        objetivos: Pares (métrica, maximizar)
+        agrupar_por: Parâmetros que definem requisitos, e não compromissos
+            (padrão: a largura do elemento); há uma fronteira por grupo
+        potencia_referencia_mw: Potência da configuração atual
+        limitar_fmax: Repassado a avaliar()
+
+    Returns:
+        Saída de avaliar() com a chave adicional 'pareto'
+    """
+    resultados = avaliar(gerar_configuracoes(espaco), potencia_referencia_mw, limitar_fmax)
+    matriz = np.column_stack([-resultados[nome] if maximizar else resultados[nome]
+                              for nome, maximizar in objetivos])
+    pareto = np.zeros(len(matriz), dtype=bool)
+    chaves = np.column_stack([resultados[nome] for nome in agrupar_por] or [np.zeros(len(matriz))])
+    _, grupo = np.unique(chaves, axis=0, return_inverse=True)
+    for g in np.unique(grupo):
+        indices = np.flatnonzero(resultados['viavel'] & (grupo.ravel() == g))
+        pareto[indices] = fronteira_pareto(matriz[indices])
+    resultados['pareto'] = pareto
+    return resultados
+
+
+def validar_calibracao() -> Dict[str, float]:
+    """
+    Compara o modelo com as referências independentes disponíveis: os ciclos
+    das três variantes atuais com o simulador ciclo a ciclo e o Fmax do
+    datapath atual (serial) com o medido (FMAX_MEDIDO_MHZ). As variantes em
+    árvore não têm Fmax medido e não entram na comparação.
+
+    Returns:
+        Maior diferença absoluta em ciclos e erro relativo do Fmax serial
+    """
+    variantes = {'serial': (1, False), 'arvore': (4, False), 'arvore_pipeline': (4, True)}
+    rajadas = (1, 2, 8, PARES_POR_RAJADA)
+    erro_ciclos, erro_fmax = 0, 0.0
+    for variante, (multiplicadores, pipeline) in variantes.items():
+        assert VARIANTES_DOT[variante] == (multiplicadores > 1, pipeline)
+        resultado = avaliar(gerar_configuracoes({
+            'lanes': (4,), 'largura': (8,), 'multiplicadores': (multiplicadores,),
+            'pipeline': (pipeline,), 'rajada': rajadas, 'frequencia_mhz': (250.0,)}))
+        for i, rajada in enumerate(rajadas):
+            simulado = ciclos_por_operacao(rajada, variante)
+            erro_ciclos = max(erro_ciclos, abs(resultado['ciclos_dot'][i] - simulado['produto_escalar']),
+                              abs(resultado['ciclos_soma'][i] - simulado['soma']))
+        if variante == 'serial':
+            erro_fmax = abs(resultado['fmax_mhz'][0] / FMAX_MEDIDO_MHZ - 1)
+    return {'erro_ciclos': erro_ciclos, 'erro_relativo_fmax': erro_fmax}
+
+
+def salvar_csv(resultados: Dict[str, np.ndarray], caminho: str, somente_pareto: bool = False):
+    """
+    Salva as configurações e métricas em CSV (uma linha por configuração).
+
+    Args:
+        resultados: Saída de explorar()
+        caminho: Arquivo de saída
+        somente_pareto: Salva apenas a fronteira de Pareto
+    """
+    selecao = resultados['pareto'] if somente_pareto else np.ones(len(resultados['lanes']), dtype=bool)
+    with open(caminho, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(resultados.keys())
+        colunas = [valores[selecao].tolist() for valores in resultados.values()]
+        escritor.writerows(zip(*colunas))
+
+
+def gerar_graficos(resultados: Dict[str, np.ndarray], caminho: str):
+    """
+    Plota as projeções 2-D da exploração, destacando a fronteira de Pareto.
+
+    Args:
+        resultados: Saída de explorar()
+        caminho: Arquivo de imagem
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    viavel, pareto = resultados['viavel'], resultados['pareto']
+    atual = _indice_configuracao(resultados, CONFIGURACAO_ATUAL)
+    projecoes = (('logic_elements', 'throughput_gmacs', 'Recursos (LEs)', 'Vazão (GMAC/s)'),
+                 ('energia_pj_mac', 'throughput_gmacs', 'Energia (pJ/MAC)', 'Vazão (GMAC/s)'),
+                 ('logic_elements', 'energia_pj_mac', 'Recursos (LEs)', 'Energia (pJ/MAC)'))
+
+    fig, eixos = plt.subplots(1, 3, figsize=(20, 6))
+    fig.suptitle('Exploração do Espaço de Projeto - Produto Escalar\n'
+                 f'{viavel.sum():,} configurações viáveis, {pareto.sum():,} na fronteira de Pareto',
+                 fontsize=14, fontweight='bold')
+    for ax, (x, y, rotulo_x, rotulo_y) in zip(eixos, projecoes):
+        ax.scatter(resultados[x][viavel], resultados[y][viavel], s=6, c='#BBBBBB', label='Viáveis')
+        pontos = ax.scatter(resultados[x][pareto], resultados[y][pareto], s=18,
+                            c=np.log2(resultados['lanes'][pareto]), cmap='viridis', label='Pareto')
+        if atual is not None:
+            ax.scatter(resultados[x][atual], resultados[y][atual], s=120, marker='*', c='#A23B72',
+                       label='Configuração atual')
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel(rotulo_x, fontweight='bold')
+        ax.set_ylabel(rotulo_y, fontweight='bold')
+        ax.grid(True, alpha=0.3, which='both')
+        ax.legend(fontsize=9)
+    fig.colorbar(pontos, ax=eixos, label='log2(lanes)')
+    plt.savefig(caminho, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+
+
+def _indice_configuracao(resultados: Dict[str, np.ndarray], configuracao: Dict) -> Optional[int]:
+    """Índice de uma configuração em resultados (None se não foi avaliada)."""
+    selecao = np.ones(len(resultados['lanes']), dtype=bool)
+    for nome, valor in configuracao.items():
+        selecao &= resultados[nome] == valor
+    indices = np.flatnonzero(selecao)
+    return int(indices[0]) if len(indices) else None
+
+
+def main():
+    """Função principal: explora o espaço padrão e salva a fronteira de Pareto."""
+    parser = argparse.ArgumentParser(description="Exploração do espaço de projeto do datapath")
+    for nome, valores in ESPACO_PADRAO.items():
+        if nome != 'pipeline':
+            tipo = float if nome == 'frequencia_mhz' else int
+            parser.add_argument('--' + nome.replace('_', '-'), type=tipo, nargs='+',
+                                help=f"Eixo {nome} (padrão: {' '.join(map(str, valores))})")
+    parser.add_argument('--saida-dir', default='.', help="Diretório do CSV e do gráfico")
+    parser.add_argument('--linhas', type=int, default=40, help="Linhas da fronteira exibidas")
+    parser.add_argument('--sem-graficos', action='store_true')
+    parser.add_argument('--ignorar-fmax', action='store_true',
+                        help="Mantém configurações com clock acima do Fmax estimado (heurístico)")
+    args = parser.parse_args()
+
+    espaco = {nome: valores for nome, valores in vars(args).items()
+              if nome in ESPACO_PADRAO and valores is not None}
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - EXPLORAÇÃO DO ESPAÇO DE PROJETO")
+    print("=" * 80)
+    print()
+
+    calibracao = validar_calibracao()
+    print(f"Calibração (L=4, W=8): diferença máxima de {calibracao['erro_ciclos']} ciclo(s) "
+          f"contra o simulador; Fmax serial a {calibracao['erro_relativo_fmax'] * 100:.2f}% "
+          f"do medido ({FMAX_MEDIDO_MHZ:.2f} MHz)")
+    print("Fmax das demais configurações é heurístico (ATRASOS_NS); "
+          + ("não limita a viabilidade (--ignorar-fmax)" if args.ignorar_fmax
+             else "clocks acima dele são descartados"))
+
+    resultados = explorar(espaco, limitar_fmax=not args.ignorar_fmax)
+    viavel, pareto = resultados['viavel'], resultados['pareto']
+    print(f"Configurações: {len(viavel):,} avaliadas, {viavel.sum():,} viáveis, {pareto.sum():,} na fronteira")
+    print()
+
+    cabecalho = (f"{'L':>3} {'W':>3} {'M':>3} {'Pipe':>5} {'B':>3} {'MHz':>6} {'Fmax*':>7} "
+                 f"{'GMAC/s':>8} {'pJ/MAC':>8} {'LEs':>6} {'9x9':>4}")
+    print(f"Fronteira de Pareto por largura do elemento (ordenada por vazão, até {args.linhas} linhas):")
+    print(cabecalho)
+    print("-" * len(cabecalho))
+    indices = np.flatnonzero(pareto)
+    indices = indices[np.lexsort((-resultados['throughput_gmacs'][indices], resultados['largura'][indices]))]
+
+    def linha(i: int) -> str:
+        r = resultados
+        return (f"{r['lanes'][i]:>3} {r['largura'][i]:>3} {r['multiplicadores'][i]:>3} "
+                f"{'sim' if r['pipeline'][i] else 'não':>5} {r['rajada'][i]:>3} {r['frequencia_mhz'][i]:>6.0f} "
+                f"{r['fmax_mhz'][i]:>7.1f} {r['throughput_gmacs'][i]:>8.3f} {r['energia_pj_mac'][i]:>8.1f} "
+                f"{r['logic_elements'][i]:>6} {r['multiplicadores_9x9'][i]:>4}")
+
+    for i in indices[:args.linhas]:
+        print(linha(i))
+    atual = _indice_configuracao(resultados, CONFIGURACAO_ATUAL)
+    if atual is not None:
+        print()
+        print("Configuração atual" + ("" if resultados['dentro_fmax'][atual] else " (clock acima do Fmax estimado)")
+              + ("" if viavel[atual] else " (inviável)") + ":")
+        print(linha(atual))
+
+    os.makedirs(args.saida_dir, exist_ok=True)
+    caminho_csv = os.path.join(args.saida_dir, 'exploracao_projeto.csv')
+    caminho_pareto = os.path.join(args.saida_dir, 'exploracao_projeto_pareto.csv')
+    salvar_csv(resultados, caminho_csv)
+    salvar_csv(resultados, caminho_pareto, somente_pareto=True)
+    print()
+    print(f"Dados salvos em: {caminho_csv} e {caminho_pareto}")
+    if not args.sem_graficos:
+        caminho_grafico = os.path.join(args.saida_dir, 'exploracao_projeto.png')
+        gerar_graficos(resultados, caminho_grafico)
+        print(f"Gráfico salvo em: {caminho_grafico}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
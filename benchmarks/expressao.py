@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Expressões Encadeadas com Avaliação Fundida
+Arquivo: expressao.py
+Descrição: API preguiçosa que registra operações de soma, subtração e
+           produto escalar sobre lotes de vetores e avalia o grafo inteiro
+           em uma única passada por blocos que cabem na cache, sem
+           intermediários do tamanho do lote
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Cada nó satura o seu resultado em 8 bits, exatamente como o hardware quando
+as operações são emitidas em sequência e os resultados voltam para a BRAM.
+Exemplo, para dot(sat(sat(a + b) - c), d):
+
+    expr = ((operando(a) + b) - c).produto_escalar(d)
+    resultado = expr.avaliar()
+"""
+
+import time
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import Dict, Union
+
+from processador_vetorial_sw import INT8_MAX, INT8_MIN, ProcessadorVetorialSW, wrap_24bit
+
+TAMANHO_BLOCO_PADRAO = 8192  # vetores por bloco (64 KiB por intermediário int16)
+
+
+class Expressao(ABC):
+    """
+    Nó de uma expressão vetorial. Os operadores + e - constroem nós de soma
+    e subtração com saturação; nada é calculado até avaliar().
+    """
+
+    n: int
+
+    # Faz o NumPy delegar a + expr e a - expr aos métodos refletidos
+    __array_ufunc__ = None
+
+    def __add__(self, outro) -> 'Soma':
+        return Soma(self, operando(outro))
+
+    def __radd__(self, outro) -> 'Soma':
+        return Soma(operando(outro), self)
+
+    def __sub__(self, outro) -> 'Subtracao':
+        return Subtracao(self, operando(outro))
+
+    def __rsub__(self, outro) -> 'Subtracao':
+        return Subtracao(operando(outro), self)
+
+    def produto_escalar(self, outro) -> 'ProdutoEscalar':
+        """Registra o produto escalar deste nó com outro operando."""
+        return ProdutoEscalar(self, operando(outro))
+
+    def _bloco(self, inicio: int, fim: int, memo: Dict[int, np.ndarray]) -> np.ndarray:
+        """Calcula as linhas [inicio, fim) do nó (int16), reaproveitando memo."""
+        chave = id(self)
+        if chave not in memo:
+            memo[chave] = self._calcular(inicio, fim, memo)
+        return memo[chave]
+
+    @abstractmethod
+    def _calcular(self, inicio: int, fim: int, memo: Dict[int, np.ndarray]) -> np.ndarray:
+        """Calcula as linhas [inicio, fim) do nó a partir dos filhos."""
+
+    def avaliar(self, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> np.ndarray:
+        """
+        Avalia a expressão em uma passada por blocos de vetores.
+
+        Args:
+            tamanho_bloco: Vetores processados por bloco
+
+        Returns:
+            Lote (N, 4) int8 para expressões vetoriais ou (N,) int32 para
+            produtos escalares
+        """
+        saida = self._alocar_saida()
+        for inicio in range(0, self.n, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, self.n)
+            saida[inicio:fim] = self._bloco(inicio, fim, {})
+        return saida
+
+    def _alocar_saida(self) -> np.ndarray:
+        return np.empty((self.n, 4), dtype=np.int8)
+
+
+class Operando(Expressao):
+    """Folha da expressão: um lote (N, 4) int8 ou um vetor (4,) replicado."""
+
+    def __init__(self, valores: np.ndarray):
+        valores = np.asarray(valores)
+        if valores.shape == (4,):
+            valores = valores[np.newaxis, :]
+            self.n = None
+        elif valores.ndim == 2 and valores.shape[1] == 4:
+            self.n = len(valores)
+        else:
+            raise ValueError(f"Esperado lote (N, 4) ou vetor (4,), recebido {valores.shape}")
+        self.valores = valores.astype(np.int8, copy=False)
+
+    def _calcular(self, inicio: int, fim: int, memo: Dict[int, np.ndarray]) -> np.ndarray:
+        if self.n is None:
+            return self.valores.astype(np.int16)
+        return self.valores[inicio:fim].astype(np.int16)
+
+
+class _Binaria(Expressao):
+    """Nó binário vetorial com saturação em 8 bits."""
+
+    def __init__(self, esquerda: Expressao, direita: Expressao):
+        for filho in (esquerda, direita):
+            if isinstance(filho, ProdutoEscalar):
+                raise TypeError("O resultado de um produto escalar não é um vetor de 4 elementos")
+        tamanhos = {filho.n for filho in (esquerda, direita)} - {None}
+        if len(tamanhos) > 1:
+            raise ValueError(f"Lotes com tamanhos diferentes: {sorted(tamanhos)}")
+        self.esquerda = esquerda
+        self.direita = direita
+        self.n = tamanhos.pop() if tamanhos else None
+
+    def avaliar(self, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> np.ndarray:
+        if self.n is None:
+            raise ValueError("A expressão precisa de ao menos um operando em lote")
+        return super().avaliar(tamanho_bloco)
+
+
+class Soma(_Binaria):
+    """Soma vetorial com saturação (AddSubClip8Bit com is_sub = '0')."""
+
+    def _calcular(self, inicio: int, fim: int, memo: Dict[int, np.ndarray]) -> np.ndarray:
+        resultado = self.esquerda._bloco(inicio, fim, memo) + self.direita._bloco(inicio, fim, memo)
+        return np.clip(resultado, INT8_MIN, INT8_MAX, out=resultado)
+
+
+class Subtracao(_Binaria):
+    """Subtração vetorial com saturação (AddSubClip8Bit com is_sub = '1')."""
+
+    def _calcular(self, inicio: int, fim: int, memo: Dict[int, np.ndarray]) -> np.ndarray:
+        resultado = self.esquerda._bloco(inicio, fim, memo) - self.direita._bloco(inicio, fim, memo)
+        return np.clip(resultado, INT8_MIN, INT8_MAX, out=resultado)
+
+
+class ProdutoEscalar(_Binaria):
+    """Produto escalar acumulado no Acumulador24Bit; sempre a raiz da expressão."""
+
+    def _calcular(self, inicio: int, fim: int, memo: Dict[int, np.ndarray]) -> np.ndarray:
+        produtos = self.esquerda._bloco(inicio, fim, memo) * self.direita._bloco(inicio, fim, memo)
+        return wrap_24bit(produtos.sum(axis=1, dtype=np.int32))
+
+    def _alocar_saida(self) -> np.ndarray:
+        return np.empty(self.n, dtype=np.int32)
+
+    def produto_escalar(self, outro):
+        raise TypeError("O resultado de um produto escalar não é um vetor de 4 elementos")
+
+
+def operando(valores: Union[Expressao, np.ndarray]) -> Expressao:
+    """
+    Converte um lote (N, 4), um vetor (4,) ou uma expressão em nó de expressão.
+
+    Args:
+        valores: Lote int8, vetor int8 replicado em todas as linhas ou expressão
+
+    Returns:
+        Nó de expressão
+    """
+    return valores if isinstance(valores, Expressao) else Operando(valores)
+
+
+def soma(a, b) -> Soma:
+    """Registra sat(a + b)."""
+    return operando(a) + b
+
+
+def subtracao(a, b) -> Subtracao:
+    """Registra sat(a - b)."""
+    return operando(a) - b
+
+
+def produto_escalar(a, b) -> ProdutoEscalar:
+    """Registra dot(a, b)."""
+    return operando(a).produto_escalar(b)
+
+
+def main():
+    """Função principal: compara a avaliação fundida com chamadas encadeadas."""
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - EXPRESSÕES FUNDIDAS")
+    print("=" * 80)
+    print()
+
+    n = 4_000_000
+    rng = np.random.default_rng(0)
+    a, b, c, d = (rng.integers(-128, 128, size=(n, 4), dtype=np.int8) for _ in range(4))
+    processador = ProcessadorVetorialSW()
+
+    inicio = time.perf_counter()
+    passo = processador.soma_vetorial_lote(a, b)
+    passo = processador.subtracao_vetorial_lote(passo, c)
+    esperado = processador.produto_escalar_lote(passo, d)
+    tempo_encadeado = time.perf_counter() - inicio
+
+    expr = produto_escalar(subtracao(soma(a, b), c), d)
+    inicio = time.perf_counter()
+    resultado = expr.avaliar()
+    tempo_fundido = time.perf_counter() - inicio
+
+    print(f"dot(sat(sat(a + b) - c), d) sobre {n:,} vetores:")
+    print(f"  Chamadas em lote encadeadas: {tempo_encadeado * 1e3:8.2f} ms")
+    print(f"  Avaliação fundida:           {tempo_fundido * 1e3:8.2f} ms")
+    print(f"  Resultados idênticos: {'SIM' if np.array_equal(resultado, esperado) else 'NÃO'}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
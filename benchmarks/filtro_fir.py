@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Filtro FIR / Convolução 1-D em Streaming
+Arquivo: filtro_fir.py
+Descrição: Filtro FIR sobre um fluxo de amostras int8 com a semântica do
+           processador (janelas de 4 elementos, filtros longos como produtos
+           escalares de 4 lanes encadeados no Acumulador24Bit), calculado
+           sobre janelas deslizantes sem cópia (stride tricks), e estimativa
+           dos ciclos do FPGA para a mesma carga em modo rajada
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Definição: y[n] = sum_k h[k] * x[n - k], com x[n] = 0 para n < 0 (filtro
+causal; a saída tem o mesmo comprimento da entrada e coincide com as
+primeiras amostras de np.convolve(x, h)). Um filtro de T coeficientes ocupa
+ceil(T/4) palavras de 4 lanes (as lanes excedentes com coeficiente zero).
+
+Como em produto_longo.py, no modo encadeado o resultado é o conteúdo do
+acumulador de 24 bits (wraparound), obtido reduzindo a soma exata uma única
+vez; no modo não encadeado o host soma os resultados parciais em 64 bits.
+Com deslocamento, a saída é requantizada para int8: deslocamento aritmético
+à direita e saturação em [-128, 127], como no AddSubClip8Bit.
+"""
+
+import argparse
+import time
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Optional
+
+from processador_vetorial_sw import INT8_MAX, INT8_MIN, wrap_24bit
+from produto_longo import LANES, validar_int8
+from simulador_fsmd import BRAM_PALAVRAS, VARIANTES_DOT, ciclos_por_operacao
+
+TAMANHO_BLOCO_PADRAO = 1 << 18  # amostras por bloco
+
+# Em rajada, janelas (A), coeficientes (B) e resultados dividem a BRAM
+PARES_POR_RAJADA = BRAM_PALAVRAS // 3
+
+# Bloco pequeno (primo, não alinhado às palavras) da conferência em main(),
+# para que o histórico entre blocos seja exercitado com qualquer --amostras
+TAMANHO_BLOCO_CONFERENCIA = 4099
+
+
+class FiltroFIR:
+    """
+    Filtro FIR em streaming: processar() recebe blocos consecutivos do fluxo
+    e guarda as últimas amostras necessárias para as janelas do bloco seguinte.
+    """
+
+    def __init__(self, coeficientes: np.ndarray, encadeado: bool = True,
+                 deslocamento: Optional[int] = None):
+        """
+        Args:
+            coeficientes: Coeficientes h[0..T-1] int8
+            encadeado: Semântica do acumulador (ver produto_longo.produto_escalar_longo)
+            deslocamento: Se definido, requantiza a saída para int8
+        """
+        (coeficientes,) = validar_int8(coeficientes)
+        if coeficientes.ndim != 1 or len(coeficientes) == 0:
+            raise ValueError("Os coeficientes devem formar um vetor não vazio")
+        self.taps = len(coeficientes)
+        self.palavras = -(-self.taps // LANES)
+        self.encadeado = encadeado
+        self.deslocamento = deslocamento
+        # Janela de 4 * palavras amostras, da mais antiga para a mais recente:
+        # coeficientes invertidos, com os zeros de completamento nas mais antigas
+        largura = self.palavras * LANES
+        self._nucleo = np.zeros(largura, dtype=np.int32)
+        self._nucleo[largura - self.taps:] = coeficientes[::-1]
+        self._historico = np.zeros(largura - 1, dtype=np.int32)
+
+    def processar(self, bloco: np.ndarray) -> np.ndarray:
+        """
+        Filtra o próximo bloco do fluxo.
+
+        Args:
+            bloco: Amostras (K,) int8
+
+        Returns:
+            Array (K,): int8 com deslocamento; senão int32 (encadeado) ou int64
+        """
+        (bloco,) = validar_int8(bloco)
+        if len(bloco) == 0:
+            tipo = np.int8 if self.deslocamento is not None else (np.int32 if self.encadeado else np.int64)
+            return np.zeros(0, dtype=tipo)
+        amostras = np.concatenate([self._historico, bloco.astype(np.int32)])
+        # (K, 4 * palavras) sem cópia: cada linha é uma visão da janela
+        janelas = sliding_window_view(amostras, len(self._nucleo))
+        somas = janelas @ self._nucleo  # exato: |soma| <= T * 2**14
+        self._historico = amostras[len(amostras) - len(self._historico):].copy()
+
+        if self.deslocamento is not None:
+            acumulador = wrap_24bit(somas) if self.encadeado else somas
+            return np.clip(acumulador >> self.deslocamento, INT8_MIN, INT8_MAX).astype(np.int8)
+        return wrap_24bit(somas) if self.encadeado else somas.astype(np.int64)
+
+
+def filtrar(sinal: np.ndarray, coeficientes: np.ndarray, encadeado: bool = True,
+            deslocamento: Optional[int] = None, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> np.ndarray:
+    """
+    Filtra um sinal inteiro em blocos (memória temporária limitada ao bloco).
+
+    Args:
+        sinal: Amostras (N,) int8
+        coeficientes: Coeficientes h[0..T-1] int8
+        encadeado: Semântica do acumulador
+        deslocamento: Se definido, requantiza a saída para int8
+        tamanho_bloco: Amostras por bloco
+
+    Returns:
+        Array (N,) com a saída do filtro
+    """
+    filtro = FiltroFIR(coeficientes, encadeado, deslocamento)
+    if len(sinal) <= tamanho_bloco:
+        return filtro.processar(sinal)
+    return np.concatenate([filtro.processar(sinal[inicio:inicio + tamanho_bloco])
+                           for inicio in range(0, len(sinal), tamanho_bloco)])
+
+
+def referencia_fir(sinal: np.ndarray, coeficientes: np.ndarray) -> np.ndarray:
+    """
+    Referência independente (np.convolve em int64, wraparound de 24 bits).
+
+    Args:
+        sinal: Amostras (N,) int8
+        coeficientes: Coeficientes h[0..T-1] int8
+
+    Returns:
+        Array (N,) int32 com o conteúdo do acumulador no modo encadeado
+    """
+    completa = np.convolve(np.asarray(sinal, dtype=np.int64), np.asarray(coeficientes, dtype=np.int64))
+    return wrap_24bit(completa[:len(sinal)])
+
+
+def estimar_ciclos_hw(n_amostras: int, taps: int, variante_dot: str = 'serial',
+                      pares_por_rajada: int = PARES_POR_RAJADA) -> Dict[str, float]:
+    """
+    Estima os ciclos do FPGA para filtrar n_amostras em modo rajada.
+
+    Cada amostra de saída custa ceil(T/4) produtos escalares de 4 lanes. As
+    janelas são escritas e os resultados lidos pela porta do host (1 ciclo
+    por palavra, com a FSM em IDLE); quando cada rajada contém um número
+    inteiro de filtros, as palavras de coeficientes ficam residentes na
+    região B da BRAM e não são reescritas. Em rajada o acumulador é zerado
+    a cada par, logo o host soma os parciais (modo não encadeado, idêntico
+    ao encadeado enquanto |y| < 2**23).
+
+    Args:
+        n_amostras: Amostras de saída
+        taps: Coeficientes do filtro
+        variante_dot: Datapath do produto escalar (chave de VARIANTES_DOT)
+        pares_por_rajada: Pares de palavras por rajada
+
+    Returns:
+        Dicionário com operações, rajadas, ciclos de computação, de
+        transferência, totais e por amostra (0 para n_amostras = 0)
+    """
+    if n_amostras < 0:
+        raise ValueError(f"n_amostras deve ser >= 0: {n_amostras}")
+    palavras = -(-taps // LANES)
+    residentes = palavras <= pares_por_rajada
+    if residentes:
+        pares_por_rajada -= pares_por_rajada % palavras
+    operacoes = n_amostras * palavras
+    rajadas, resto = divmod(operacoes, pares_por_rajada)
+
+    def ciclos_rajada(pares: int) -> int:
+        return ciclos_por_operacao(pares, variante_dot)['produto_escalar']
+
+    computacao = rajadas * ciclos_rajada(pares_por_rajada) + (ciclos_rajada(resto) if resto else 0)
+    # Escrita da janela (e dos coeficientes, se não residentes) + leitura do
+    # resultado; coeficientes residentes são escritos uma única vez
+    transferencia = operacoes * (2 if residentes else 3) + (pares_por_rajada if residentes and operacoes else 0)
+    total = computacao + transferencia
+    return {
+        'operacoes': operacoes,
+        'rajadas': rajadas + (1 if resto else 0),
+        'coeficientes_residentes': residentes,
+        'ciclos_computacao': computacao,
+        'ciclos_transferencia': transferencia,
+        'ciclos_total': total,
+        'ciclos_por_amostra': total / n_amostras if n_amostras else 0.0,
+    }
+
+
+def main():
+    """Função principal: mede o filtro em software e compara com a estimativa do FPGA."""
+    parser = argparse.ArgumentParser(description="Filtro FIR em streaming: software vs. estimativa do FPGA")
+    parser.add_argument('--amostras', type=int, default=4_000_000)
+    parser.add_argument('--taps', type=int, nargs='+', default=[4, 8, 16, 32, 64])
+    parser.add_argument('--frequencia', type=float, default=250.0, help="Clock do FPGA em MHz")
+    args = parser.parse_args()
+    if args.amostras < 1:
+        parser.error(f"--amostras deve ser >= 1: {args.amostras}")
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - FILTRO FIR EM STREAMING")
+    print("=" * 80)
+    print()
+
+    rng = np.random.default_rng(18)
+    sinal = rng.integers(-128, 128, size=args.amostras, dtype=np.int8)
+    print(f"Sinal: {args.amostras:,} amostras int8; FPGA a {args.frequencia:.0f} MHz em modo rajada")
+    print(f"(vazões em M amostras/s; ciclos por amostra incluem a transferência pela porta do host)")
+    print(f"(conferido: fluxo inteiro contra np.convolve, em blocos de {TAMANHO_BLOCO_PADRAO:,} e de "
+          f"{TAMANHO_BLOCO_CONFERENCIA:,} amostras)")
+    print()
+    cabecalho = f"{'Taps':>5} {'SW':>9} {'Conferido':>10}"
+    for variante in VARIANTES_DOT:
+        cabecalho += f" {variante:>17}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+
+    for taps in args.taps:
+        coeficientes = rng.integers(-128, 128, size=taps, dtype=np.int8)
+        inicio = time.perf_counter()
+        saida = filtrar(sinal, coeficientes)
+        tempo = time.perf_counter() - inicio
+        referencia = referencia_fir(sinal, coeficientes)
+        conferido = (np.array_equal(saida, referencia) and np.array_equal(
+            filtrar(sinal, coeficientes, tamanho_bloco=TAMANHO_BLOCO_CONFERENCIA), referencia))
+
+        linha = f"{taps:>5} {args.amostras / tempo / 1e6:>9.2f} {'OK' if conferido else 'FALHOU':>10}"
+        for variante in VARIANTES_DOT:
+            estimativa = estimar_ciclos_hw(args.amostras, taps, variante)
+            vazao = args.frequencia / estimativa['ciclos_por_amostra']
+            linha += f" {vazao:>8.2f} ({estimativa['ciclos_por_amostra']:>5.1f} c)"
+        print(linha)
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Instrumentação em Tempo de Execução
+Arquivo: instrumentacao.py
+Descrição: Contadores opcionais e de baixo custo para execuções de produção:
+           chamadas, vetores e lanes saturadas por operação de
+           ProcessadorVetorialSW, distribuição dos tamanhos de lote,
+           histogramas de latência log-lineares (estilo HDR) e ciclos por
+           estado da FSM em SimuladorFSMD, exportados em texto no formato do
+           Prometheus e em snapshots JSON
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Uso típico:
+
+    instrumentacao = Instrumentacao()
+    instrumentar(processador, instrumentacao)   # ProcessadorVetorialSW
+    simulador.instrumentacao = instrumentacao    # SimuladorFSMD
+    ...
+    instrumentacao.salvar_prometheus('processador.prom')
+    instrumentacao.salvar_json('processador.json')
+    instrumentar(processador, None)              # desliga
+
+Desligada, a instrumentação não custa nada no processador (instrumentar()
+troca os métodos da instância, os da classe ficam intactos) e custa um único
+teste `is not None` por ciclo no simulador, como o GravadorTrace. Todos os
+contadores são pré-alocados; registrar uma chamada só incrementa posições
+de listas Python.
+
+Histograma de latência: valores abaixo de 2^BITS_SUBBALDE ns têm um balde
+cada; acima, cada oitava [2^e, 2^(e+1)) é dividida em 2^BITS_SUBBALDE
+baldes iguais, o que limita o erro relativo dos percentis a 2^-BITS_SUBBALDE.
+"""
+
+import argparse
+import json
+import os
+import time
+import numpy as np
+from typing import Any, Dict, Optional, Sequence
+
+from processador_vetorial_sw import INT8_MAX, INT8_MIN, ProcessadorVetorialSW, desempacotar
+from simulador_fsmd import NOMES_ESTADOS, NUM_ESTADOS, OPERACOES, SimuladorFSMD
+
+# Métodos instrumentados: nome -> (operação, formato dos operandos), com
+# formato 'vetor' (um vetor de 4 elementos), 'lote' (N, 4) ou 'palavras'
+METODOS_INSTRUMENTADOS = {
+    'soma_vetorial': ('soma', 'vetor'),
+    'subtracao_vetorial': ('subtracao', 'vetor'),
+    'produto_escalar': ('produto_escalar', 'vetor'),
+    'soma_vetorial_lote': ('soma', 'lote'),
+    'subtracao_vetorial_lote': ('subtracao', 'lote'),
+    'produto_escalar_lote': ('produto_escalar', 'lote'),
+    'soma_vetorial_lut': ('soma', 'lote'),
+    'subtracao_vetorial_lut': ('subtracao', 'lote'),
+    'produto_escalar_lut': ('produto_escalar', 'lote'),
+    'soma_empacotada': ('soma', 'palavras'),
+    'subtracao_empacotada': ('subtracao', 'palavras'),
+    'produto_escalar_empacotado': ('produto_escalar', 'palavras'),
+}
+
+BITS_SUBBALDE = 4
+SUBBALDES = 1 << BITS_SUBBALDE
+BALDES_LATENCIA = 48 * SUBBALDES  # até 2^51 ns
+BALDES_LOTE = 64                  # balde k: 2^(k-1) <= lote < 2^k
+
+PERCENTIS = (50.0, 90.0, 99.0, 99.9)
+
+
+def balde_latencia(valor_ns: int) -> int:
+    """
+    Índice do balde log-linear de uma latência.
+
+    Args:
+        valor_ns: Latência em nanossegundos
+
+    Returns:
+        Índice em [0, BALDES_LATENCIA)
+    """
+    if valor_ns < SUBBALDES:
+        return max(valor_ns, 0)
+    expoente = valor_ns.bit_length() - 1 - BITS_SUBBALDE
+    return min(((expoente + 1) << BITS_SUBBALDE) + (valor_ns >> expoente) - SUBBALDES, BALDES_LATENCIA - 1)
+
+
+def limites_balde(balde: int) -> tuple:
+    """
+    Faixa de valores de um balde de latência.
+
+    Args:
+        balde: Índice do balde
+
+    Returns:
+        Tupla (menor, maior) valor em ns contido no balde
+    """
+    if balde < SUBBALDES:
+        return balde, balde
+    expoente = (balde >> BITS_SUBBALDE) - 1
+    menor = ((balde & (SUBBALDES - 1)) + SUBBALDES) << expoente
+    return menor, menor + (1 << expoente) - 1
+
+
+def _saturacoes(vec_a, vec_b, formato: str, subtrai: bool) -> int:
+    """
+    Conta as lanes em que o resultado exato sai de [-128, 127].
+
+    Vetores e palavras isolados são tratados em Python puro (em arrays de 4
+    elementos o custo fixo do NumPy domina); lotes, com NumPy.
+    """
+    if formato == 'palavras' and isinstance(vec_a, (int, np.integer)):
+        a = [((int(vec_a) >> s & 0xFF) ^ 0x80) - 0x80 for s in (0, 8, 16, 24)]
+        b = [((int(vec_b) >> s & 0xFF) ^ 0x80) - 0x80 for s in (0, 8, 16, 24)]
+    elif formato == 'vetor':
+        a = vec_a.tolist() if isinstance(vec_a, np.ndarray) else list(vec_a)
+        b = vec_b.tolist() if isinstance(vec_b, np.ndarray) else list(vec_b)
+    else:
+        if formato == 'palavras':
+            vec_a = desempacotar(np.atleast_1d(np.asarray(vec_a, dtype=np.uint32)))
+            vec_b = desempacotar(np.atleast_1d(np.asarray(vec_b, dtype=np.uint32)))
+        a = np.asarray(vec_a, dtype=np.int16)
+        exato = a - vec_b if subtrai else a + vec_b
+        return int(np.count_nonzero((exato > INT8_MAX) | (exato < INT8_MIN)))
+    if subtrai:
+        return sum(1 for x, y in zip(a, b) if not INT8_MIN <= x - y <= INT8_MAX)
+    return sum(1 for x, y in zip(a, b) if not INT8_MIN <= x + y <= INT8_MAX)
+
+
+class Instrumentacao:
+    """
+    Contadores pré-alocados de operações do processador em software e de
+    ciclos por estado da FSM.
+    """
+
+    def __init__(self, metodos: Sequence[str] = tuple(METODOS_INSTRUMENTADOS),
+                 contar_saturacoes: bool = False):
+        """
+        Args:
+            metodos: Métodos acompanhados (chaves de METODOS_INSTRUMENTADOS)
+            contar_saturacoes: Conta as lanes saturadas de soma/subtração;
+                desligado por padrão, pois recalcular o resultado exato (fora
+                do tempo medido) aproximadamente dobra o custo por chamada
+        """
+        self.metodos = tuple(metodos)
+        self.indice = {metodo: i for i, metodo in enumerate(self.metodos)}
+        self.contar_saturacoes = contar_saturacoes
+        self.inicio = time.time()
+        self.zerar()
+
+    def zerar(self):
+        """Zera todos os contadores (sem realocar os do simulador)."""
+        n = len(self.metodos)
+        self.chamadas = [0] * n
+        self.vetores = [0] * n
+        self.saturacoes = [0] * n
+        self.tempo_total_ns = [0] * n
+        self.latencia_maxima_ns = [0] * n
+        self.histograma_lote = [0] * (n * BALDES_LOTE)
+        self.histograma_latencia = [0] * (n * BALDES_LATENCIA)
+        self.ciclos_estado = np.zeros(NUM_ESTADOS, dtype=np.int64)
+        self.ciclos_simulados = 0
+
+    def registrar_chamada(self, indice: int, vetores: int, latencia_ns: int, saturacoes: int = 0):
+        """
+        Registra uma chamada de método.
+
+        Args:
+            indice: Índice do método em self.metodos
+            vetores: Vetores processados (tamanho do lote)
+            latencia_ns: Duração da chamada
+            saturacoes: Lanes saturadas
+        """
+        self.chamadas[indice] += 1
+        self.vetores[indice] += vetores
+        self.tempo_total_ns[indice] += latencia_ns
+        if saturacoes:
+            self.saturacoes[indice] += saturacoes
+        if latencia_ns > self.latencia_maxima_ns[indice]:
+            self.latencia_maxima_ns[indice] = latencia_ns
+        self.histograma_lote[indice * BALDES_LOTE + vetores.bit_length()] += 1
+        # balde_latencia() expandida: esta função roda a cada chamada medida
+        if latencia_ns < SUBBALDES:
+            balde = latencia_ns
+        else:
+            expoente = latencia_ns.bit_length() - 1 - BITS_SUBBALDE
+            balde = ((expoente + 1) << BITS_SUBBALDE) + (latencia_ns >> expoente) - SUBBALDES
+        self.histograma_latencia[indice * BALDES_LATENCIA + min(balde, BALDES_LATENCIA - 1)] += 1
+
+    def registrar_estados(self, estado: np.ndarray):
+        """
+        Acumula um ciclo do simulador: instâncias em cada estado da FSM.
+
+        Args:
+            estado: Array (N,) com o estado atual de cada instância
+        """
+        self.ciclos_estado += np.bincount(estado, minlength=NUM_ESTADOS)
+        self.ciclos_simulados += 1
+
+    def _baldes(self, histograma, indice: int, tamanho: int) -> np.ndarray:
+        return np.array(histograma[indice * tamanho:(indice + 1) * tamanho], dtype=np.int64)
+
+    def percentil(self, metodo: str, p: float) -> int:
+        """
+        Percentil da latência de um método (limite superior do balde).
+
+        Args:
+            metodo: Nome do método
+            p: Percentil em [0, 100]
+
+        Returns:
+            Latência em ns (0 sem chamadas)
+        """
+        indice = self.indice[metodo]
+        baldes = self._baldes(self.histograma_latencia, indice, BALDES_LATENCIA)
+        total = int(baldes.sum())
+        if total == 0:
+            return 0
+        posicao = max(int(np.ceil(p / 100 * total)), 1)
+        balde = int(np.searchsorted(np.cumsum(baldes), posicao))
+        return min(limites_balde(balde)[1], self.latencia_maxima_ns[indice])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Resume os contadores num dicionário serializável em JSON.
+
+        Returns:
+            Dicionário com 'metodos' (apenas os chamados) e 'fsm'
+        """
+        metodos = {}
+        for metodo, i in self.indice.items():
+            if not self.chamadas[i]:
+                continue
+            lote = self._baldes(self.histograma_lote, i, BALDES_LOTE)
+            latencia = self._baldes(self.histograma_latencia, i, BALDES_LATENCIA)
+            metodos[metodo] = {
+                'operacao': METODOS_INSTRUMENTADOS[metodo][0],
+                'chamadas': self.chamadas[i],
+                'vetores': self.vetores[i],
+                'saturacoes': self.saturacoes[i],
+                'tempo_total_ns': self.tempo_total_ns[i],
+                'latencia_ns': {
+                    'media': self.tempo_total_ns[i] / self.chamadas[i],
+                    **{f'p{p:g}': self.percentil(metodo, p) for p in PERCENTIS},
+                    'max': self.latencia_maxima_ns[i],
+                },
+                # Limite superior de cada balde não vazio -> chamadas
+                'histograma_lote': {str((1 << k) - 1): int(lote[k]) for k in np.flatnonzero(lote)},
+                'histograma_latencia_ns': {str(limites_balde(int(k))[1]): int(latencia[k])
+                                           for k in np.flatnonzero(latencia)},
+            }
+        return {
+            'timestamp': time.time(),
+            'inicio': self.inicio,
+            'metodos': metodos,
+            'fsm': {
+                'ciclos': self.ciclos_simulados,
+                'instancia_ciclos_por_estado': {NOMES_ESTADOS[k]: int(self.ciclos_estado[k])
+                                                for k in np.flatnonzero(self.ciclos_estado)},
+            },
+        }
+
+    def texto_prometheus(self, prefixo: str = 'processador_vetorial') -> str:
+        """
+        Formata os contadores no formato de texto do Prometheus.
+
+        O histograma de latência é exportado com baldes por oitava (le em
+        segundos) e os percentis do histograma log-linear como gauge.
+
+        Args:
+            prefixo: Prefixo dos nomes das métricas
+
+        Returns:
+            Texto para o textfile collector do node_exporter
+        """
+        linhas = []
+
+        def metrica(nome: str, tipo: str, ajuda: str):
+            linhas.append(f"# HELP {prefixo}_{nome} {ajuda}")
+            linhas.append(f"# TYPE {prefixo}_{nome} {tipo}")
+
+        chamados = [(metodo, i) for metodo, i in self.indice.items() if self.chamadas[i]]
+        rotulos = {metodo: f'metodo="{metodo}",operacao="{METODOS_INSTRUMENTADOS[metodo][0]}"'
+                   for metodo, _ in chamados}
+        for nome, contadores, ajuda in (
+                ('chamadas_total', self.chamadas, "Chamadas por método"),
+                ('vetores_total', self.vetores, "Vetores processados por método"),
+                ('lanes_saturadas_total', self.saturacoes, "Lanes saturadas (soma/subtração)")):
+            metrica(nome, 'counter', ajuda)
+            linhas += [f"{prefixo}_{nome}{{{rotulos[metodo]}}} {contadores[i]}" for metodo, i in chamados]
+
+        metrica('tamanho_lote', 'histogram', "Vetores por chamada")
+        for metodo, i in chamados:
+            acumulado = np.cumsum(self._baldes(self.histograma_lote, i, BALDES_LOTE))
+            for k in range(int(np.searchsorted(acumulado, acumulado[-1])) + 1):
+                linhas.append(f'{prefixo}_tamanho_lote_bucket{{{rotulos[metodo]},le="{(1 << k) - 1}"}} '
+                              f'{acumulado[k]}')
+            linhas.append(f'{prefixo}_tamanho_lote_bucket{{{rotulos[metodo]},le="+Inf"}} {self.chamadas[i]}')
+            linhas.append(f"{prefixo}_tamanho_lote_sum{{{rotulos[metodo]}}} {self.vetores[i]}")
+            linhas.append(f"{prefixo}_tamanho_lote_count{{{rotulos[metodo]}}} {self.chamadas[i]}")
+
+        metrica('latencia_segundos', 'histogram', "Duração das chamadas")
+        for metodo, i in chamados:
+            # Grupo e de SUBBALDES baldes: valores < 2^(e+4) ns (2^(e + BITS_SUBBALDE))
+            baldes = self._baldes(self.histograma_latencia, i, BALDES_LATENCIA)
+            oitavas = np.add.reduceat(baldes, np.arange(0, BALDES_LATENCIA, SUBBALDES))
+            acumulado = np.cumsum(oitavas)
+            for e in range(int(np.searchsorted(acumulado, acumulado[-1])) + 1):
+                limite = (1 << (e + BITS_SUBBALDE)) * 1e-9
+                linhas.append(f'{prefixo}_latencia_segundos_bucket{{{rotulos[metodo]},le="{limite:.9g}"}} '
+                              f'{acumulado[e]}')
+            linhas.append(f'{prefixo}_latencia_segundos_bucket{{{rotulos[metodo]},le="+Inf"}} {self.chamadas[i]}')
+            linhas.append(f"{prefixo}_latencia_segundos_sum{{{rotulos[metodo]}}} {self.tempo_total_ns[i] * 1e-9:.9g}")
+            linhas.append(f"{prefixo}_latencia_segundos_count{{{rotulos[metodo]}}} {self.chamadas[i]}")
+
+        metrica('latencia_percentil_segundos', 'gauge', "Percentis da latência (histograma log-linear)")
+        for metodo, _ in chamados:
+            for p in PERCENTIS:
+                linhas.append(f'{prefixo}_latencia_percentil_segundos{{{rotulos[metodo]},quantile="{p / 100:g}"}} '
+                              f'{self.percentil(metodo, p) * 1e-9:.9g}')
+
+        metrica('fsm_ciclos_total', 'counter', "Ciclos simulados")
+        linhas.append(f"{prefixo}_fsm_ciclos_total {self.ciclos_simulados}")
+        metrica('fsm_instancia_ciclos_total', 'counter', "Instância-ciclos por estado da FSM")
+        linhas += [f'{prefixo}_fsm_instancia_ciclos_total{{estado="{nome}"}} {int(ciclos)}'
+                   for nome, ciclos in zip(NOMES_ESTADOS, self.ciclos_estado) if ciclos]
+        return "\n".join(linhas) + "\n"
+
+    @staticmethod
+    def _escrever_atomico(caminho: str, conteudo: str):
+        """Escreve num arquivo temporário e renomeia (leitores nunca veem o arquivo pela metade)."""
+        temporario = f"{caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            f.write(conteudo)
+        os.replace(temporario, caminho)
+
+    def salvar_prometheus(self, caminho: str, prefixo: str = 'processador_vetorial'):
+        """Grava texto_prometheus() em `caminho` (ex.: diretório do textfile collector)."""
+        self._escrever_atomico(caminho, self.texto_prometheus(prefixo))
+
+    def salvar_json(self, caminho: str):
+        """Grava snapshot() em `caminho`."""
+        self._escrever_atomico(caminho, json.dumps(self.snapshot(), indent=2))
+
+
+def instrumentar(processador: ProcessadorVetorialSW, instrumentacao: Optional[Instrumentacao]):
+    """
+    Liga ou desliga a instrumentação de uma instância do processador.
+
+    Ligar instala na instância versões dos métodos que medem cada chamada;
+    desligar (instrumentacao=None) as remove, voltando aos métodos da classe.
+
+    Args:
+        processador: Instância de ProcessadorVetorialSW
+        instrumentacao: Contadores a alimentar, ou None para desligar
+    """
+    for metodo in METODOS_INSTRUMENTADOS:
+        processador.__dict__.pop(metodo, None)
+    if instrumentacao is None:
+        return
+    relogio = time.perf_counter_ns
+    for metodo, indice in instrumentacao.indice.items():
+        operacao, formato = METODOS_INSTRUMENTADOS[metodo]
+        conta_saturacao = instrumentacao.contar_saturacoes and operacao != 'produto_escalar'
+        subtrai = operacao == 'subtracao'
+
+        def envoltorio(vec_a, vec_b, _original=getattr(processador, metodo), _indice=indice,
+                       _formato=formato, _conta_saturacao=conta_saturacao, _subtrai=subtrai):
+            inicio = relogio()
+            resultado = _original(vec_a, vec_b)
+            latencia = relogio() - inicio
+            if _formato == 'vetor':
+                vetores = 1
+            elif _formato == 'lote':
+                vetores = len(vec_a)
+            else:
+                vetores = 1 if isinstance(vec_a, int) else int(np.size(vec_a))
+            saturacoes = _saturacoes(vec_a, vec_b, _formato, _subtrai) if _conta_saturacao else 0
+            instrumentacao.registrar_chamada(_indice, vetores, latencia, saturacoes)
+            return resultado
+
+        setattr(processador, metodo, envoltorio)
+
+
+# Métodos exercitados por main(): (lote, LUT, palavras) por operação
+METODOS_POR_OPERACAO = {
+    'soma': ('soma_vetorial_lote', 'soma_vetorial_lut', 'soma_empacotada'),
+    'subtracao': ('subtracao_vetorial_lote', 'subtracao_vetorial_lut', 'subtracao_empacotada'),
+    'produto_escalar': ('produto_escalar_lote', 'produto_escalar_lut', 'produto_escalar_empacotado'),
+}
+
+
+def main():
+    """Função principal: carga de exemplo instrumentada, custo e exportação."""
+    parser = argparse.ArgumentParser(description="Instrumentação do processador vetorial em software")
+    parser.add_argument('--saida-dir', default='.', help="Diretório dos arquivos .prom e .json")
+    parser.add_argument('--chamadas', type=int, default=20_000, help="Chamadas de vetor isolado por operação")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - INSTRUMENTAÇÃO EM TEMPO DE EXECUÇÃO")
+    print("=" * 80)
+    print()
+
+    rng = np.random.default_rng(22)
+    processador = ProcessadorVetorialSW()
+    vec_a = np.array([100, -100, 30, 40], dtype=np.int8)
+    vec_b = np.array([50, 60, -128, 20], dtype=np.int8)
+
+    def cronometrar() -> float:
+        # Menor de 5 repetições: a média é sensível a ruído do sistema
+        tempos = []
+        for _ in range(5):
+            inicio = time.perf_counter()
+            for _ in range(args.chamadas):
+                processador.soma_vetorial(vec_a, vec_b)
+            tempos.append(time.perf_counter() - inicio)
+        return min(tempos) / args.chamadas * 1e9
+
+    sem = cronometrar()
+    instrumentacao = Instrumentacao(contar_saturacoes=True)
+    instrumentar(processador, Instrumentacao())
+    com = cronometrar()
+    instrumentar(processador, instrumentacao)
+    com_saturacoes = cronometrar()
+    instrumentar(processador, None)
+    desligada = cronometrar()
+    instrumentacao.zerar()
+    print(f"soma_vetorial (vetor isolado): {sem:.0f} ns sem instrumentação, {com:.0f} ns ligada, "
+          f"{desligada:.0f} ns desligada")
+    print(f"  contando saturações (contar_saturacoes=True): {com_saturacoes:.0f} ns")
+
+    # Carga mista: lotes de tamanhos variados, LUT, palavras e o simulador
+    instrumentar(processador, instrumentacao)
+    for operacao in ('soma', 'subtracao', 'produto_escalar'):
+        for tamanho in rng.integers(1, 1 << 16, size=200):
+            lote_a = rng.integers(-128, 128, size=(tamanho, 4), dtype=np.int8)
+            lote_b = rng.integers(-128, 128, size=(tamanho, 4), dtype=np.int8)
+            getattr(processador, METODOS_POR_OPERACAO[operacao][0])(lote_a, lote_b)
+            getattr(processador, METODOS_POR_OPERACAO[operacao][1])(lote_a, lote_b)
+        palavras = rng.integers(0, 1 << 32, size=(2, 1000), dtype=np.uint32)
+        for palavra_a, palavra_b in zip(*palavras.tolist()):
+            getattr(processador, METODOS_POR_OPERACAO[operacao][2])(palavra_a, palavra_b)
+
+    simulador = SimuladorFSMD(1000)
+
+    def carga_simulador() -> float:
+        simulador.reset()
+        inicio = time.perf_counter()
+        for codigo in OPERACOES.values():
+            simulador.executar(codigo)
+            simulador.configurar_burst(0, 8, 16, 8)
+            simulador.executar(codigo, burst=True)
+        return time.perf_counter() - inicio
+
+    tempo_sem = carga_simulador()
+    simulador.instrumentacao = instrumentacao
+    tempo_com = carga_simulador()
+    simulador.instrumentacao = None
+    print(f"SimuladorFSMD (1.000 instâncias, mesma carga): {tempo_sem * 1e3:.2f} ms sem, "
+          f"{tempo_com * 1e3:.2f} ms com contadores por estado")
+    print()
+
+    resumo = instrumentacao.snapshot()
+    print(f"{'Método':<28} {'Chamadas':>9} {'Vetores':>12} {'Saturadas':>10} {'p50 (µs)':>9} {'p99 (µs)':>9}")
+    print("-" * 82)
+    for metodo, m in resumo['metodos'].items():
+        print(f"{metodo:<28} {m['chamadas']:>9,} {m['vetores']:>12,} {m['saturacoes']:>10,} "
+              f"{m['latencia_ns']['p50'] / 1e3:>9.2f} {m['latencia_ns']['p99'] / 1e3:>9.2f}")
+    print()
+    print("Instância-ciclos por estado da FSM:")
+    for estado, ciclos in resumo['fsm']['instancia_ciclos_por_estado'].items():
+        print(f"  {estado:<18} {ciclos:>10,}")
+    print()
+
+    os.makedirs(args.saida_dir, exist_ok=True)
+    caminho_prom = os.path.join(args.saida_dir, 'processador_vetorial.prom')
+    caminho_json = os.path.join(args.saida_dir, 'processador_vetorial.json')
+    instrumentacao.salvar_prometheus(caminho_prom)
+    instrumentacao.salvar_json(caminho_json)
+    print(f"Métricas: {caminho_prom} (Prometheus), {caminho_json} (JSON)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
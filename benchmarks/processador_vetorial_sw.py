@@ -8,21 +8,266 @@ Autor: Equipe Processador Vetorial - INE5406
 Data: 26/11/2025
 """
 
+import argparse
+import functools
 import numpy as np
 import time
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional, Union
+
+# Limites do AddSubClip8Bit (signed 8 bits) e largura do Acumulador24Bit
+INT8_MIN = -128
+INT8_MAX = 127
+ACC_BITS = 24
+
+
+def wrap_24bit(valores: np.ndarray) -> np.ndarray:
+    """
+    Reduz valores inteiros ao intervalo de um registrador signed de 24 bits,
+    reproduzindo o overflow (wraparound) do Acumulador24Bit.
+    
+    Args:
+        valores: Array de inteiros (qualquer largura)
+        
+    Returns:
+        Array int32 com os valores em complemento de dois de 24 bits
+    """
+    return wrap_acumulador(valores, ACC_BITS)
+
+
+def wrap_acumulador(valores: np.ndarray, bits: int) -> np.ndarray:
+    """
+    Reduz valores inteiros ao intervalo de um acumulador signed de 1 a 64 bits.
+    
+    Args:
+        valores: Array de inteiros (qualquer largura)
+        bits: Largura do acumulador
+        
+    Returns:
+        Array int32 (bits <= 32) ou int64 com os valores em complemento de dois
+    """
+    valores = np.asarray(valores)
+    if bits == 64:
+        return valores.astype(np.int64, copy=False)
+    tipo = np.int32 if bits <= 32 else np.int64
+    if valores.dtype == tipo:
+        if bits == 32:
+            return valores
+        # Como 2**bits divide 2**32 (ou 2**64), o overflow em (valores + meio)
+        # não altera os bits menos significativos
+        meio = tipo(1 << (bits - 1))
+        return ((valores + meio) & tipo((1 << bits) - 1)) - meio
+    # Demais tipos: aritmética módulo 2**64 em uint64, onde meio e a máscara
+    # sempre cabem
+    meio = np.uint64(1 << (bits - 1))
+    reduzidos = ((valores.astype(np.uint64) + meio) & np.uint64((1 << bits) - 1)) - meio
+    return reduzidos.view(np.int64).astype(tipo, copy=False)
+
+
+def _como_lote(vetores: np.ndarray, lanes: int = 4, tipo: np.dtype = np.int8) -> np.ndarray:
+    """Valida e converte um lote de vetores para o formato (N, lanes) do tipo indicado."""
+    lote = np.asarray(vetores)
+    if lote.ndim != 2 or lote.shape[1] != lanes:
+        raise ValueError(f"Esperado lote com formato (N, {lanes}), recebido {lote.shape}")
+    return lote.astype(tipo, copy=False)
+
+
+# -----------------------------------------------------------------------------
+# Formato empacotado: um vetor de 4 x int8 por palavra de 32 bits, como na
+# BRAMDualPort (DATA_WIDTH=32). O elemento i ocupa os bits 8*i+7 downto 8*i,
+# isto é, o byte i em little-endian.
+# -----------------------------------------------------------------------------
+
+PALAVRA_DTYPE = np.dtype('<u4')
+
+_MASCARA_SINAL = np.uint32(0x80808080)
+_MASCARA_MAGNITUDE = np.uint32(0x7F7F7F7F)
+_MAXIMO_LANES = np.uint32(0x7F7F7F7F)
+
+PalavrasEmpacotadas = Union[int, np.ndarray]
+
+
+def empacotar(lote: np.ndarray) -> np.ndarray:
+    """
+    Converte um lote (N, 4) int8 em N palavras de 32 bits no layout da BRAM.
+    
+    Quando o lote já é contíguo em int8 o resultado é uma view (sem cópia).
+    
+    Args:
+        lote: Lote com formato (N, 4) (int8)
+        
+    Returns:
+        Array (N,) de palavras uint32 little-endian
+    """
+    lote = np.ascontiguousarray(_como_lote(lote))
+    return lote.view(PALAVRA_DTYPE).reshape(lote.shape[0])
+
+
+def desempacotar(palavras: np.ndarray) -> np.ndarray:
+    """
+    Converte palavras de 32 bits no layout da BRAM em um lote (N, 4) int8.
+    
+    Args:
+        palavras: Array (N,) de palavras uint32 little-endian
+        
+    Returns:
+        View (N, 4) int8 sobre o mesmo buffer quando possível
+    """
+    palavras = np.ascontiguousarray(palavras, dtype=PALAVRA_DTYPE).reshape(-1)
+    return palavras.view(np.int8).reshape(-1, 4)
+
+
+def carregar_palavras(caminho: str) -> np.ndarray:
+    """
+    Mapeia em memória um arquivo binário de palavras de 32 bits (dump da BRAM
+    ou arquivo de estímulos) sem copiá-lo.
+    
+    Args:
+        caminho: Caminho do arquivo binário little-endian
+        
+    Returns:
+        np.memmap somente leitura com dtype uint32 little-endian
+    """
+    return np.memmap(caminho, dtype=PALAVRA_DTYPE, mode='r')
+
+
+# -----------------------------------------------------------------------------
+# Tabelas de consulta (LUT): como os operandos têm 8 bits, todo o espaço de
+# operandos de cada operador cabe em uma tabela de 256 x 256 entradas,
+# indexada por (a como uint8) << 8 | (b como uint8).
+# -----------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def tabelas_lut() -> Dict[str, np.ndarray]:
+    """
+    Constrói (uma única vez) as tabelas de soma, subtração e produto.
+    
+    Returns:
+        Dicionário com 'soma' e 'subtracao' (65.536 int8, saturadas) e
+        'produto' (65.536 int16, Multiplicador8x8)
+    """
+    valores = np.arange(-128, 128, dtype=np.int16)
+    a = np.repeat(valores, 256)
+    b = np.tile(valores, 256)
+    # A ordem de valores (-128..127) difere da ordem dos índices uint8
+    # (0..255); roll alinha as duas para que o índice seja o padrão de bits
+    ordem = np.roll(np.arange(256), 128)
+    indice = (ordem[:, np.newaxis] * 256 + ordem[np.newaxis, :]).ravel()
+    tabelas = {
+        'soma': np.clip(a + b, INT8_MIN, INT8_MAX).astype(np.int8),
+        'subtracao': np.clip(a - b, INT8_MIN, INT8_MAX).astype(np.int8),
+        'produto': a * b,
+    }
+    for nome, tabela in tabelas.items():
+        tabela = tabela[indice]
+        tabela.flags.writeable = False
+        tabelas[nome] = tabela
+    return tabelas
+
+
+def indice_lut(lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+    """
+    Calcula o índice nas tabelas LUT para cada par de elementos.
+    
+    Args:
+        lote_a: Operandos A (int8)
+        lote_b: Operandos B (int8)
+        
+    Returns:
+        Índices uint16 com o mesmo formato dos operandos
+    """
+    indice = np.asarray(lote_a, dtype=np.int8).view(np.uint8).astype(np.uint16) << 8
+    indice |= np.asarray(lote_b, dtype=np.int8).view(np.uint8)
+    return indice
+
+
+def _saturar_swar(a: np.ndarray, resultado: np.ndarray, overflow: np.ndarray) -> np.ndarray:
+    """Substitui as lanes com overflow por 0x7F ou 0x80 conforme o sinal de A."""
+    mascara = (overflow >> np.uint32(7)) * np.uint32(0xFF)
+    saturado = _MAXIMO_LANES + ((a & _MASCARA_SINAL) >> np.uint32(7))
+    return (resultado & ~mascara) | (saturado & mascara)
+
+
+def soma_swar(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Soma com saturação lane a lane sobre palavras empacotadas (SWAR).
+    
+    O bit de sinal de cada lane é tratado à parte para que o carry não
+    se propague entre lanes; o overflow ocorre quando A e B têm o mesmo
+    sinal e o resultado tem sinal diferente.
+    
+    Args:
+        a: Palavras uint32 do operando A
+        b: Palavras uint32 do operando B
+        
+    Returns:
+        Palavras uint32 com o resultado saturado
+    """
+    soma = ((a & _MASCARA_MAGNITUDE) + (b & _MASCARA_MAGNITUDE)) ^ ((a ^ b) & _MASCARA_SINAL)
+    overflow = ~(a ^ b) & (a ^ soma) & _MASCARA_SINAL
+    return _saturar_swar(a, soma, overflow)
+
+
+def subtracao_swar(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Subtração com saturação lane a lane sobre palavras empacotadas (SWAR).
+    
+    Cada lane de A recebe o bit de sinal ligado antes da subtração para
+    absorver o empréstimo; o overflow ocorre quando A e B têm sinais
+    diferentes e o resultado tem sinal diferente de A.
+    
+    Args:
+        a: Palavras uint32 do operando A
+        b: Palavras uint32 do operando B
+        
+    Returns:
+        Palavras uint32 com o resultado saturado
+    """
+    diferenca = ((a | _MASCARA_SINAL) - (b & _MASCARA_MAGNITUDE)) ^ (~(a ^ b) & _MASCARA_SINAL)
+    overflow = (a ^ b) & (a ^ diferenca) & _MASCARA_SINAL
+    return _saturar_swar(a, diferenca, overflow)
+
+
+def produto_escalar_swar(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Produto escalar sobre palavras empacotadas.
+    
+    Cada lane é extraída por deslocamento aritmético da palavra vista como
+    int32 (sem passar por um lote int8) e os quatro produtos são acumulados
+    como no Acumulador24Bit.
+    
+    Args:
+        a: Palavras uint32 do operando A
+        b: Palavras uint32 do operando B
+        
+    Returns:
+        Array int32 com os produtos escalares
+    """
+    a = np.asarray(a, dtype=np.uint32).view(np.int32)
+    b = np.asarray(b, dtype=np.uint32).view(np.int32)
+    acumulador = np.zeros(a.shape, dtype=np.int32)
+    for lane in range(4):
+        deslocamento = 24 - 8 * lane
+        acumulador += ((a << deslocamento) >> 24) * ((b << deslocamento) >> 24)
+    return wrap_24bit(acumulador)
+
 
 class ProcessadorVetorialSW:
     """
     Implementação em software do processador vetorial de 4 elementos.
     Suporta operações de SOMA, SUBTRAÇÃO e PRODUTO ESCALAR em vetores
     de 4 elementos com inteiros de 8 bits com sinal.
+    
+    Os métodos com sufixo _lote operam sobre lotes (N, 4) inteiros numa
+    única passada vetorizada, com a mesma semântica bit a bit dos métodos
+    escalares. Os métodos com sufixo _empacotada/_empacotado recebem e
+    devolvem palavras de 32 bits no layout da BRAM (ver empacotar), e os
+    métodos com sufixo _lut consultam tabelas pré-calculadas (ver tabelas_lut).
     """
     
     def __init__(self):
         """Inicializa o processador vetorial."""
-        self.min_val = -128  # Mínimo para int8
-        self.max_val = 127   # Máximo para int8
+        self.min_val = INT8_MIN  # Mínimo para int8
+        self.max_val = INT8_MAX  # Máximo para int8
     
     def saturate(self, value: int) -> int:
         """
@@ -91,6 +336,399 @@ class ProcessadorVetorialSW:
             produto = int(vec_a[i]) * int(vec_b[i])
             acumulador += produto
         return acumulador
+    
+    def soma_vetorial_lote(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza a soma vetorial com saturação sobre um lote de vetores.
+        
+        Os operandos são promovidos uma única vez para int16 (equivalente ao
+        resultado de 9 bits do AddSubClip8Bit) e saturados com np.clip.
+        
+        Args:
+            lote_a: Lote A com formato (N, 4) (int8)
+            lote_b: Lote B com formato (N, 4) (int8)
+            
+        Returns:
+            Lote resultado com formato (N, 4) (int8)
+        """
+        soma = _como_lote(lote_a).astype(np.int16) + _como_lote(lote_b)
+        return np.clip(soma, self.min_val, self.max_val).astype(np.int8)
+    
+    def subtracao_vetorial_lote(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza a subtração vetorial com saturação sobre um lote de vetores.
+        
+        Args:
+            lote_a: Lote A com formato (N, 4) (int8)
+            lote_b: Lote B com formato (N, 4) (int8)
+            
+        Returns:
+            Lote resultado com formato (N, 4) (int8)
+        """
+        sub = _como_lote(lote_a).astype(np.int16) - _como_lote(lote_b)
+        return np.clip(sub, self.min_val, self.max_val).astype(np.int8)
+    
+    def produto_escalar_lote(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza o produto escalar de cada par de vetores de um lote.
+        
+        Os quatro produtos de 16 bits (Multiplicador8x8) são somados em int32
+        e reduzidos a 24 bits como no Acumulador24Bit. Com 4 elementos int8 a
+        soma nunca ultrapassa 24 bits, portanto o resultado coincide com
+        produto_escalar.
+        
+        Args:
+            lote_a: Lote A com formato (N, 4) (int8)
+            lote_b: Lote B com formato (N, 4) (int8)
+            
+        Returns:
+            Array com formato (N,) contendo os produtos escalares (int32)
+        """
+        produtos = _como_lote(lote_a).astype(np.int16) * _como_lote(lote_b)
+        return wrap_24bit(produtos.sum(axis=1, dtype=np.int32))
+    
+    def soma_vetorial_lut(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza a soma vetorial com saturação por consulta à tabela (LUT).
+        
+        Args:
+            lote_a: Lote A com formato (N, 4) (int8)
+            lote_b: Lote B com formato (N, 4) (int8)
+            
+        Returns:
+            Lote resultado com formato (N, 4) (int8)
+        """
+        return tabelas_lut()['soma'][indice_lut(_como_lote(lote_a), _como_lote(lote_b))]
+    
+    def subtracao_vetorial_lut(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza a subtração vetorial com saturação por consulta à tabela (LUT).
+        
+        Args:
+            lote_a: Lote A com formato (N, 4) (int8)
+            lote_b: Lote B com formato (N, 4) (int8)
+            
+        Returns:
+            Lote resultado com formato (N, 4) (int8)
+        """
+        return tabelas_lut()['subtracao'][indice_lut(_como_lote(lote_a), _como_lote(lote_b))]
+    
+    def produto_escalar_lut(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza o produto escalar com os produtos obtidos da tabela (LUT).
+        
+        Args:
+            lote_a: Lote A com formato (N, 4) (int8)
+            lote_b: Lote B com formato (N, 4) (int8)
+            
+        Returns:
+            Array com formato (N,) contendo os produtos escalares (int32)
+        """
+        produtos = tabelas_lut()['produto'][indice_lut(_como_lote(lote_a), _como_lote(lote_b))]
+        return wrap_24bit(produtos.sum(axis=1, dtype=np.int32))
+    
+    @staticmethod
+    def _executar_empacotado(kernel, palavras_a: PalavrasEmpacotadas,
+                             palavras_b: PalavrasEmpacotadas):
+        """Aplica um kernel SWAR a palavras isoladas (int) ou a arrays."""
+        escalar = isinstance(palavras_a, (int, np.integer)) and isinstance(palavras_b, (int, np.integer))
+        resultado = kernel(np.asarray(palavras_a, dtype=np.uint32),
+                           np.asarray(palavras_b, dtype=np.uint32))
+        return int(resultado) if escalar else resultado
+    
+    def soma_empacotada(self, palavras_a: PalavrasEmpacotadas,
+                        palavras_b: PalavrasEmpacotadas) -> PalavrasEmpacotadas:
+        """
+        Realiza a soma vetorial com saturação sobre palavras de 32 bits.
+        
+        Args:
+            palavras_a: Palavra (int) ou array de palavras uint32 do vetor A
+            palavras_b: Palavra (int) ou array de palavras uint32 do vetor B
+            
+        Returns:
+            Palavra(s) de 32 bits no layout da BRAM
+        """
+        return self._executar_empacotado(soma_swar, palavras_a, palavras_b)
+    
+    def subtracao_empacotada(self, palavras_a: PalavrasEmpacotadas,
+                             palavras_b: PalavrasEmpacotadas) -> PalavrasEmpacotadas:
+        """
+        Realiza a subtração vetorial com saturação sobre palavras de 32 bits.
+        
+        Args:
+            palavras_a: Palavra (int) ou array de palavras uint32 do vetor A
+            palavras_b: Palavra (int) ou array de palavras uint32 do vetor B
+            
+        Returns:
+            Palavra(s) de 32 bits no layout da BRAM
+        """
+        return self._executar_empacotado(subtracao_swar, palavras_a, palavras_b)
+    
+    def produto_escalar_empacotado(self, palavras_a: PalavrasEmpacotadas,
+                                   palavras_b: PalavrasEmpacotadas) -> PalavrasEmpacotadas:
+        """
+        Realiza o produto escalar sobre palavras de 32 bits.
+        
+        Args:
+            palavras_a: Palavra (int) ou array de palavras uint32 do vetor A
+            palavras_b: Palavra (int) ou array de palavras uint32 do vetor B
+            
+        Returns:
+            Produto(s) escalar(es) com sinal (int ou array int32)
+        """
+        return self._executar_empacotado(produto_escalar_swar, palavras_a, palavras_b)
+
+
+class ProcessadorVetorialEscalar:
+    """
+    Caminho rápido para operações isoladas de 4 elementos, sem NumPy.
+    
+    Recebe e devolve tuplas de 4 ints ou palavras de 32 bits (int) no
+    layout da BRAM. A saturação é uma consulta a uma tupla pré-calculada
+    indexada pelo resultado de 9 bits, e os laços são desenrolados.
+    """
+    
+    __slots__ = ('_saturacao', '_sinal')
+    
+    # Deslocamento que leva o resultado de 9 bits (-256..255) para índice >= 0
+    _OFFSET = 256
+    
+    def __init__(self):
+        """Pré-calcula as tabelas de saturação e de extensão de sinal."""
+        self._saturacao = tuple(
+            max(INT8_MIN, min(INT8_MAX, valor)) for valor in range(-self._OFFSET, self._OFFSET)
+        )
+        self._sinal = tuple(byte - 256 if byte > INT8_MAX else byte for byte in range(256))
+    
+    def soma(self, vec_a: Tuple[int, int, int, int],
+             vec_b: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+        """
+        Soma vetorial com saturação de dois vetores de 4 ints.
+        
+        Args:
+            vec_a: Vetor A (4 ints na faixa int8)
+            vec_b: Vetor B (4 ints na faixa int8)
+            
+        Returns:
+            Tupla com o resultado saturado
+        """
+        s, o = self._saturacao, self._OFFSET
+        a0, a1, a2, a3 = vec_a
+        b0, b1, b2, b3 = vec_b
+        return (s[a0 + b0 + o], s[a1 + b1 + o], s[a2 + b2 + o], s[a3 + b3 + o])
+    
+    def subtracao(self, vec_a: Tuple[int, int, int, int],
+                  vec_b: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+        """
+        Subtração vetorial com saturação de dois vetores de 4 ints.
+        
+        Args:
+            vec_a: Vetor A (4 ints na faixa int8)
+            vec_b: Vetor B (4 ints na faixa int8)
+            
+        Returns:
+            Tupla com o resultado saturado
+        """
+        s, o = self._saturacao, self._OFFSET
+        a0, a1, a2, a3 = vec_a
+        b0, b1, b2, b3 = vec_b
+        return (s[a0 - b0 + o], s[a1 - b1 + o], s[a2 - b2 + o], s[a3 - b3 + o])
+    
+    def produto_escalar(self, vec_a: Tuple[int, int, int, int],
+                        vec_b: Tuple[int, int, int, int]) -> int:
+        """
+        Produto escalar de dois vetores de 4 ints.
+        
+        Com 4 elementos int8 o resultado cabe em 24 bits, portanto o
+        acumulador não sofre overflow.
+        
+        Args:
+            vec_a: Vetor A (4 ints na faixa int8)
+            vec_b: Vetor B (4 ints na faixa int8)
+            
+        Returns:
+            Produto escalar
+        """
+        a0, a1, a2, a3 = vec_a
+        b0, b1, b2, b3 = vec_b
+        return a0 * b0 + a1 * b1 + a2 * b2 + a3 * b3
+    
+    def soma_empacotada(self, palavra_a: int, palavra_b: int) -> int:
+        """
+        Soma com saturação de duas palavras de 32 bits (SWAR em int Python).
+        
+        Args:
+            palavra_a: Palavra do vetor A
+            palavra_b: Palavra do vetor B
+            
+        Returns:
+            Palavra de 32 bits com o resultado
+        """
+        soma = ((palavra_a & 0x7F7F7F7F) + (palavra_b & 0x7F7F7F7F)) ^ ((palavra_a ^ palavra_b) & 0x80808080)
+        overflow = ~(palavra_a ^ palavra_b) & (palavra_a ^ soma) & 0x80808080
+        if not overflow:
+            return soma
+        mascara = (overflow >> 7) * 0xFF
+        saturado = 0x7F7F7F7F + ((palavra_a & 0x80808080) >> 7)
+        return (soma & ~mascara) | (saturado & mascara)
+    
+    def subtracao_empacotada(self, palavra_a: int, palavra_b: int) -> int:
+        """
+        Subtração com saturação de duas palavras de 32 bits (SWAR em int Python).
+        
+        Args:
+            palavra_a: Palavra do vetor A
+            palavra_b: Palavra do vetor B
+            
+        Returns:
+            Palavra de 32 bits com o resultado
+        """
+        diferenca = (((palavra_a | 0x80808080) - (palavra_b & 0x7F7F7F7F))
+                     ^ (~(palavra_a ^ palavra_b) & 0x80808080))
+        overflow = (palavra_a ^ palavra_b) & (palavra_a ^ diferenca) & 0x80808080
+        if not overflow:
+            return diferenca
+        mascara = (overflow >> 7) * 0xFF
+        saturado = 0x7F7F7F7F + ((palavra_a & 0x80808080) >> 7)
+        return (diferenca & ~mascara) | (saturado & mascara)
+    
+    def produto_escalar_empacotado(self, palavra_a: int, palavra_b: int) -> int:
+        """
+        Produto escalar de duas palavras de 32 bits.
+        
+        Args:
+            palavra_a: Palavra do vetor A
+            palavra_b: Palavra do vetor B
+            
+        Returns:
+            Produto escalar
+        """
+        s = self._sinal
+        return (s[palavra_a & 0xFF] * s[palavra_b & 0xFF]
+                + s[(palavra_a >> 8) & 0xFF] * s[(palavra_b >> 8) & 0xFF]
+                + s[(palavra_a >> 16) & 0xFF] * s[(palavra_b >> 16) & 0xFF]
+                + s[palavra_a >> 24] * s[palavra_b >> 24])
+
+
+# Configurações avaliadas: nome -> (lanes, largura do elemento em bits);
+# '4x8' é o processador atual (palavra de 32 bits, Acumulador24Bit)
+CONFIGURACOES_SIMD = {
+    '4x8': (4, 8),
+    '8x8': (8, 8),
+    '4x16': (4, 16),
+    '8x4': (8, 4),
+}
+
+
+def largura_acumulador_padrao(lanes: int, largura: int) -> int:
+    """
+    Largura do acumulador para uma configuração: produto + soma das lanes +
+    6 bits de folga (a mesma regra de exploracao_projeto; 24 para 4 x int8).
+    
+    Args:
+        lanes: Elementos por vetor
+        largura: Largura do elemento em bits
+        
+    Returns:
+        Largura do acumulador em bits
+    """
+    return 2 * largura + (lanes - 1).bit_length() + 6
+
+
+class ProcessadorSIMD:
+    """
+    Processador vetorial em software parametrizado por número de lanes,
+    largura do elemento e largura do acumulador.
+    
+    Mesma semântica de ProcessadorVetorialSW para qualquer configuração:
+    soma e subtração saturam em [-2^(W-1), 2^(W-1) - 1] (AddSubClip de W
+    bits) e o produto escalar é reduzido à largura do acumulador
+    (wraparound). Os operandos devem estar na faixa de W bits; com
+    ProcessadorSIMD(4, 8, 24) os resultados coincidem bit a bit com os
+    métodos _lote de ProcessadorVetorialSW.
+    """
+    
+    def __init__(self, lanes: int = 4, largura: int = 8, largura_acc: Optional[int] = None):
+        """
+        Args:
+            lanes: Elementos por vetor
+            largura: Largura do elemento em bits (2 a 32)
+            largura_acc: Largura do acumulador em bits (até 64); padrão em
+                largura_acumulador_padrao
+        """
+        if largura_acc is None:
+            largura_acc = largura_acumulador_padrao(lanes, largura)
+        if lanes < 1 or not 2 <= largura <= 32 or not 1 <= largura_acc <= 64:
+            raise ValueError(f"Configuração inválida: {lanes} lanes, {largura} bits, "
+                             f"acumulador de {largura_acc} bits")
+        self.lanes = lanes
+        self.largura = largura
+        self.largura_acc = largura_acc
+        self.min_val = -(1 << (largura - 1))
+        self.max_val = (1 << (largura - 1)) - 1
+        # Menores tipos NumPy que comportam o elemento, o resultado de W + 1
+        # bits da soma/subtração e a soma das lanes do produto escalar
+        self.tipo_elemento = np.min_scalar_type(self.min_val)
+        self.tipo_soma = np.min_scalar_type(-(1 << largura))
+        largura_soma_produtos = 2 * largura + (lanes - 1).bit_length()
+        self.tipo_produto = np.int32 if largura_soma_produtos <= 31 else np.int64
+    
+    def __repr__(self) -> str:
+        return f"ProcessadorSIMD({self.lanes}x{self.largura}, acc={self.largura_acc})"
+    
+    def _operandos(self, lote_a: np.ndarray, lote_b: np.ndarray, tipo: np.dtype) -> Tuple[np.ndarray, np.ndarray]:
+        """Valida os lotes (N, lanes) e promove A para o tipo do cálculo."""
+        lote_a = _como_lote(lote_a, self.lanes, self.tipo_elemento)
+        lote_b = _como_lote(lote_b, self.lanes, self.tipo_elemento)
+        return lote_a.astype(tipo), lote_b
+    
+    def soma_vetorial_lote(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza a soma vetorial com saturação sobre um lote de vetores.
+        
+        Args:
+            lote_a: Lote A com formato (N, lanes)
+            lote_b: Lote B com formato (N, lanes)
+            
+        Returns:
+            Lote resultado com formato (N, lanes) no tipo do elemento
+        """
+        a, b = self._operandos(lote_a, lote_b, self.tipo_soma)
+        return np.clip(a + b, self.min_val, self.max_val).astype(self.tipo_elemento)
+    
+    def subtracao_vetorial_lote(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza a subtração vetorial com saturação sobre um lote de vetores.
+        
+        Args:
+            lote_a: Lote A com formato (N, lanes)
+            lote_b: Lote B com formato (N, lanes)
+            
+        Returns:
+            Lote resultado com formato (N, lanes) no tipo do elemento
+        """
+        a, b = self._operandos(lote_a, lote_b, self.tipo_soma)
+        return np.clip(a - b, self.min_val, self.max_val).astype(self.tipo_elemento)
+    
+    def produto_escalar_lote(self, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Realiza o produto escalar de cada par de vetores de um lote.
+        
+        Produtos e soma das lanes são calculados numa única passada
+        (np.einsum, cerca de 2x mais rápido que multiplicar e depois somar),
+        em int32 quando cabe (2W + log2(lanes) <= 31 bits) ou senão em
+        int64, e reduzidos à largura do acumulador.
+        
+        Args:
+            lote_a: Lote A com formato (N, lanes)
+            lote_b: Lote B com formato (N, lanes)
+            
+        Returns:
+            Array (N,) int32 (acumulador de até 32 bits) ou int64
+        """
+        a, b = self._operandos(lote_a, lote_b, self.tipo_produto)
+        somas = np.einsum('ij,ij->i', a, b.astype(self.tipo_produto, copy=False))
+        return wrap_acumulador(somas, self.largura_acc)
 
 
 def benchmark_operacao(processador: ProcessadorVetorialSW, 
@@ -111,24 +749,21 @@ def benchmark_operacao(processador: ProcessadorVetorialSW,
     Returns:
         Tupla com (tempo_medio_por_operacao_us, resultado)
     """
+    # Resolve o método uma única vez, fora do laço cronometrado
+    funcao = {
+        'soma': processador.soma_vetorial,
+        'subtracao': processador.subtracao_vetorial,
+        'produto_escalar': processador.produto_escalar,
+    }[operacao]
+    
     # Aquecimento
     for _ in range(100):
-        if operacao == 'soma':
-            _ = processador.soma_vetorial(vec_a, vec_b)
-        elif operacao == 'subtracao':
-            _ = processador.subtracao_vetorial(vec_a, vec_b)
-        elif operacao == 'produto_escalar':
-            _ = processador.produto_escalar(vec_a, vec_b)
+        resultado = funcao(vec_a, vec_b)
     
     # Benchmark
     inicio = time.perf_counter()
     for _ in range(num_iteracoes):
-        if operacao == 'soma':
-            resultado = processador.soma_vetorial(vec_a, vec_b)
-        elif operacao == 'subtracao':
-            resultado = processador.subtracao_vetorial(vec_a, vec_b)
-        elif operacao == 'produto_escalar':
-            resultado = processador.produto_escalar(vec_a, vec_b)
+        resultado = funcao(vec_a, vec_b)
     fim = time.perf_counter()
     
     tempo_total = fim - inicio
@@ -139,6 +774,11 @@ def benchmark_operacao(processador: ProcessadorVetorialSW,
 
 def main():
     """Função principal para executar os benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark do processador vetorial em software")
+    parser.add_argument('--saida', default='benchmark_sw_resultados.txt',
+                        help="Arquivo de resultados (padrão: %(default)s)")
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("PROCESSADOR VETORIAL - BENCHMARK SOFTWARE")
     print("=" * 80)
@@ -190,7 +830,7 @@ def main():
     print()
     
     # Salvar resultados em arquivo
-    with open('/home/ubuntu/benchmark_sw_resultados.txt', 'w') as f:
+    with open(args.saida, 'w', encoding='utf-8') as f:
         f.write("PROCESSADOR VETORIAL - RESULTADOS BENCHMARK SOFTWARE\n")
         f.write("=" * 80 + "\n\n")
         f.write(f"Número de iterações: {num_iteracoes:,}\n\n")
@@ -205,7 +845,7 @@ def main():
         f.write(f"  Throughput: {1e6/tempo_dot:.2f} ops/s\n")
     
     print("=" * 80)
-    print("Resultados salvos em: benchmark_sw_resultados.txt")
+    print(f"Resultados salvos em: {args.saida}")
     print("=" * 80)
 
 
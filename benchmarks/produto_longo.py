@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Produto Escalar Longo, GEMV e GEMM
+Arquivo: produto_longo.py
+Descrição: Produto escalar de vetores int8 de comprimento arbitrário e
+           produtos matriz-vetor / matriz-matriz, com o resultado que o FPGA
+           produziria encadeando operações de 4 lanes no Acumulador24Bit
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Modelo de execução: um vetor de K elementos é dividido em ceil(K/4) palavras
+de 4 lanes (a última completada com zeros). No modo encadeado o acumulador
+não é zerado entre as palavras, de modo que cada produto de 16 bits é somado
+ao registrador de 24 bits com wraparound. Como a soma em complemento de dois
+é módulo 2**24, acumular em inteiros largos e reduzir a 24 bits uma única vez
+no final produz exatamente o mesmo valor. No modo não encadeado cada palavra
+é uma operação independente (acumulador zerado, sem overflow possível) e o
+host soma os resultados em 64 bits.
+
+Os produtos matriciais são calculados em float64 por blocos de linhas x
+redução x colunas, o que permite usar BLAS: cada soma parcial é um inteiro
+de módulo até ELEMENTOS_BLOCO * 2**14 < 2**53, portanto representado
+exatamente, e os blocos são somados em int64. Cada bloco (de A, de B e do
+resultado) tem até ELEMENTOS_BLOCO elementos, de modo que a memória
+temporária não depende do tamanho das matrizes.
+"""
+
+import time
+import numpy as np
+from typing import Tuple
+
+from processador_vetorial_sw import wrap_24bit
+
+LANES = 4
+# Elementos por bloco: o temporário int32 do produto escalar em lote (1 MiB)
+# e cada bloco float64 dos produtos matriciais (2 MiB) cabem na cache L2
+ELEMENTOS_BLOCO = 1 << 18
+# Lado dos blocos quadrados de redução x colunas do GEMM
+LADO_BLOCO = 1 << 9
+
+
+def _completar_lanes(x: np.ndarray) -> np.ndarray:
+    """Completa a última dimensão com zeros até um múltiplo de 4 lanes."""
+    resto = (-x.shape[-1]) % LANES
+    if resto == 0:
+        return x
+    largura = [(0, 0)] * (x.ndim - 1) + [(0, resto)]
+    return np.pad(x, largura)
+
+
+def validar_int8(*arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Converte os operandos para int8, rejeitando valores fora da faixa."""
+    resultado = []
+    for x in arrays:
+        x = np.asarray(x)
+        if x.dtype != np.int8:
+            if x.size and (x.min() < -128 or x.max() > 127):
+                raise ValueError("Operandos devem estar na faixa int8 [-128, 127]")
+            x = x.astype(np.int8)
+        resultado.append(x)
+    return tuple(resultado)
+
+
+def _matmul_exato(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Produto matricial exato de operandos int8 com acumulação em int64.
+
+    Args:
+        a: Matriz (M, K) int8
+        b: Matriz (K, N) int8
+
+    Returns:
+        Matriz (M, N) int64
+    """
+    m, k = a.shape
+    n = b.shape[1]
+    # Blocos de A (linhas x redução), B (redução x colunas) e do resultado
+    # com até ELEMENTOS_BLOCO elementos; com uma coluna (GEMV) a redução
+    # ocupa o bloco inteiro
+    colunas = max(1, min(n, LADO_BLOCO))
+    reducao = max(1, min(k, ELEMENTOS_BLOCO // colunas))
+    linhas = max(1, ELEMENTOS_BLOCO // max(reducao, colunas))
+    resultado = np.zeros((m, n), dtype=np.int64)
+    for j in range(0, n, colunas):
+        for p in range(0, k, reducao):
+            bloco_b = b[p:p + reducao, j:j + colunas].astype(np.float64)
+            for i in range(0, m, linhas):
+                parcial = a[i:i + linhas, p:p + reducao].astype(np.float64) @ bloco_b
+                resultado[i:i + linhas, j:j + colunas] += parcial.astype(np.int64)
+    return resultado
+
+
+def _reduzir(somas: np.ndarray, encadeado: bool) -> np.ndarray:
+    """Aplica a semântica do acumulador ao resultado exato."""
+    return wrap_24bit(somas) if encadeado else somas
+
+
+def produto_escalar_longo(vec_a: np.ndarray, vec_b: np.ndarray, encadeado: bool = True) -> np.ndarray:
+    """
+    Produto escalar de vetores int8 de comprimento arbitrário.
+
+    Args:
+        vec_a: Vetor (K,) ou lote (N, K) int8
+        vec_b: Vetor (K,) ou lote (N, K) int8
+        encadeado: True se o acumulador de 24 bits não é zerado entre as
+            palavras de 4 lanes; False se o host soma os resultados parciais
+
+    Returns:
+        Escalar (int) para vetores ou array (N,) para lotes; int32 quando
+        encadeado, int64 caso contrário
+    """
+    vec_a, vec_b = validar_int8(vec_a, vec_b)
+    if vec_a.shape != vec_b.shape:
+        raise ValueError(f"Formatos incompatíveis: {vec_a.shape} e {vec_b.shape}")
+    lote_a = np.atleast_2d(vec_a)
+    lote_b = np.atleast_2d(vec_b)
+    # Soma das linhas de A * B: produto elemento a elemento exato em int32,
+    # em blocos de linhas x colunas com até ELEMENTOS_BLOCO elementos
+    n, k = lote_a.shape
+    colunas = max(1, min(k, ELEMENTOS_BLOCO))
+    linhas = max(1, ELEMENTOS_BLOCO // colunas)
+    somas = np.zeros(n, dtype=np.int64)
+    for i in range(0, n, linhas):
+        for j in range(0, k, colunas):
+            produtos = lote_a[i:i + linhas, j:j + colunas].astype(np.int32) * lote_b[i:i + linhas, j:j + colunas]
+            somas[i:i + linhas] += produtos.sum(axis=1, dtype=np.int64)
+    resultado = _reduzir(somas, encadeado)
+    return resultado[0].item() if vec_a.ndim == 1 else resultado
+
+
+def gemv(matriz: np.ndarray, vetor: np.ndarray, encadeado: bool = True) -> np.ndarray:
+    """
+    Produto matriz-vetor: cada linha da matriz é um produto escalar longo.
+
+    Args:
+        matriz: Matriz (M, K) int8
+        vetor: Vetor (K,) int8
+        encadeado: Semântica do acumulador (ver produto_escalar_longo)
+
+    Returns:
+        Array (M,) com os resultados do acumulador
+    """
+    matriz, vetor = validar_int8(matriz, vetor)
+    if matriz.ndim != 2 or vetor.shape != (matriz.shape[1],):
+        raise ValueError(f"Formatos incompatíveis: {matriz.shape} e {vetor.shape}")
+    return _reduzir(_matmul_exato(matriz, vetor[:, np.newaxis])[:, 0], encadeado)
+
+
+def gemm(a: np.ndarray, b: np.ndarray, encadeado: bool = True) -> np.ndarray:
+    """
+    Produto matriz-matriz: cada elemento é um produto escalar longo entre uma
+    linha de A e uma coluna de B.
+
+    Args:
+        a: Matriz (M, K) int8
+        b: Matriz (K, N) int8
+        encadeado: Semântica do acumulador (ver produto_escalar_longo)
+
+    Returns:
+        Matriz (M, N) com os resultados do acumulador
+    """
+    a, b = validar_int8(a, b)
+    if a.ndim != 2 or b.ndim != 2 or a.shape[1] != b.shape[0]:
+        raise ValueError(f"Formatos incompatíveis: {a.shape} e {b.shape}")
+    return _reduzir(_matmul_exato(a, b), encadeado)
+
+
+def ciclos_gemv(m: int, k: int, ciclos_produto_escalar: int) -> int:
+    """
+    Estima os ciclos do FPGA para um GEMV executado como sequência de
+    produtos escalares de 4 lanes.
+
+    Args:
+        m: Linhas da matriz
+        k: Comprimento das linhas
+        ciclos_produto_escalar: Ciclos de uma operação de produto escalar
+
+    Returns:
+        Número total de ciclos
+    """
+    return m * (-(-k // LANES)) * ciclos_produto_escalar
+
+
+def referencia_encadeada(vec_a: np.ndarray, vec_b: np.ndarray) -> int:
+    """
+    Modelo de referência lento: percorre as palavras de 4 lanes somando cada
+    produto ao registrador de 24 bits com wraparound.
+
+    Args:
+        vec_a: Vetor (K,) int8
+        vec_b: Vetor (K,) int8
+
+    Returns:
+        Conteúdo final do acumulador
+    """
+    palavras_a = _completar_lanes(np.asarray(vec_a, dtype=np.int8)).reshape(-1, LANES)
+    palavras_b = _completar_lanes(np.asarray(vec_b, dtype=np.int8)).reshape(-1, LANES)
+    acumulador = np.zeros(1, dtype=np.int32)
+    for palavra_a, palavra_b in zip(palavras_a, palavras_b):
+        for lane in range(LANES):
+            acumulador = wrap_24bit(acumulador + int(palavra_a[lane]) * int(palavra_b[lane]))
+    return int(acumulador[0])
+
+
+def main():
+    """Função principal: valida contra a referência e mede o GEMV."""
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - PRODUTO ESCALAR LONGO / GEMV")
+    print("=" * 80)
+    print()
+
+    rng = np.random.default_rng(0)
+
+    # Vetores longos de valores extremos forçam o wraparound de 24 bits
+    vec_a = np.full(1027, -128, dtype=np.int8)
+    vec_b = np.full(1027, -128, dtype=np.int8)
+    print("Wraparound (1027 x (-128 * -128)):")
+    print(f"  Encadeado (24 bits): {produto_escalar_longo(vec_a, vec_b)}")
+    print(f"  Referência:          {referencia_encadeada(vec_a, vec_b)}")
+    print(f"  Não encadeado:       {produto_escalar_longo(vec_a, vec_b, encadeado=False)}")
+    print()
+
+    m, k = 4096, 4096
+    matriz = rng.integers(-128, 128, size=(m, k), dtype=np.int8)
+    vetor = rng.integers(-128, 128, size=k, dtype=np.int8)
+    gemv(matriz, vetor)
+    inicio = time.perf_counter()
+    resultado = gemv(matriz, vetor)
+    tempo = time.perf_counter() - inicio
+    amostra = rng.choice(m, size=8, replace=False)
+    corretos = all(resultado[i] == referencia_encadeada(matriz[i], vetor) for i in amostra)
+    print(f"GEMV {m}x{k}:")
+    print(f"  Tempo: {tempo * 1e3:.2f} ms ({2 * m * k / tempo / 1e9:.2f} GOPS)")
+    print(f"  Amostra conferida com a referência: {'OK' if corretos else 'FALHOU'}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
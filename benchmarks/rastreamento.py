@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Gravação de Traces dos Modelos de Simulação
+Arquivo: rastreamento.py
+Descrição: Grava, ciclo a ciclo, o estado da FSM, os sinais de controle e os
+           valores do datapath de SimuladorFSMD em buffers circulares NumPy
+           pré-alocados, exporta VCD (abre no GTKWave ao lado da forma de onda
+           do GHDL) e localiza o primeiro ciclo divergente entre dois traces
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Cada amostra contém os valores presentes durante o ciclo, antes da borda de
+subida que o encerra, com os nomes dos sinais do RTL (estado_atual,
+bram_we, acc_en, mux_sel, reg_a_out, acc_out, ...). Uso típico:
+
+    gravador = GravadorTrace(instancias=[0, 7], caminho_vcd='modelo.vcd')
+    simulador.gravador = gravador
+    ...  # simulação
+    gravador.fechar()
+
+Para comparar com o GHDL, gere um VCD com `ghdl -r ... --vcd=ghdl.vcd` e use
+primeira_divergencia(gravador.colunas(), ler_vcd('ghdl.vcd')): os sinais do
+VCD são associados aos do trace pelo último componente do nome.
+"""
+
+import argparse
+import time
+import numpy as np
+from typing import Dict, IO, List, Optional, Sequence, Tuple
+
+# Sinais gravados: nome -> largura em bits (ordem de exibição no VCD)
+SINAIS_TRACE: Dict[str, int] = {
+    'rst': 1,
+    'start': 1,
+    'burst': 1,
+    'op_sel': 2,
+    'estado_atual': 5,
+    'done': 1,
+    'bram_addr_a': 5,
+    'bram_addr_b': 5,
+    'bram_we': 1,
+    'reg_a_load': 1,
+    'reg_b_load': 1,
+    'acc_rst': 1,
+    'acc_en': 1,
+    'mux_sel': 2,
+    'bram_val_a': 32,
+    'bram_val_b': 32,
+    'reg_a_out': 32,
+    'reg_b_out': 32,
+    'acc_out': 24,
+    'mux_out': 32,
+}
+
+CAPACIDADE_PADRAO = 4096  # ciclos por buffer circular
+
+
+def _dtype_largura(largura: int) -> np.dtype:
+    """Menor dtype inteiro que comporta o sinal (acc_out é armazenado com sinal)."""
+    return np.dtype(np.uint8 if largura <= 8 else np.int64)
+
+
+class EscritorVCD:
+    """Escreve um VCD incrementalmente, emitindo apenas os valores que mudam."""
+
+    def __init__(self, arquivo: IO[str], instancias: Sequence[int], periodo_ns: int = 10,
+                 sinais: Optional[Dict[str, int]] = None):
+        """
+        Escreve o cabeçalho do VCD.
+
+        Args:
+            arquivo: Arquivo texto aberto para escrita
+            instancias: Instâncias gravadas (um escopo por instância)
+            periodo_ns: Período do clock; o ciclo k termina na borda de subida
+                em k * periodo_ns + periodo_ns / 2, como em um testbench com
+                clk iniciando em '0'
+            sinais: Nome -> largura dos sinais (padrão: SINAIS_TRACE)
+        """
+        self.arquivo = arquivo
+        self.periodo_ns = periodo_ns
+        self.sinais = dict(SINAIS_TRACE if sinais is None else sinais)
+        self.mascaras = {nome: (1 << largura) - 1 for nome, largura in self.sinais.items()}
+        self._ids: Dict[Tuple[int, str], str] = {}
+        self._anteriores: Optional[Dict[str, np.ndarray]] = None
+        self._meio = periodo_ns // 2
+        self._ultimo_ciclo: Optional[int] = None
+
+        contador = 0
+        linhas = ["$version rastreamento.py (Processador Vetorial) $end",
+                  "$timescale 1ns $end",
+                  "$scope module simulador_fsmd $end",
+                  f"$var wire 1 {self._identificador(contador)} clk $end"]
+        self._id_clk = self._identificador(contador)
+        for coluna, instancia in enumerate(instancias):
+            linhas.append(f"$scope module instancia_{instancia} $end")
+            for nome, largura in self.sinais.items():
+                contador += 1
+                identificador = self._identificador(contador)
+                self._ids[(coluna, nome)] = identificador
+                intervalo = f" [{largura - 1}:0]" if largura > 1 else ""
+                linhas.append(f"$var wire {largura} {identificador} {nome}{intervalo} $end")
+            linhas.append("$upscope $end")
+        linhas += ["$upscope $end", "$enddefinitions $end"]
+        self.arquivo.write("\n".join(linhas) + "\n")
+
+    @staticmethod
+    def _identificador(indice: int) -> str:
+        """Identificador VCD curto com caracteres ASCII imprimíveis (! a ~)."""
+        caracteres = []
+        while True:
+            indice, resto = divmod(indice, 94)
+            caracteres.append(chr(33 + resto))
+            if indice == 0:
+                return "".join(caracteres)
+            indice -= 1
+
+    def _valor(self, nome: str, valor: int, identificador: str) -> str:
+        if self.sinais[nome] == 1:
+            return f"{valor}{identificador}"
+        return f"b{valor:b} {identificador}"
+
+    def escrever(self, ciclos: np.ndarray, colunas: Dict[str, np.ndarray]):
+        """
+        Escreve um bloco de ciclos consecutivos.
+
+        Args:
+            ciclos: Array (K,) com o número de cada ciclo
+            colunas: Nome -> array (K, instâncias) com os valores
+        """
+        valores = {nome: colunas[nome].astype(np.int64) & mascara
+                   for nome, mascara in self.mascaras.items()}
+        if self._anteriores is None:
+            mudou = {nome: np.ones_like(v, dtype=bool) for nome, v in valores.items()}
+        else:
+            mudou = {nome: v != np.vstack([self._anteriores[nome], v[:-1]])
+                     for nome, v in valores.items()}
+        self._anteriores = {nome: v[-1:] for nome, v in valores.items()}
+
+        linhas: List[str] = []
+        for k, ciclo in enumerate(ciclos.tolist()):
+            # Os valores do ciclo surgem na borda de subida que encerra o anterior
+            tempo = ciclo * self.periodo_ns
+            if tempo:
+                linhas += [f"#{tempo - self._meio}", f"1{self._id_clk}"]
+            else:
+                linhas += ["#0", f"0{self._id_clk}"]
+            for nome, v in valores.items():
+                for coluna in np.flatnonzero(mudou[nome][k]).tolist():
+                    linhas.append(self._valor(nome, int(v[k, coluna]), self._ids[(coluna, nome)]))
+            if tempo:
+                linhas += [f"#{tempo}", f"0{self._id_clk}"]
+            self._ultimo_ciclo = ciclo
+        self.arquivo.write("\n".join(linhas) + "\n")
+
+    def finalizar(self):
+        """Escreve a borda de subida que encerra o último ciclo gravado."""
+        if self._ultimo_ciclo is not None:
+            self.arquivo.write(f"#{self._ultimo_ciclo * self.periodo_ns + self._meio}\n1{self._id_clk}\n")
+
+
+class GravadorTrace:
+    """
+    Gravador de traces para SimuladorFSMD em buffers circulares colunares.
+
+    Cada sinal ocupa um array (capacidade, instâncias) pré-alocado; gravar
+    um ciclo é uma cópia por sinal, sem alocação. Sem VCD, o buffer guarda os
+    últimos `capacidade` ciclos. Com caminho_vcd, cada buffer cheio é
+    descarregado no arquivo antes de ser sobrescrito, de modo que o VCD cobre
+    a simulação inteira com memória constante.
+    """
+
+    def __init__(self, instancias: Sequence[int] = (0,), capacidade: int = CAPACIDADE_PADRAO,
+                 caminho_vcd: Optional[str] = None, periodo_ns: int = 10):
+        """
+        Args:
+            instancias: Índices das instâncias do simulador a gravar
+            capacidade: Ciclos por buffer circular
+            caminho_vcd: Arquivo VCD gerado incrementalmente (opcional)
+            periodo_ns: Período do clock no VCD
+        """
+        self.instancias = np.asarray(instancias, dtype=np.intp)
+        self.capacidade = capacidade
+        self.ciclos = np.zeros(capacidade, dtype=np.int64)
+        self.buffers = {nome: np.zeros((capacidade, len(self.instancias)), dtype=_dtype_largura(largura))
+                        for nome, largura in SINAIS_TRACE.items()}
+        self.total = 0          # ciclos gravados desde o início
+        self._descarregados = 0  # ciclos já escritos no VCD
+        self._arquivo_vcd = open(caminho_vcd, 'w') if caminho_vcd else None
+        self._escritor = (EscritorVCD(self._arquivo_vcd, instancias, periodo_ns)
+                          if self._arquivo_vcd else None)
+
+    def registrar(self, ciclo: int, valores: Dict[str, np.ndarray]):
+        """
+        Grava um ciclo (chamado por SimuladorFSMD.passo antes da borda).
+
+        Args:
+            ciclo: Número do ciclo
+            valores: Nome do sinal -> array (N,) com os valores de todas as instâncias
+        """
+        if self._escritor is not None and self.total - self._descarregados == self.capacidade:
+            self._descarregar()
+        posicao = self.total % self.capacidade
+        self.ciclos[posicao] = ciclo
+        for nome, buffer in self.buffers.items():
+            buffer[posicao] = valores[nome][self.instancias]
+        self.total += 1
+
+    def _ordem(self, inicio: int) -> np.ndarray:
+        """Posições do buffer, em ordem cronológica, dos ciclos gravados desde `inicio`."""
+        inicio = max(inicio, self.total - self.capacidade)
+        return np.arange(inicio, self.total) % self.capacidade
+
+    def _descarregar(self):
+        """Escreve no VCD os ciclos ainda não descarregados."""
+        ordem = self._ordem(self._descarregados)
+        if len(ordem):
+            self._escritor.escrever(self.ciclos[ordem], {nome: b[ordem] for nome, b in self.buffers.items()})
+        self._descarregados = self.total
+
+    def colunas(self, instancia: int = 0) -> Dict[str, np.ndarray]:
+        """
+        Retorna os ciclos retidos de uma instância gravada, em ordem cronológica.
+
+        Args:
+            instancia: Posição em `instancias` (não o índice no simulador)
+
+        Returns:
+            Nome do sinal -> array (K,); a chave 'ciclo' contém o número dos ciclos
+        """
+        ordem = self._ordem(0)
+        colunas = {'ciclo': self.ciclos[ordem]}
+        colunas.update({nome: buffer[ordem, instancia] for nome, buffer in self.buffers.items()})
+        return colunas
+
+    def fechar(self):
+        """Descarrega os ciclos pendentes e fecha o VCD."""
+        if self._escritor is not None:
+            self._descarregar()
+            self._escritor.finalizar()
+            self._arquivo_vcd.close()
+            self._escritor = None
+
+
+def escrever_filtro_estados(caminho: str):
+    """
+    Escreve um arquivo de tradução do GTKWave (Data Format > Translate Filter
+    File) que exibe estado_atual com os nomes dos estados da FSM.
+
+    Args:
+        caminho: Arquivo de saída
+    """
+    from simulador_fsmd import NOMES_ESTADOS
+    with open(caminho, 'w') as f:
+        for codigo, nome in enumerate(NOMES_ESTADOS):
+            f.write(f"{codigo:02X} {nome}\n")
+
+
+def _converter_valor(texto: str) -> int:
+    """Converte um valor binário do VCD; bits X/U/Z/- resultam em -1."""
+    try:
+        return int(texto, 2)
+    except ValueError:
+        return -1
+
+
+def ler_vcd(caminho: str, relogio: str = 'clk') -> Dict[str, np.ndarray]:
+    """
+    Lê um VCD (por exemplo, `ghdl -r ... --vcd=arquivo.vcd`) amostrando cada
+    sinal imediatamente antes de cada borda de subida do relógio.
+
+    Args:
+        caminho: Arquivo VCD
+        relogio: Último componente do nome do sinal de clock
+
+    Returns:
+        Nome hierárquico (escopos separados por '.') -> array (ciclos,) int64
+    """
+    nomes: Dict[str, List[str]] = {}
+    escopo: List[str] = []
+    atuais: Dict[str, int] = {}
+    amostras: List[List[int]] = []
+    id_relogio = None
+    relogio_anterior = 0
+    pendentes: List[Tuple[str, int]] = []
+
+    def aplicar_bloco():
+        nonlocal relogio_anterior
+        novo_relogio = relogio_anterior
+        for identificador, valor in pendentes:
+            if identificador == id_relogio:
+                novo_relogio = valor
+        if relogio_anterior == 0 and novo_relogio == 1:
+            amostras.append([atuais.get(i, -1) for i in ids])
+        for identificador, valor in pendentes:
+            atuais[identificador] = valor
+        relogio_anterior = novo_relogio
+        pendentes.clear()
+
+    with open(caminho) as f:
+        tokens = iter(f.read().split())
+    ids: List[str] = []
+    for token in tokens:
+        if token == '$scope':
+            next(tokens)
+            escopo.append(next(tokens))
+        elif token == '$upscope':
+            escopo.pop()
+        elif token == '$var':
+            next(tokens)
+            next(tokens)
+            identificador = next(tokens)
+            nome = next(tokens)
+            if identificador not in nomes:
+                nomes[identificador] = []
+                ids.append(identificador)
+            nomes[identificador].append(".".join(escopo + [nome]))
+            if nome.lower() == relogio and id_relogio is None:
+                id_relogio = identificador
+        elif token.startswith('#'):
+            aplicar_bloco()
+        elif token[0] in 'bBrR':
+            pendentes.append((next(tokens), _converter_valor(token[1:])))
+        elif token[0] in '01xXzZuU-' and len(token) > 1:
+            pendentes.append((token[1:], _converter_valor(token[0])))
+    aplicar_bloco()
+
+    if id_relogio is None:
+        raise ValueError(f"Sinal de relógio '{relogio}' não encontrado em {caminho}")
+    matriz = np.array(amostras, dtype=np.int64).reshape(len(amostras), len(ids))
+    return {nome: matriz[:, coluna] for coluna, i in enumerate(ids) for nome in nomes[i]}
+
+
+def _associar(referencia: Dict[str, np.ndarray], obtido: Dict[str, np.ndarray]) -> Dict[str, str]:
+    """Associa nomes de `referencia` aos de `obtido` pelo último componente (sem distinção de caixa)."""
+    por_sufixo: Dict[str, str] = {}
+    for nome in sorted(obtido, key=len):
+        por_sufixo.setdefault(nome.rsplit('.', 1)[-1].lower(), nome)
+    return {nome: por_sufixo[nome.rsplit('.', 1)[-1].lower()]
+            for nome in referencia if nome != 'ciclo' and nome.rsplit('.', 1)[-1].lower() in por_sufixo}
+
+
+def primeira_divergencia(referencia: Dict[str, np.ndarray], obtido: Dict[str, np.ndarray],
+                         sinais: Optional[Sequence[str]] = None,
+                         deslocamento: int = 0) -> Optional[Dict[str, object]]:
+    """
+    Localiza o primeiro ciclo em que dois traces diferem.
+
+    Args:
+        referencia: Nome -> array por ciclo (trace de referência)
+        obtido: Nome -> array por ciclo (trace comparado); nomes hierárquicos
+            de VCD são associados pelo último componente
+        sinais: Sinais comparados (padrão: todos os nomes em comum)
+        deslocamento: Ciclos de `obtido` que precedem o ciclo 0 de `referencia`
+
+    Returns:
+        None se os traces coincidem; senão um dicionário com o índice do
+        ciclo, o número do ciclo (se houver a coluna 'ciclo'), os sinais
+        divergentes nesse ciclo e os respectivos valores
+    """
+    associacao = _associar(referencia, obtido)
+    if sinais is not None:
+        associacao = {nome: associacao[nome] for nome in sinais}
+    if not associacao:
+        raise ValueError("Nenhum sinal em comum entre os traces")
+
+    primeiro = None
+    divergentes: Dict[str, Tuple[int, int]] = {}
+    for nome, nome_obtido in associacao.items():
+        a = np.asarray(referencia[nome], dtype=np.int64)
+        b = np.asarray(obtido[nome_obtido], dtype=np.int64)[deslocamento:]
+        if nome == 'acc_out':
+            # A referência guarda o acumulador com sinal; o VCD, sem sinal
+            a, b = a & 0xFFFFFF, b & 0xFFFFFF
+        n = min(len(a), len(b))
+        indices = np.flatnonzero(a[:n] != b[:n])
+        if len(indices) == 0:
+            continue
+        indice = int(indices[0])
+        if primeiro is None or indice < primeiro:
+            primeiro, divergentes = indice, {}
+        if indice == primeiro:
+            divergentes[nome] = (int(a[indice]), int(b[indice]))
+
+    if primeiro is None:
+        return None
+    return {
+        'indice': primeiro,
+        'ciclo': int(referencia['ciclo'][primeiro]) if 'ciclo' in referencia else primeiro,
+        'sinais': divergentes,
+    }
+
+
+def main():
+    """Função principal: mede o custo do trace e demonstra VCD e divergência."""
+    from simulador_fsmd import NOMES_ESTADOS, OPERACOES, SimuladorFSMD
+
+    parser = argparse.ArgumentParser(description="Gravação de traces do simulador FSM + datapath")
+    parser.add_argument('--instancias', type=int, default=100_000)
+    parser.add_argument('--vcd', default='simulador_fsmd.vcd', help="VCD da instância 0 (padrão: %(default)s)")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - TRACE DO SIMULADOR")
+    print("=" * 80)
+    print()
+
+    rng = np.random.default_rng(16)
+    lotes = [(rng.integers(-128, 128, size=(args.instancias, 4), dtype=np.int8),
+              rng.integers(-128, 128, size=(args.instancias, 4), dtype=np.int8)) for _ in OPERACOES]
+
+    def regressao(gravador: Optional[GravadorTrace]) -> float:
+        simulador = SimuladorFSMD(args.instancias)
+        simulador.gravador = gravador
+        simulador.reset()
+        inicio = time.perf_counter()
+        for (lote_a, lote_b), codigo in zip(lotes, OPERACOES.values()):
+            simulador.carregar_operandos(lote_a, lote_b)
+            simulador.executar(codigo)
+        return time.perf_counter() - inicio
+
+    sem_trace = regressao(None)
+    gravador = GravadorTrace(instancias=[0, args.instancias - 1], caminho_vcd=args.vcd)
+    com_trace = regressao(gravador)
+    gravador.fechar()
+    print(f"Regressão com {args.instancias:,} instâncias:")
+    print(f"  Sem trace: {sem_trace * 1e3:8.2f} ms")
+    print(f"  Com trace: {com_trace * 1e3:8.2f} ms ({(com_trace / sem_trace - 1) * 100:+.1f}%)")
+    print(f"  VCD: {args.vcd} ({gravador.total} ciclos, instâncias 0 e {args.instancias - 1})")
+    print()
+
+    # Divergência entre as variantes serial e árvore do produto escalar
+    traces = {}
+    for variante in ('serial', 'arvore'):
+        simulador = SimuladorFSMD(1, variante)
+        simulador.gravador = GravadorTrace()
+        simulador.reset()
+        simulador.carregar_operandos(lotes[2][0][:1], lotes[2][1][:1])
+        simulador.executar(OPERACOES['produto_escalar'])
+        traces[variante] = simulador.gravador.colunas()
+    divergencia = primeira_divergencia(traces['serial'], traces['arvore'])
+    print("Primeira divergência entre as variantes serial e árvore (produto escalar):")
+    estado = NOMES_ESTADOS[traces['serial']['estado_atual'][divergencia['indice']]]
+    print(f"  Ciclo {divergencia['ciclo']} (estado da referência: {estado})")
+    for nome, (esperado, obtido) in divergencia['sinais'].items():
+        print(f"    {nome}: serial = {esperado}, arvore = {obtido}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
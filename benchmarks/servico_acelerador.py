@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Serviço Assíncrono do Acelerador no Host
+Arquivo: servico_acelerador.py
+Descrição: Serviço asyncio que recebe requisições de soma, subtração e produto
+           escalar de muitos clientes concorrentes, agrupa-as em lotes por
+           janela de tempo e despacha cada lote para um backend plugável: o
+           processador em software ou um substituto local do FPGA que emula o
+           tempo de execução em ciclos e o custo de enquadramento do enlace
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Modelo do substituto do FPGA: cada lote é enviado em um quadro com cabeçalho
+e as palavras A/B de cada operação (8 bytes por par), processado na FSM em
+rajadas de até PARES_POR_RAJADA pares (ciclos obtidos por simulação do RTL) e
+devolvido em um quadro
+com uma palavra de 32 bits por resultado. O serviço despacha um lote por vez,
+o que modela o enlace compartilhado: um lote só começa depois que o anterior
+terminou. Os valores dos resultados vêm do modelo funcional em software;
+apenas o tempo é emulado.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from processador_vetorial_sw import ProcessadorVetorialSW
+from simulador_fsmd import BRAM_PALAVRAS, ciclos_por_operacao
+
+# Métodos em lote do processador por operação
+METODOS_LOTE = {
+    'soma': 'soma_vetorial_lote',
+    'subtracao': 'subtracao_vetorial_lote',
+    'produto_escalar': 'produto_escalar_lote',
+}
+
+BYTES_POR_PAR = 8        # palavras A e B de 32 bits
+BYTES_POR_RESULTADO = 4  # uma palavra de 32 bits por resultado
+
+# Em rajada, vetores A, vetores B e resultados dividem a BRAM
+PARES_POR_RAJADA = BRAM_PALAVRAS // 3
+
+
+class EnlaceSerial:
+    """Custo de transferência de um enlace host <-> FPGA enquadrado."""
+
+    def __init__(self, taxa_bps: float, bits_por_byte: int = 10,
+                 bytes_cabecalho: int = 4, latencia_quadro_s: float = 0.0):
+        """
+        Args:
+            taxa_bps: Taxa de transmissão em bits por segundo
+            bits_por_byte: Bits na linha por byte (10 para UART 8N1)
+            bytes_cabecalho: Bytes de cabeçalho por quadro (sincronismo,
+                operação e contagem)
+            latencia_quadro_s: Latência fixa por quadro (pilha de rede, driver)
+        """
+        self.taxa_bps = taxa_bps
+        self.bits_por_byte = bits_por_byte
+        self.bytes_cabecalho = bytes_cabecalho
+        self.latencia_quadro_s = latencia_quadro_s
+
+    def tempo_quadro(self, bytes_carga: int) -> float:
+        """Segundos para transmitir um quadro com a carga indicada."""
+        bits = (self.bytes_cabecalho + bytes_carga) * self.bits_por_byte
+        return self.latencia_quadro_s + bits / self.taxa_bps
+
+
+# Enlaces pré-definidos: UART 8N1 a 921600 baud e socket TCP em rede local
+ENLACES = {
+    'uart': EnlaceSerial(921_600, bits_por_byte=10),
+    'socket': EnlaceSerial(1e9, bits_por_byte=8, bytes_cabecalho=58, latencia_quadro_s=50e-6),
+}
+
+
+class BackendSoftware:
+    """Executa cada lote com a API em lote do ProcessadorVetorialSW."""
+
+    nome = 'software'
+
+    def __init__(self):
+        self.processador = ProcessadorVetorialSW()
+
+    async def executar(self, operacao: str, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        """
+        Executa um lote de uma operação.
+
+        Args:
+            operacao: 'soma', 'subtracao' ou 'produto_escalar'
+            lote_a: Lote (N, 4) int8 de vetores A
+            lote_b: Lote (N, 4) int8 de vetores B
+
+        Returns:
+            Resultados do lote
+        """
+        return getattr(self.processador, METODOS_LOTE[operacao])(lote_a, lote_b)
+
+
+class BackendFPGASimulado(BackendSoftware):
+    """Substituto local do FPGA: resultados do modelo, tempo de ciclos + enlace."""
+
+    nome = 'fpga'
+
+    def __init__(self, frequencia_mhz: float = 250.0, enlace: Optional[EnlaceSerial] = None):
+        """
+        Args:
+            frequencia_mhz: Frequência de clock do FPGA
+            enlace: Enlace host <-> FPGA (padrão: UART)
+        """
+        super().__init__()
+        self.frequencia_hz = frequencia_mhz * 1e6
+        self.enlace = enlace if enlace is not None else ENLACES['uart']
+        # Ciclos de rajadas de 0 a PARES_POR_RAJADA pares, por operação
+        rajadas = [ciclos_por_operacao(pares) for pares in range(1, PARES_POR_RAJADA + 1)]
+        self.ciclos_rajada = {op: [0] + [ciclos[op] for ciclos in rajadas] for op in METODOS_LOTE}
+
+    def tempo_lote(self, operacao: str, n: int) -> float:
+        """
+        Tempo emulado de um lote: quadro de ida, execução na FSM em rajadas
+        de até PARES_POR_RAJADA pares e quadro de volta.
+
+        Args:
+            operacao: Nome da operação
+            n: Número de operações no lote
+
+        Returns:
+            Tempo em segundos
+        """
+        ida = self.enlace.tempo_quadro(n * BYTES_POR_PAR)
+        rajada = self.ciclos_rajada[operacao]
+        completas, resto = divmod(n, PARES_POR_RAJADA)
+        execucao = (completas * rajada[PARES_POR_RAJADA] + rajada[resto]) / self.frequencia_hz
+        volta = self.enlace.tempo_quadro(n * BYTES_POR_RESULTADO)
+        return ida + execucao + volta
+
+    async def executar(self, operacao: str, lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+        inicio = time.perf_counter()
+        resultado = await super().executar(operacao, lote_a, lote_b)
+        restante = self.tempo_lote(operacao, len(lote_a)) - (time.perf_counter() - inicio)
+        if restante > 0:
+            await asyncio.sleep(restante)
+        return resultado
+
+
+BACKENDS = {
+    BackendSoftware.nome: BackendSoftware,
+    BackendFPGASimulado.nome: BackendFPGASimulado,
+}
+
+
+def _validar_vetor(vetor: Sequence[int]) -> np.ndarray:
+    """Converte um vetor para (4,) int8, rejeitando formato ou valores inválidos."""
+    try:
+        valores = np.asarray(vetor, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError) as erro:
+        raise ValueError(f"Vetor inválido: {vetor!r}") from erro
+    if valores.shape != (4,):
+        raise ValueError(f"Esperado vetor de 4 elementos, recebido formato {valores.shape}")
+    if valores.min() < -128 or valores.max() > 127:
+        raise ValueError(f"Elementos fora da faixa int8 [-128, 127]: {vetor!r}")
+    return valores.astype(np.int8)
+
+
+class ServicoAcelerador:
+    """
+    Serviço que agrupa requisições concorrentes em lotes.
+
+    Após a chegada da primeira requisição de um lote, o serviço espera até
+    `janela_s` segundos (ou até `lote_maximo` requisições) antes de despachar.
+    Enquanto um lote está no backend, as novas requisições se acumulam para o
+    próximo. Uso:
+
+        async with ServicoAcelerador(BackendSoftware()) as servico:
+            resultado = await servico.submeter('soma', vec_a, vec_b)
+    """
+
+    def __init__(self, backend: BackendSoftware, janela_s: float = 1e-3, lote_maximo: int = 4096):
+        """
+        Args:
+            backend: Backend que executa os lotes
+            janela_s: Espera máxima para completar um lote, em segundos
+            lote_maximo: Número máximo de requisições por lote
+        """
+        self.backend = backend
+        self.janela_s = janela_s
+        self.lote_maximo = lote_maximo
+        self.tamanhos_lote: List[int] = []
+        self._fila: Optional[asyncio.Queue] = None
+        self._tarefa: Optional[asyncio.Task] = None
+        self._encerrando = False
+
+    async def __aenter__(self) -> 'ServicoAcelerador':
+        self._fila = asyncio.Queue()
+        self._encerrando = False
+        self._tarefa = asyncio.create_task(self._agrupar())
+        return self
+
+    async def __aexit__(self, *exc):
+        # Novas requisições passam a ser rejeitadas; as que já estão na fila
+        # antes do marcador None são despachadas normalmente
+        self._encerrando = True
+        await self._fila.put(None)
+        await self._tarefa
+        while not self._fila.empty():
+            requisicao = self._fila.get_nowait()
+            if requisicao is not None and not requisicao[3].done():
+                requisicao[3].set_exception(RuntimeError("Serviço encerrado antes de despachar a requisição"))
+
+    async def submeter(self, operacao: str, vec_a: Sequence[int], vec_b: Sequence[int]) -> Any:
+        """
+        Envia uma requisição e aguarda o resultado.
+
+        Args:
+            operacao: 'soma', 'subtracao' ou 'produto_escalar'
+            vec_a: Vetor A (4 ints na faixa int8)
+            vec_b: Vetor B (4 ints na faixa int8)
+
+        Returns:
+            Lista de 4 ints (soma/subtração) ou int (produto escalar)
+            
+        Raises:
+            ValueError: Operação desconhecida ou vetor que não tem 4
+                elementos na faixa int8 (só esta requisição é rejeitada)
+            RuntimeError: Serviço fora do bloco async with ou encerrando
+        """
+        if self._fila is None or self._encerrando:
+            raise RuntimeError("O serviço não está aceitando requisições")
+        if operacao not in METODOS_LOTE:
+            raise ValueError(f"Operação desconhecida: {operacao}")
+        vec_a = _validar_vetor(vec_a)
+        vec_b = _validar_vetor(vec_b)
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((operacao, vec_a, vec_b, futuro))
+        return await futuro
+
+    async def _coletar(self, primeira) -> Tuple[list, bool]:
+        """Completa um lote a partir da primeira requisição; indica se o serviço encerrou."""
+        pendentes = [primeira]
+        limite = asyncio.get_running_loop().time() + self.janela_s
+        while len(pendentes) < self.lote_maximo:
+            try:
+                requisicao = self._fila.get_nowait()
+            except asyncio.QueueEmpty:
+                restante = limite - asyncio.get_running_loop().time()
+                if restante <= 0:
+                    break
+                try:
+                    requisicao = await asyncio.wait_for(self._fila.get(), restante)
+                except asyncio.TimeoutError:
+                    break
+            if requisicao is None:
+                return pendentes, True
+            pendentes.append(requisicao)
+        return pendentes, False
+
+    async def _agrupar(self):
+        """Laço de agrupamento: coleta um lote, separa por operação e despacha."""
+        encerrar = False
+        while not encerrar:
+            primeira = await self._fila.get()
+            if primeira is None:
+                break
+            pendentes, encerrar = await self._coletar(primeira)
+            self.tamanhos_lote.append(len(pendentes))
+            por_operacao: Dict[str, list] = {}
+            for requisicao in pendentes:
+                por_operacao.setdefault(requisicao[0], []).append(requisicao)
+            for operacao, grupo in por_operacao.items():
+                await self._despachar(operacao, grupo)
+
+    async def _despachar(self, operacao: str, grupo: list):
+        """
+        Executa um grupo de requisições da mesma operação e resolve os futuros.
+
+        Uma falha do backend é repassada só às requisições do grupo; futuros
+        já cancelados pelo cliente (ex.: asyncio.wait_for) são ignorados.
+        """
+        try:
+            lote_a = np.stack([requisicao[1] for requisicao in grupo])
+            lote_b = np.stack([requisicao[2] for requisicao in grupo])
+            resultados = (await self.backend.executar(operacao, lote_a, lote_b)).tolist()
+        except Exception as erro:
+            for requisicao in grupo:
+                if not requisicao[3].done():
+                    requisicao[3].set_exception(erro)
+            return
+        for requisicao, resultado in zip(grupo, resultados):
+            if not requisicao[3].done():
+                requisicao[3].set_result(resultado)
+
+
+async def _cliente(servico: ServicoAcelerador, requisicoes: int, rng: np.random.Generator,
+                   latencias: List[float]):
+    """Cliente em malha fechada: envia uma requisição após a resposta da anterior."""
+    nomes = list(METODOS_LOTE)
+    operacoes = rng.integers(0, len(nomes), size=requisicoes)
+    vetores = rng.integers(-128, 128, size=(requisicoes, 2, 4)).tolist()
+    for indice, (vec_a, vec_b) in zip(operacoes.tolist(), vetores):
+        inicio = time.perf_counter()
+        await servico.submeter(nomes[indice], vec_a, vec_b)
+        latencias.append(time.perf_counter() - inicio)
+
+
+async def medir_carga(backend: BackendSoftware, clientes: int, janela_s: float,
+                      requisicoes_por_cliente: int = 200, lote_maximo: int = 4096,
+                      semente: int = 0) -> Dict[str, float]:
+    """
+    Mede latência ponta a ponta e vazão com clientes concorrentes.
+
+    Args:
+        backend: Backend do serviço
+        clientes: Número de clientes concorrentes (carga)
+        janela_s: Janela de agrupamento em segundos
+        requisicoes_por_cliente: Requisições enviadas por cliente
+        lote_maximo: Número máximo de requisições por lote
+        semente: Semente dos vetores e operações
+
+    Returns:
+        Dicionário com p50/p99 de latência (us), vazão (ops/s) e lote médio
+    """
+    latencias: List[float] = []
+    rngs = [np.random.default_rng([semente, c]) for c in range(clientes)]
+    async with ServicoAcelerador(backend, janela_s, lote_maximo) as servico:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(_cliente(servico, requisicoes_por_cliente, rng, latencias)
+                               for rng in rngs))
+        duracao = time.perf_counter() - inicio
+    latencias_us = np.array(latencias) * 1e6
+    return {
+        'clientes': clientes,
+        'janela_us': janela_s * 1e6,
+        'p50_us': float(np.percentile(latencias_us, 50)),
+        'p99_us': float(np.percentile(latencias_us, 99)),
+        'vazao_ops': len(latencias) / duracao,
+        'lote_medio': float(np.mean(servico.tamanhos_lote)),
+    }
+
+
+def varredura(backend: BackendSoftware, clientes: Sequence[int], janelas_s: Sequence[float],
+              requisicoes_por_cliente: int = 200, semente: int = 0) -> List[Dict[str, float]]:
+    """
+    Mede todas as combinações de carga e janela de agrupamento.
+
+    Args:
+        backend: Backend do serviço
+        clientes: Números de clientes concorrentes
+        janelas_s: Janelas de agrupamento em segundos
+        requisicoes_por_cliente: Requisições enviadas por cliente
+        semente: Semente dos vetores e operações
+
+    Returns:
+        Lista de medidas (ver medir_carga)
+    """
+    return [asyncio.run(medir_carga(backend, n, janela, requisicoes_por_cliente, semente=semente))
+            for janela in janelas_s for n in clientes]
+
+
+def main():
+    """Função principal: varre carga e janela para o backend escolhido."""
+    parser = argparse.ArgumentParser(description="Serviço assíncrono do acelerador com agrupamento de requisições")
+    parser.add_argument('--backend', choices=list(BACKENDS), default='fpga')
+    parser.add_argument('--enlace', choices=list(ENLACES), default='uart',
+                        help="Enlace emulado pelo backend fpga (padrão: %(default)s)")
+    parser.add_argument('--frequencia', type=float, default=250.0, help="Clock do FPGA em MHz")
+    parser.add_argument('--clientes', type=int, nargs='+', default=[1, 8, 64])
+    parser.add_argument('--janelas', type=float, nargs='+', default=[0.0, 0.5, 2.0],
+                        help="Janelas de agrupamento em ms")
+    parser.add_argument('--requisicoes', type=int, default=200, help="Requisições por cliente")
+    parser.add_argument('--saida', help="Arquivo JSON com as medidas")
+    args = parser.parse_args()
+
+    if args.backend == 'fpga':
+        backend = BackendFPGASimulado(args.frequencia, ENLACES[args.enlace])
+    else:
+        backend = BackendSoftware()
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - SERVIÇO ASSÍNCRONO DO ACELERADOR")
+    print("=" * 80)
+    print(f"Backend: {backend.nome}" + (f" ({args.enlace}, {args.frequencia:.0f} MHz)"
+                                        if args.backend == 'fpga' else ""))
+    print()
+    print(f"{'Janela (ms)':>12} {'Clientes':>10} {'p50 (us)':>12} {'p99 (us)':>12} "
+          f"{'ops/s':>12} {'Lote médio':>12}")
+    print("-" * 74)
+    medidas = varredura(backend, args.clientes, [j * 1e-3 for j in args.janelas], args.requisicoes)
+    for m in medidas:
+        print(f"{m['janela_us'] / 1e3:>12.2f} {m['clientes']:>10} {m['p50_us']:>12.1f} "
+              f"{m['p99_us']:>12.1f} {m['vazao_ops']:>12.0f} {m['lote_medio']:>12.1f}")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({'backend': backend.nome, 'medidas': medidas}, f, indent=2)
+        print(f"\nMedidas salvas em: {args.saida}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
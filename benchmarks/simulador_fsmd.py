@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Simulador Ciclo a Ciclo FSM + Datapath
+Arquivo: simulador_fsmd.py
+Descrição: Modelo ciclo a ciclo de FSMCompleta + DatapathCompleto que avança
+           N instâncias independentes do processador em lockstep, com o estado
+           armazenado como struct-of-arrays NumPy
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+O modelo segue o RTL sinal a sinal: saídas de Moore da FSM, leitura síncrona
+da BRAMDualPort (write-first na porta A), registradores A/B carregados com a
+saída registrada da BRAM e Acumulador24Bit com wraparound. Assim, as
+divergências em relação à simulação GHDL apontam problemas reais do modelo
+e não diferenças de abstração. Consequências observáveis do RTL atual:
+  - em LOAD_B o registrador B recebe a leitura feita no ciclo anterior
+    (endereço "00000"), pois bram_addr_b só vale "00001" durante LOAD_B;
+  - em EXEC_DOT_1..3 o mux_sel fica em "01", acumulando apenas prod_1;
+  - no WRITE_BACK do produto escalar mux_sel = "10" seleciona zero.
+
+Modo rajada (burst = '1' junto com start): a FSM processa `contagem` pares
+a partir de base_a/base_b e grava a partir de base_res, com os endereços
+somados módulo 32. A leitura do próximo par é sobreposta à escrita do
+resultado anterior (soma/subtração, 2 ciclos por operação, limite imposto
+pelas 3 acessos por operação em 2 portas da BRAM) ou ao último ciclo de
+acumulação (produto escalar, 5 ciclos por operação). Os estados BURST_* não
+herdam as peculiaridades acima: o acumulador soma prod_0..prod_3 e o
+resultado é gravado com mux_sel = "01". No produto escalar o par k+1 é lido
+antes da escrita do resultado k, portanto a faixa de resultados não deve
+coincidir com a dos operandos seguintes.
+
+Variantes do produto escalar (generics ARVORE_SOMA / ARVORE_PIPELINE): com a
+árvore de somadores, os 4 produtos são somados e acumulados em um único
+ciclo (EXEC_DOT_ARVORE / BURST_DOT_ARVORE); com pipeline, as somas parciais
+prod_0 + prod_1 e prod_2 + prod_3 passam por um registrador e o estado
+EXEC_DOT_PIPE / BURST_DOT_PIPE precede a acumulação. No modo de operação
+única LOAD_B zera o acumulador, e o WRITE_BACK mantém o comportamento acima.
+"""
+
+import time
+import numpy as np
+from typing import Dict, Optional
+
+from processador_vetorial_sw import (
+    empacotar,
+    soma_swar,
+    subtracao_swar,
+    wrap_24bit,
+)
+
+# Estados de FSMCompleta, na ordem do tipo state_t
+IDLE = 0
+LOAD_A = 1
+LOAD_B = 2
+EXEC_SUM_SUB = 3
+EXEC_DOT_0 = 4
+EXEC_DOT_1 = 5
+EXEC_DOT_2 = 6
+EXEC_DOT_3 = 7
+WRITE_BACK = 8
+DONE_STATE = 9
+BURST_LER = 10
+BURST_CARGA = 11
+BURST_FIM = 12
+BURST_DOT_0 = 13
+BURST_DOT_1 = 14
+BURST_DOT_2 = 15
+BURST_DOT_3 = 16
+BURST_DOT_WB = 17
+EXEC_DOT_PIPE = 18
+EXEC_DOT_ARVORE = 19
+BURST_DOT_PIPE = 20
+BURST_DOT_ARVORE = 21
+
+NOMES_ESTADOS = (
+    'IDLE', 'LOAD_A', 'LOAD_B', 'EXEC_SUM_SUB', 'EXEC_DOT_0',
+    'EXEC_DOT_1', 'EXEC_DOT_2', 'EXEC_DOT_3', 'WRITE_BACK', 'DONE_STATE',
+    'BURST_LER', 'BURST_CARGA', 'BURST_FIM', 'BURST_DOT_0', 'BURST_DOT_1',
+    'BURST_DOT_2', 'BURST_DOT_3', 'BURST_DOT_WB', 'EXEC_DOT_PIPE',
+    'EXEC_DOT_ARVORE', 'BURST_DOT_PIPE', 'BURST_DOT_ARVORE',
+)
+NUM_ESTADOS = len(NOMES_ESTADOS)
+
+# Códigos de op_sel
+OP_SOMA = 0b00
+OP_SUBTRACAO = 0b01
+OP_PRODUTO_ESCALAR = 0b10
+
+OPERACOES = {
+    'soma': OP_SOMA,
+    'subtracao': OP_SUBTRACAO,
+    'produto_escalar': OP_PRODUTO_ESCALAR,
+}
+
+# Variantes do datapath do produto escalar: nome -> (ARVORE_SOMA, ARVORE_PIPELINE)
+VARIANTES_DOT = {
+    'serial': (False, False),
+    'arvore': (True, False),
+    'arvore_pipeline': (True, True),
+}
+
+BRAM_PALAVRAS = 32  # 2**ADDR_WIDTH
+
+# Endereços fixos usados pela FSM
+ENDERECO_A = 0b00000
+ENDERECO_B = 0b00001
+ENDERECO_RESULTADO = 0b00010
+
+
+def _tabela(valores: Dict[int, int], dtype=np.uint8) -> np.ndarray:
+    """Monta uma tabela indexada por estado com zero como valor padrão."""
+    tabela = np.zeros(NUM_ESTADOS, dtype=dtype)
+    for estado, valor in valores.items():
+        tabela[estado] = valor
+    return tabela
+
+
+# Saídas de Moore de FSMCompleta indexadas pelo estado atual. O mux_sel de
+# WRITE_BACK depende de op_sel, e os endereços e habilitações do modo rajada
+# dependem dos contadores; ambos são tratados em SimuladorFSMD.sinais_controle.
+SAIDAS_MOORE = {
+    'bram_addr_a': _tabela({LOAD_A: ENDERECO_A, WRITE_BACK: ENDERECO_RESULTADO}),
+    'bram_addr_b': _tabela({LOAD_B: ENDERECO_B}),
+    'bram_we': _tabela({WRITE_BACK: 1, BURST_FIM: 1, BURST_DOT_WB: 1}, dtype=bool),
+    'reg_a_load': _tabela({LOAD_A: 1, BURST_CARGA: 1}, dtype=bool),
+    'reg_b_load': _tabela({LOAD_B: 1, BURST_CARGA: 1}, dtype=bool),
+    'acc_rst': _tabela({EXEC_DOT_0: 1, BURST_CARGA: 1, BURST_DOT_WB: 1}, dtype=bool),
+    'acc_en': _tabela({EXEC_DOT_1: 1, EXEC_DOT_2: 1, EXEC_DOT_3: 1,
+                       BURST_DOT_0: 1, BURST_DOT_1: 1, BURST_DOT_2: 1, BURST_DOT_3: 1,
+                       EXEC_DOT_ARVORE: 1, BURST_DOT_ARVORE: 1}, dtype=bool),
+    'mux_sel': _tabela({EXEC_DOT_0: 0b01, EXEC_DOT_1: 0b01, EXEC_DOT_2: 0b01, EXEC_DOT_3: 0b01,
+                        BURST_DOT_1: 0b01, BURST_DOT_2: 0b10, BURST_DOT_3: 0b11, BURST_DOT_WB: 0b01}),
+    'done': _tabela({DONE_STATE: 1}, dtype=bool),
+}
+
+# Estados da rajada que apresentam endereços de leitura (par idx_leitura) ou
+# de escrita (resultado idx_escrita)
+ESTADOS_LEITURA_BURST = (BURST_LER, BURST_DOT_3, BURST_DOT_ARVORE)
+ESTADOS_ESCRITA_BURST = (BURST_CARGA, BURST_FIM, BURST_DOT_WB)
+
+# Próximo estado para os estados cuja transição é incondicional
+PROXIMO_ESTADO = np.array([
+    IDLE,          # IDLE (depende de start)
+    LOAD_B,        # LOAD_A
+    EXEC_SUM_SUB,  # LOAD_B (depende de op_sel)
+    WRITE_BACK,    # EXEC_SUM_SUB
+    EXEC_DOT_1,    # EXEC_DOT_0
+    EXEC_DOT_2,    # EXEC_DOT_1
+    EXEC_DOT_3,    # EXEC_DOT_2
+    WRITE_BACK,    # EXEC_DOT_3
+    DONE_STATE,    # WRITE_BACK
+    IDLE,          # DONE_STATE
+    BURST_CARGA,   # BURST_LER
+    BURST_FIM,     # BURST_CARGA (depende de op_sel e dos contadores)
+    DONE_STATE,    # BURST_FIM
+    BURST_DOT_1,   # BURST_DOT_0
+    BURST_DOT_2,   # BURST_DOT_1
+    BURST_DOT_3,   # BURST_DOT_2
+    BURST_DOT_WB,  # BURST_DOT_3
+    BURST_DOT_0,   # BURST_DOT_WB (depende dos contadores e da variante)
+    EXEC_DOT_ARVORE,   # EXEC_DOT_PIPE
+    WRITE_BACK,        # EXEC_DOT_ARVORE
+    BURST_DOT_ARVORE,  # BURST_DOT_PIPE
+    BURST_DOT_WB,      # BURST_DOT_ARVORE
+], dtype=np.uint8)
+
+
+def _lane(palavras: np.ndarray, indice: np.ndarray) -> np.ndarray:
+    """Extrai, com extensão de sinal, a lane indice de cada palavra."""
+    deslocamento = (24 - 8 * indice.astype(np.int32))
+    return (palavras.view(np.int32) << deslocamento) >> 24
+
+
+class SimuladorFSMD:
+    """
+    Simulador ciclo a ciclo de N instâncias independentes do processador
+    vetorial (FSMCompleta + DatapathCompleto) executadas em lockstep.
+
+    Todo o estado fica em arrays de N posições (estado da FSM, registradores,
+    acumulador, saídas registradas da BRAM) e a BRAM é um array (N, 32) de
+    palavras uint32. Cada chamada a passo() corresponde a uma borda de
+    subida do clock para todas as instâncias. As entradas base_a, base_b,
+    base_res e contagem do modo rajada são definidas com configurar_burst()
+    e amostradas junto com start.
+    """
+
+    def __init__(self, n_instancias: int, variante_dot: str = 'serial'):
+        """
+        Inicializa o simulador.
+
+        Args:
+            n_instancias: Número de processadores simulados em paralelo
+            variante_dot: Datapath do produto escalar (chave de VARIANTES_DOT)
+        """
+        self.n = n_instancias
+        self.variante_dot = variante_dot
+        self.arvore, self.pipeline_arvore = VARIANTES_DOT[variante_dot]
+        if not self.arvore:
+            self._inicio_dot = (EXEC_DOT_0, BURST_DOT_0)
+        elif self.pipeline_arvore:
+            self._inicio_dot = (EXEC_DOT_PIPE, BURST_DOT_PIPE)
+        else:
+            self._inicio_dot = (EXEC_DOT_ARVORE, BURST_DOT_ARVORE)
+        self._indices = np.arange(n_instancias)
+        self.bram = np.zeros((n_instancias, BRAM_PALAVRAS), dtype=np.uint32)
+        self.estado = np.zeros(n_instancias, dtype=np.uint8)
+        self.bram_val_a = np.zeros(n_instancias, dtype=np.uint32)
+        self.bram_val_b = np.zeros(n_instancias, dtype=np.uint32)
+        self.reg_a = np.zeros(n_instancias, dtype=np.uint32)
+        self.reg_b = np.zeros(n_instancias, dtype=np.uint32)
+        self.acc = np.zeros(n_instancias, dtype=np.int32)
+        self.parcial_reg = np.zeros(n_instancias, dtype=np.int32)  # pipeline da árvore
+        self.op_sel = np.zeros(n_instancias, dtype=np.uint8)
+        # Registros do modo rajada e valores presentes nas entradas
+        self.base_a = np.zeros(n_instancias, dtype=np.uint8)
+        self.base_b = np.zeros(n_instancias, dtype=np.uint8)
+        self.base_res = np.zeros(n_instancias, dtype=np.uint8)
+        self.contagem = np.zeros(n_instancias, dtype=np.uint8)
+        self.idx_leitura = np.zeros(n_instancias, dtype=np.uint8)
+        self.idx_escrita = np.zeros(n_instancias, dtype=np.uint8)
+        self.entradas_burst = {
+            'base_a': self.base_a.copy(),
+            'base_b': self.base_b.copy(),
+            'base_res': self.base_res.copy(),
+            'contagem': self.contagem.copy(),
+        }
+        self.ciclo = 0
+        self.gravador = None  # GravadorTrace opcional (rastreamento.py)
+        self.instrumentacao = None  # Instrumentacao opcional (instrumentacao.py)
+
+    def reset(self):
+        """Aplica rst por um ciclo: FSM em IDLE e registradores A/B zerados."""
+        self.passo(start=False, op_sel=self.op_sel, rst=True)
+
+    def carregar_bram(self, palavras: np.ndarray, endereco_inicial: int = 0):
+        """
+        Escreve palavras de 32 bits na BRAM de todas as instâncias.
+
+        Args:
+            palavras: Array (N, K) ou (K,) de palavras uint32 (broadcast)
+            endereco_inicial: Primeiro endereço escrito
+        """
+        palavras = np.asarray(palavras, dtype=np.uint32)
+        if palavras.ndim == 1:
+            palavras = palavras[np.newaxis, :]
+        fim = endereco_inicial + palavras.shape[1]
+        self.bram[:, endereco_inicial:fim] = palavras
+
+    def carregar_operandos(self, lote_a: np.ndarray, lote_b: np.ndarray):
+        """
+        Escreve os vetores A e B de cada instância nos endereços usados pela FSM.
+
+        Args:
+            lote_a: Lote (N, 4) int8 ou palavras (N,) uint32 do vetor A
+            lote_b: Lote (N, 4) int8 ou palavras (N,) uint32 do vetor B
+        """
+        for endereco, lote in ((ENDERECO_A, lote_a), (ENDERECO_B, lote_b)):
+            lote = np.asarray(lote)
+            palavras = empacotar(lote) if lote.ndim == 2 else lote
+            self.bram[:, endereco] = palavras
+
+    def configurar_burst(self, base_a, base_b, base_res, contagem):
+        """
+        Define as entradas do modo rajada (amostradas no próximo start).
+
+        Args:
+            base_a: Endereço do primeiro vetor A (escalar ou array (N,))
+            base_b: Endereço do primeiro vetor B
+            base_res: Endereço do primeiro resultado
+            contagem: Número de pares processados (0 a 32)
+        """
+        if np.any(np.asarray(contagem) > BRAM_PALAVRAS):
+            raise ValueError(f"contagem deve estar entre 0 e {BRAM_PALAVRAS}")
+        for nome, valor in (('base_a', base_a), ('base_b', base_b),
+                            ('base_res', base_res), ('contagem', contagem)):
+            self.entradas_burst[nome] = np.broadcast_to(
+                np.asarray(valor, dtype=np.uint8), (self.n,)).copy()
+
+    def sinais_controle(self, op_sel: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Calcula as saídas combinacionais da FSM para o estado atual.
+
+        Args:
+            op_sel: Código da operação por instância (padrão: último aplicado)
+
+        Returns:
+            Dicionário sinal -> array (N,) com os valores do ciclo atual
+        """
+        if op_sel is None:
+            op_sel = self.op_sel
+        sinais = {nome: tabela[self.estado] for nome, tabela in SAIDAS_MOORE.items()}
+        write_back_dot = (self.estado == WRITE_BACK) & (op_sel == OP_PRODUTO_ESCALAR)
+        sinais['mux_sel'] = np.where(write_back_dot, np.uint8(0b10), sinais['mux_sel'])
+        if self.arvore:
+            sinais['acc_rst'] = sinais['acc_rst'] | (self.estado == LOAD_B)
+
+        # Modo rajada: endereços base + contador (módulo 32)
+        leitura = np.isin(self.estado, ESTADOS_LEITURA_BURST)
+        escrita = np.isin(self.estado, ESTADOS_ESCRITA_BURST)
+        mascara = np.uint8(BRAM_PALAVRAS - 1)
+        sinais['bram_addr_a'] = np.where(leitura, (self.base_a + self.idx_leitura) & mascara,
+                                         np.where(escrita, (self.base_res + self.idx_escrita) & mascara,
+                                                  sinais['bram_addr_a']))
+        sinais['bram_addr_b'] = np.where(leitura, (self.base_b + self.idx_leitura) & mascara,
+                                         sinais['bram_addr_b'])
+        # Em BURST_CARGA o resultado anterior é escrito a partir do segundo par
+        sinais['bram_we'] = np.where(self.estado == BURST_CARGA, self.idx_leitura > 1, sinais['bram_we'])
+        # Em BURST_DOT_WB os registradores recebem o próximo par, se foi lido
+        recarga = (self.estado == BURST_DOT_WB) & (self.idx_leitura > self.idx_escrita + 1)
+        sinais['reg_a_load'] = sinais['reg_a_load'] | recarga
+        sinais['reg_b_load'] = sinais['reg_b_load'] | recarga
+        return sinais
+
+    def passo(self, start, op_sel, rst: bool = False, burst=False) -> np.ndarray:
+        """
+        Avança um ciclo de clock em todas as instâncias.
+
+        Args:
+            start: Sinal start (escalar ou array (N,) booleano)
+            op_sel: Código da operação (escalar ou array (N,))
+            rst: Reset síncrono da FSM / assíncrono dos registradores
+            burst: Sinal burst amostrado junto com start (escalar ou array (N,))
+
+        Returns:
+            Array (N,) booleano com o sinal done do ciclo executado
+        """
+        start = np.broadcast_to(np.asarray(start, dtype=bool), (self.n,))
+        burst = np.broadcast_to(np.asarray(burst, dtype=bool), (self.n,))
+        op_sel = np.broadcast_to(np.asarray(op_sel, dtype=np.uint8), (self.n,))
+        self.op_sel = np.array(op_sel)
+
+        # Lógica combinacional: saídas da FSM e datapath
+        sinais = self.sinais_controle(op_sel)
+        mux_sel = sinais['mux_sel']
+
+        is_sub = (op_sel & 1).astype(bool)
+        soma_sub = np.where(is_sub,
+                            subtracao_swar(self.reg_a, self.reg_b),
+                            soma_swar(self.reg_a, self.reg_b))
+        if self.arvore:
+            soma_produtos = sum(_lane(self.reg_a, np.uint8(lane)) * _lane(self.reg_b, np.uint8(lane))
+                                for lane in range(4))
+            acc_in = self.parcial_reg if self.pipeline_arvore else soma_produtos
+        else:
+            acc_in = _lane(self.reg_a, mux_sel) * _lane(self.reg_b, mux_sel)
+        mux_out = np.where(mux_sel == 0b00, soma_sub,
+                           np.where(mux_sel == 0b01, self.acc.view(np.uint32), np.uint32(0)))
+
+        dot = op_sel == OP_PRODUTO_ESCALAR
+        inicio = (self.estado == IDLE) & start
+        inicio_burst = inicio & burst
+        ha_pares = self.idx_leitura < self.contagem
+        proximo = PROXIMO_ESTADO[self.estado]
+        proximo = np.where(inicio & ~burst, np.uint8(LOAD_A), proximo)
+        proximo = np.where(inicio_burst,
+                           np.where(self.entradas_burst['contagem'] == 0, np.uint8(DONE_STATE),
+                                    np.uint8(BURST_LER)), proximo)
+        inicio_dot_unica, inicio_dot_burst = self._inicio_dot
+        proximo = np.where((self.estado == LOAD_B) & dot, np.uint8(inicio_dot_unica), proximo)
+        proximo = np.where((self.estado == BURST_CARGA) & dot, np.uint8(inicio_dot_burst),
+                           np.where((self.estado == BURST_CARGA) & ha_pares, np.uint8(BURST_LER), proximo))
+        write_back_burst = self.estado == BURST_DOT_WB
+        proximo = np.where(write_back_burst, np.where(self.idx_leitura > self.idx_escrita + 1,
+                                                      np.uint8(inicio_dot_burst), np.uint8(DONE_STATE)),
+                           proximo)
+
+        if self.gravador is not None:
+            self.gravador.registrar(self.ciclo, {
+                'rst': np.broadcast_to(np.asarray(rst, dtype=bool), (self.n,)),
+                'start': start, 'burst': burst, 'op_sel': op_sel, 'estado_atual': self.estado,
+                **sinais,
+                'bram_val_a': self.bram_val_a, 'bram_val_b': self.bram_val_b,
+                'reg_a_out': self.reg_a, 'reg_b_out': self.reg_b, 'acc_out': self.acc,
+                'mux_out': mux_out,
+            })
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_estados(self.estado)
+
+        # Borda de subida do clock
+        addr_a = sinais['bram_addr_a']
+        addr_b = sinais['bram_addr_b']
+        escrita = sinais['bram_we']
+        self.bram[self._indices[escrita], addr_a[escrita]] = mux_out[escrita]
+
+        val_a_anterior = self.bram_val_a
+        val_b_anterior = self.bram_val_b
+        self.bram_val_a = self.bram[self._indices, addr_a]
+        self.bram_val_b = self.bram[self._indices, addr_b]
+
+        zero = np.uint32(0)
+        self.reg_a = np.where(rst, zero, np.where(sinais['reg_a_load'], val_a_anterior, self.reg_a))
+        self.reg_b = np.where(rst, zero, np.where(sinais['reg_b_load'], val_b_anterior, self.reg_b))
+        self.acc = np.where(sinais['acc_rst'], np.int32(0),
+                            np.where(sinais['acc_en'], wrap_24bit(self.acc.astype(np.int64) + acc_in), self.acc))
+        if self.pipeline_arvore:
+            self.parcial_reg = soma_produtos.astype(np.int32)
+        # Contadores e registros do modo rajada
+        avanca_leitura = ((self.estado == BURST_LER)
+                          | (np.isin(self.estado, (BURST_DOT_3, BURST_DOT_ARVORE)) & ha_pares))
+        avanca_escrita = np.isin(self.estado, ESTADOS_ESCRITA_BURST) & escrita
+        self.idx_leitura = np.where(rst | inicio_burst, np.uint8(0),
+                                    self.idx_leitura + avanca_leitura).astype(np.uint8)
+        self.idx_escrita = np.where(rst | inicio_burst, np.uint8(0),
+                                    self.idx_escrita + avanca_escrita).astype(np.uint8)
+        carregar_burst = inicio_burst & ~np.asarray(rst, dtype=bool)
+        for nome in ('base_a', 'base_b', 'base_res', 'contagem'):
+            setattr(self, nome, np.where(carregar_burst, self.entradas_burst[nome], getattr(self, nome)))
+        self.estado = np.where(rst, np.uint8(IDLE), proximo).astype(np.uint8)
+
+        self.ciclo += 1
+        return sinais['done']
+
+    def executar(self, op_sel, max_ciclos: int = 256, burst=False) -> np.ndarray:
+        """
+        Pulsa start por um ciclo e simula até todas as instâncias sinalizarem done.
+
+        Args:
+            op_sel: Código da operação (escalar ou array (N,))
+            max_ciclos: Limite de ciclos antes de abortar
+            burst: Executa em modo rajada com as entradas de configurar_burst()
+
+        Returns:
+            Array (N,) com a latência em ciclos, do ciclo em IDLE que amostra
+            start até o ciclo em DONE_STATE, inclusive
+        """
+        latencia = np.zeros(self.n, dtype=np.int32)
+        pendentes = np.ones(self.n, dtype=bool)
+        for ciclo in range(1, max_ciclos + 1):
+            done = self.passo(start=(ciclo == 1), op_sel=op_sel, burst=burst)
+            concluidas = done & pendentes
+            latencia[concluidas] = ciclo
+            pendentes &= ~done
+            if not pendentes.any():
+                return latencia
+        raise RuntimeError(f"{int(pendentes.sum())} instâncias não concluíram em {max_ciclos} ciclos")
+
+    def resultados(self, base_res: Optional[int] = None, contagem: Optional[int] = None) -> np.ndarray:
+        """
+        Retorna as palavras de resultado de cada instância.
+
+        Args:
+            base_res: Endereço do primeiro resultado da rajada (padrão: o
+                endereço fixo do modo de operação única)
+            contagem: Número de resultados da rajada
+
+        Returns:
+            Array (N,) no modo de operação única ou (N, contagem) na rajada
+        """
+        if contagem is None:
+            return self.bram[:, ENDERECO_RESULTADO if base_res is None else base_res].copy()
+        enderecos = (base_res + np.arange(contagem)) % BRAM_PALAVRAS
+        return self.bram[:, enderecos]
+
+
+def ciclos_por_operacao(contagem: Optional[int] = None, variante_dot: str = 'serial') -> Dict[str, int]:
+    """
+    Obtém por simulação o número de ciclos de cada operação da FSM.
+
+    Args:
+        contagem: Se informado, mede uma rajada com este número de pares
+        variante_dot: Datapath do produto escalar (chave de VARIANTES_DOT)
+
+    Returns:
+        Dicionário operação -> ciclos (de IDLE com start até DONE_STATE)
+    """
+    ciclos = {}
+    for nome, codigo in OPERACOES.items():
+        simulador = SimuladorFSMD(1, variante_dot)
+        simulador.reset()
+        if contagem is None:
+            ciclos[nome] = int(simulador.executar(codigo)[0])
+        else:
+            simulador.configurar_burst(0, 0, 0, contagem)
+            ciclos[nome] = int(simulador.executar(codigo, burst=True)[0])
+    return ciclos
+
+
+def main():
+    """Função principal: regressão aleatória e medida de desempenho do simulador."""
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - SIMULADOR CICLO A CICLO (LOCKSTEP)")
+    print("=" * 80)
+    print()
+
+    n_instancias = 100000
+    rng = np.random.default_rng(2025)
+    simulador = SimuladorFSMD(n_instancias)
+    simulador.reset()
+
+    print(f"Instâncias simuladas: {n_instancias:,}")
+    print()
+    for nome, codigo in OPERACOES.items():
+        lote_a = rng.integers(-128, 128, size=(n_instancias, 4), dtype=np.int8)
+        lote_b = rng.integers(-128, 128, size=(n_instancias, 4), dtype=np.int8)
+        simulador.carregar_operandos(lote_a, lote_b)
+
+        ciclo_inicial = simulador.ciclo
+        inicio = time.perf_counter()
+        latencia = simulador.executar(codigo)
+        tempo = time.perf_counter() - inicio
+        ciclos = simulador.ciclo - ciclo_inicial
+
+        print(f"{nome.upper()}:")
+        print(f"  Latência: {int(latencia.min())} ciclos")
+        print(f"  Tempo de simulação: {tempo * 1e3:.2f} ms ({ciclos} ciclos)")
+        print(f"  Desempenho: {n_instancias * ciclos / tempo / 1e6:.2f} M instância-ciclos/s")
+        print()
+
+    print("Modo rajada (ciclos por operação):")
+    unica = ciclos_por_operacao()
+    for contagem in (1, 8, BRAM_PALAVRAS):
+        rajada = ciclos_por_operacao(contagem)
+        print(f"  {contagem:2d} pares: " + ", ".join(
+            f"{nome} {rajada[nome] / contagem:.2f} (única: {unica[nome]})" for nome in OPERACOES))
+    print()
+
+    print("Variantes do produto escalar (ciclos por operação):")
+    for variante in VARIANTES_DOT:
+        unica = ciclos_por_operacao(variante_dot=variante)['produto_escalar']
+        rajada = ciclos_por_operacao(BRAM_PALAVRAS, variante)['produto_escalar'] / BRAM_PALAVRAS
+        print(f"  {variante:<16} única: {unica}, rajada de {BRAM_PALAVRAS} pares: {rajada:.2f}")
+    print()
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Processamento em Streaming de Arquivos Mapeados
+Arquivo: streaming_mmap.py
+Descrição: Pipeline out-of-core que mapeia em memória um arquivo de pares de
+           vetores A/B empacotados, processa blocos de tamanho fixo com os
+           kernels SWAR do processador em software e grava os resultados em
+           um arquivo de saída também mapeado em memória
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Formato do arquivo de entrada: sequência de registros de 8 bytes, cada um com
+a palavra de 32 bits do vetor A seguida da palavra do vetor B, no layout da
+BRAMDualPort (little-endian, elemento i nos bits 8*i+7 downto 8*i).
+
+Formato do arquivo de saída: uma palavra de 32 bits por par. Para soma e
+subtração, a palavra empacotada do resultado; para o produto escalar, o
+valor int32 com sinal (como escrito na BRAM via resize(signed(acc_out), 32)).
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional
+
+from processador_vetorial_sw import (
+    PALAVRA_DTYPE,
+    produto_escalar_swar,
+    soma_swar,
+    subtracao_swar,
+)
+
+# Registro de entrada: par de palavras (A, B)
+PAR_DTYPE = np.dtype([('a', PALAVRA_DTYPE), ('b', PALAVRA_DTYPE)])
+
+KERNELS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    'soma': soma_swar,
+    'subtracao': subtracao_swar,
+    'produto_escalar': produto_escalar_swar,
+}
+
+TAMANHO_BLOCO_PADRAO = 1 << 20  # pares por bloco (8 MiB de entrada)
+
+
+def processar_arquivo(entrada: str, saida: str, operacao: str,
+                      tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                      ao_concluir_bloco: Optional[Callable[[int, int, float], None]] = None
+                      ) -> List[Dict[str, float]]:
+    """
+    Processa um arquivo de pares A/B bloco a bloco, com memória residente
+    limitada ao tamanho do bloco independentemente do tamanho do arquivo.
+
+    Args:
+        entrada: Arquivo binário de registros PAR_DTYPE
+        saida: Arquivo binário de resultados (criado ou sobrescrito)
+        operacao: 'soma', 'subtracao' ou 'produto_escalar'
+        tamanho_bloco: Pares processados por bloco
+        ao_concluir_bloco: Função chamada com (índice, pares, segundos) a cada bloco
+
+    Returns:
+        Lista com pares, tempo e vazão de cada bloco
+    """
+    kernel = KERNELS[operacao]
+    n = os.path.getsize(entrada) // PAR_DTYPE.itemsize
+    with open(saida, 'wb') as f:
+        f.truncate(n * PALAVRA_DTYPE.itemsize)
+
+    # Cada bloco é mapeado e desmapeado individualmente, de modo que as
+    # páginas já processadas deixam de contar na memória residente
+    estatisticas = []
+    for indice, inicio_bloco in enumerate(range(0, n, tamanho_bloco)):
+        pares_bloco = min(tamanho_bloco, n - inicio_bloco)
+        inicio = time.perf_counter()
+        bloco = np.memmap(entrada, dtype=PAR_DTYPE, mode='r', shape=(pares_bloco,),
+                          offset=inicio_bloco * PAR_DTYPE.itemsize)
+        resultado = np.memmap(saida, dtype=PALAVRA_DTYPE, mode='r+', shape=(pares_bloco,),
+                              offset=inicio_bloco * PALAVRA_DTYPE.itemsize)
+        resultado[:] = kernel(bloco['a'], bloco['b'])
+        resultado.flush()
+        del bloco, resultado
+        tempo = time.perf_counter() - inicio
+        estatisticas.append({
+            'pares': pares_bloco,
+            'tempo_s': tempo,
+            'vazao_mpares_s': pares_bloco / tempo / 1e6,
+        })
+        if ao_concluir_bloco is not None:
+            ao_concluir_bloco(indice, pares_bloco, tempo)
+
+    return estatisticas
+
+
+def gerar_arquivo_pares(caminho: str, n_pares: int, semente: int = 0,
+                        tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+    """
+    Gera um arquivo de pares A/B aleatórios bloco a bloco.
+
+    Args:
+        caminho: Arquivo de saída
+        n_pares: Número de registros
+        semente: Semente do gerador pseudoaleatório
+        tamanho_bloco: Pares gerados por bloco
+    """
+    rng = np.random.default_rng(semente)
+    with open(caminho, 'wb') as f:
+        for inicio in range(0, n_pares, tamanho_bloco):
+            bloco = np.empty(min(tamanho_bloco, n_pares - inicio), dtype=PAR_DTYPE)
+            bloco['a'] = rng.integers(0, 1 << 32, size=len(bloco), dtype=np.uint32)
+            bloco['b'] = rng.integers(0, 1 << 32, size=len(bloco), dtype=np.uint32)
+            bloco.tofile(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Função principal: processa (ou gera e processa) um arquivo de pares."""
+    parser = argparse.ArgumentParser(description="Processamento em streaming de arquivos de vetores empacotados")
+    parser.add_argument('entrada', help="Arquivo de pares A/B (8 bytes por par)")
+    parser.add_argument('saida', help="Arquivo de resultados (4 bytes por par)")
+    parser.add_argument('--operacao', default='produto_escalar', choices=list(KERNELS))
+    parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO_PADRAO, help="Pares por bloco")
+    parser.add_argument('--gerar', type=int, metavar='N',
+                        help="Gera antes um arquivo de entrada aleatório com N pares")
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - STREAMING DE ARQUIVOS MAPEADOS")
+    print("=" * 80)
+    print()
+
+    if args.gerar:
+        print(f"Gerando {args.gerar:,} pares em {args.entrada}...")
+        gerar_arquivo_pares(args.entrada, args.gerar, tamanho_bloco=args.bloco)
+
+    tamanho = os.path.getsize(args.entrada)
+    print(f"Entrada: {args.entrada} ({tamanho / 2**20:.1f} MiB, {tamanho // PAR_DTYPE.itemsize:,} pares)")
+    print(f"Operação: {args.operacao.upper()}")
+    print()
+
+    def relatar(indice: int, pares: int, tempo: float):
+        print(f"  Bloco {indice:>5}: {pares:>10,} pares em {tempo * 1e3:8.2f} ms "
+              f"({pares / tempo / 1e6:8.1f} M pares/s)")
+
+    inicio = time.perf_counter()
+    blocos = processar_arquivo(args.entrada, args.saida, args.operacao, args.bloco, relatar)
+    tempo = time.perf_counter() - inicio
+    total = sum(b['pares'] for b in blocos)
+
+    print()
+    print(f"Total: {total:,} pares em {tempo:.2f} s ({total / tempo / 1e6:.1f} M pares/s, "
+          f"{tamanho / tempo / 2**20:.0f} MiB/s)")
+    print(f"Resultados salvos em: {args.saida}")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
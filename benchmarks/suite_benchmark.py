@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Suíte de Benchmark do Modelo em Software
+Arquivo: suite_benchmark.py
+Descrição: Mede as operações do processador vetorial em software para cada
+           backend (escalar, rapido, lote, empacotado, lut) e para cada
+           configuração do ProcessadorSIMD (lanes x largura) sobre conjuntos
+           de dados aleatórios, com repetições, estatísticas robustas e saída
+           JSON comparável com uma referência armazenada
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from executor_paralelo import curva_escalonamento
+from processador_vetorial_sw import (CONFIGURACOES_SIMD, ProcessadorSIMD, ProcessadorVetorialEscalar,
+                                     ProcessadorVetorialSW, empacotar, tabelas_lut)
+
+OPERACOES = ('soma', 'subtracao', 'produto_escalar')
+
+# Métodos do processador por backend e operação
+METODOS = {
+    'escalar': {
+        'soma': 'soma_vetorial',
+        'subtracao': 'subtracao_vetorial',
+        'produto_escalar': 'produto_escalar',
+    },
+    'rapido': {
+        'soma': 'soma',
+        'subtracao': 'subtracao',
+        'produto_escalar': 'produto_escalar',
+    },
+    'rapido_empacotado': {
+        'soma': 'soma_empacotada',
+        'subtracao': 'subtracao_empacotada',
+        'produto_escalar': 'produto_escalar_empacotado',
+    },
+    'lote': {
+        'soma': 'soma_vetorial_lote',
+        'subtracao': 'subtracao_vetorial_lote',
+        'produto_escalar': 'produto_escalar_lote',
+    },
+    'empacotado': {
+        'soma': 'soma_empacotada',
+        'subtracao': 'subtracao_empacotada',
+        'produto_escalar': 'produto_escalar_empacotado',
+    },
+    'lut': {
+        'soma': 'soma_vetorial_lut',
+        'subtracao': 'subtracao_vetorial_lut',
+        'produto_escalar': 'produto_escalar_lut',
+    },
+}
+
+# Backends que fazem uma chamada por par e usam o conjunto limitado por --tamanho-escalar
+BACKENDS_POR_PAR = ('escalar', 'rapido', 'rapido_empacotado')
+
+# Repetições (amostras) mínimas por medida para que o p99 não seja o máximo
+AMOSTRAS_MINIMAS_P99 = 100
+
+Carga = Tuple[Callable[[], Any], int]
+
+
+def gerar_dataset(tamanho: int, semente: int = 0, lanes: int = 4,
+                  largura: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gera pares de vetores aleatórios cobrindo toda a faixa do elemento
+    ([-128, 127] no padrão de 4 x int8).
+
+    Args:
+        tamanho: Número de pares de vetores
+        semente: Semente do gerador pseudoaleatório
+        lanes: Elementos por vetor
+        largura: Largura do elemento em bits
+
+    Returns:
+        Tupla (lote_a, lote_b) com formato (tamanho, lanes) cada
+    """
+    rng = np.random.default_rng(semente)
+    minimo = -(1 << (largura - 1))
+    tipo = np.min_scalar_type(minimo)
+    lote_a = rng.integers(minimo, -minimo, size=(tamanho, lanes), dtype=tipo)
+    lote_b = rng.integers(minimo, -minimo, size=(tamanho, lanes), dtype=tipo)
+    return lote_a, lote_b
+
+
+def preparar_escalar(processador: ProcessadorVetorialSW, operacao: str,
+                     lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma chamada do método escalar por par, com o método já resolvido."""
+    funcao = getattr(processador, METODOS['escalar'][operacao])
+    pares = list(zip(lote_a, lote_b))
+
+    def carga():
+        for vec_a, vec_b in pares:
+            funcao(vec_a, vec_b)
+
+    return carga, len(pares)
+
+
+def preparar_rapido(processador: ProcessadorVetorialSW, operacao: str,
+                    lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma chamada do caminho rápido por par, sobre tuplas de ints Python."""
+    funcao = getattr(ProcessadorVetorialEscalar(), METODOS['rapido'][operacao])
+    pares = list(zip(map(tuple, lote_a.tolist()), map(tuple, lote_b.tolist())))
+
+    def carga():
+        for vec_a, vec_b in pares:
+            funcao(vec_a, vec_b)
+
+    return carga, len(pares)
+
+
+def preparar_rapido_empacotado(processador: ProcessadorVetorialSW, operacao: str,
+                               lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma chamada do caminho rápido por par, sobre palavras de 32 bits (int)."""
+    funcao = getattr(ProcessadorVetorialEscalar(), METODOS['rapido_empacotado'][operacao])
+    pares = list(zip(empacotar(lote_a).tolist(), empacotar(lote_b).tolist()))
+
+    def carga():
+        for palavra_a, palavra_b in pares:
+            funcao(palavra_a, palavra_b)
+
+    return carga, len(pares)
+
+
+def preparar_lote(processador: ProcessadorVetorialSW, operacao: str,
+                  lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma única chamada da API em lote sobre o conjunto inteiro."""
+    funcao = getattr(processador, METODOS['lote'][operacao])
+    return (lambda: funcao(lote_a, lote_b)), len(lote_a)
+
+
+def preparar_empacotado(processador: ProcessadorVetorialSW, operacao: str,
+                        lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma única chamada do modo SWAR sobre as palavras de 32 bits."""
+    funcao = getattr(processador, METODOS['empacotado'][operacao])
+    palavras_a = empacotar(lote_a)
+    palavras_b = empacotar(lote_b)
+    return (lambda: funcao(palavras_a, palavras_b)), len(lote_a)
+
+
+def preparar_lut(processador: ProcessadorVetorialSW, operacao: str,
+                 lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma única chamada do backend LUT, com as tabelas já construídas."""
+    tabelas_lut()
+    funcao = getattr(processador, METODOS['lut'][operacao])
+    return (lambda: funcao(lote_a, lote_b)), len(lote_a)
+
+
+def preparar_simd(processador: ProcessadorSIMD, operacao: str,
+                  lote_a: np.ndarray, lote_b: np.ndarray) -> Carga:
+    """Uma única chamada da API em lote de uma configuração do ProcessadorSIMD."""
+    funcao = getattr(processador, METODOS['lote'][operacao])
+    return (lambda: funcao(lote_a, lote_b)), len(lote_a)
+
+
+# Backends disponíveis: nome -> função que devolve (carga, número de operações)
+BACKENDS: Dict[str, Callable[..., Carga]] = {
+    'escalar': preparar_escalar,
+    'rapido': preparar_rapido,
+    'rapido_empacotado': preparar_rapido_empacotado,
+    'lote': preparar_lote,
+    'empacotado': preparar_empacotado,
+    'lut': preparar_lut,
+}
+
+
+def estatisticas(tempos_ns: np.ndarray) -> Dict[str, float]:
+    """
+    Resume os tempos por operação de várias repetições.
+
+    O intervalo de confiança de 95% da média usa a aproximação normal
+    (1.96 * desvio padrão / sqrt(n)). O p99 só se distingue do máximo com
+    ao menos AMOSTRAS_MINIMAS_P99 repetições (ver executar_suite).
+
+    Args:
+        tempos_ns: Tempo por operação (ns) de cada repetição
+
+    Returns:
+        Dicionário com min, mediana, media, p99, max, desvio, ic95 e vazão
+    """
+    tempos_ns = np.asarray(tempos_ns, dtype=np.float64)
+    media = float(tempos_ns.mean())
+    desvio = float(tempos_ns.std(ddof=1)) if len(tempos_ns) > 1 else 0.0
+    margem = 1.96 * desvio / np.sqrt(len(tempos_ns))
+    mediana = float(np.median(tempos_ns))
+    return {
+        'min_ns': float(tempos_ns.min()),
+        'mediana_ns': mediana,
+        'media_ns': media,
+        'p99_ns': float(np.percentile(tempos_ns, 99)),
+        'max_ns': float(tempos_ns.max()),
+        'desvio_ns': desvio,
+        'ic95_ns': [media - margem, media + margem],
+        'vazao_mops': 1e3 / mediana,
+        'repeticoes': len(tempos_ns),
+    }
+
+
+def medir(carga: Callable[[], Any], n_ops: int, repeticoes: int = 30,
+          aquecimento: int = 3) -> Dict[str, float]:
+    """
+    Cronometra repetidamente uma carga e calcula o tempo por operação.
+
+    Args:
+        carga: Função sem argumentos que processa o conjunto de dados
+        n_ops: Número de operações realizadas por chamada da carga
+        repeticoes: Número de repetições cronometradas
+        aquecimento: Número de execuções descartadas
+
+    Returns:
+        Estatísticas do tempo por operação (ver estatisticas)
+    """
+    for _ in range(aquecimento):
+        carga()
+    tempos_ns = np.empty(repeticoes, dtype=np.float64)
+    relogio = time.perf_counter_ns
+    for i in range(repeticoes):
+        inicio = relogio()
+        carga()
+        tempos_ns[i] = (relogio() - inicio) / n_ops
+    return estatisticas(tempos_ns)
+
+
+def executar_suite(backends: List[str], operacoes: List[str], tamanho: int,
+                   tamanho_escalar: int, repeticoes: int, semente: int,
+                   configuracoes_simd: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """
+    Executa a suíte para todas as combinações de backend e operação.
+
+    Args:
+        backends: Nomes dos backends (chaves de BACKENDS)
+        operacoes: Nomes das operações
+        tamanho: Número de pares de vetores do conjunto de dados
+        tamanho_escalar: Limite de pares para os backends de uma chamada por par
+        repeticoes: Repetições cronometradas por medida (no mínimo
+            AMOSTRAS_MINIMAS_P99, para que o p99 não seja o máximo)
+        semente: Semente do conjunto de dados
+        configuracoes_simd: Chaves de CONFIGURACOES_SIMD medidas como backends
+            'simd_<configuração>' (mesmo tamanho e semente; elementos na faixa
+            de cada largura)
+
+    Returns:
+        Dicionário serializável em JSON com metadados e resultados
+    """
+    repeticoes = max(repeticoes, AMOSTRAS_MINIMAS_P99)
+    processador = ProcessadorVetorialSW()
+    lote_a, lote_b = gerar_dataset(tamanho, semente)
+    resultados: Dict[str, Dict[str, Any]] = {}
+    for backend in backends:
+        n = min(tamanho, tamanho_escalar) if backend in BACKENDS_POR_PAR else tamanho
+        resultados[backend] = {}
+        for operacao in operacoes:
+            carga, n_ops = BACKENDS[backend](processador, operacao, lote_a[:n], lote_b[:n])
+            resultados[backend][operacao] = medir(carga, n_ops, repeticoes)
+            resultados[backend][operacao]['tamanho'] = n_ops
+    for nome in configuracoes_simd:
+        simd = ProcessadorSIMD(*CONFIGURACOES_SIMD[nome])
+        lote_a, lote_b = gerar_dataset(tamanho, semente, simd.lanes, simd.largura)
+        resultados[f'simd_{nome}'] = {}
+        for operacao in operacoes:
+            carga, n_ops = preparar_simd(simd, operacao, lote_a, lote_b)
+            medida = medir(carga, n_ops, repeticoes)
+            medida.update(tamanho=n_ops, lanes=simd.lanes, largura=simd.largura,
+                          largura_acc=simd.largura_acc,
+                          vazao_melementos=medida['vazao_mops'] * simd.lanes)
+            resultados[f'simd_{nome}'][operacao] = medida
+    return {
+        'metadados': {
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'processador': platform.processor(),
+            'tamanho': tamanho,
+            'repeticoes': repeticoes,
+            'semente': semente,
+            'configuracoes_simd': list(configuracoes_simd),
+        },
+        'resultados': resultados,
+    }
+
+
+def medir_por_tamanho(backends: List[str], operacoes: List[str], tamanhos: List[int],
+                      repeticoes: int, semente: int, ops_por_medida: int = 100_000) -> Dict[str, Any]:
+    """
+    Mede o tempo por operação em função do tamanho do lote.
+
+    Lotes pequenos são chamados várias vezes por repetição (até cerca de
+    ops_por_medida operações), para que o tempo medido não fique na
+    resolução do relógio.
+
+    Args:
+        backends: Nomes dos backends (chaves de BACKENDS)
+        operacoes: Nomes das operações
+        tamanhos: Tamanhos de lote (pares por chamada)
+        repeticoes: Repetições cronometradas por medida
+        semente: Semente do conjunto de dados
+        ops_por_medida: Operações aproximadas por repetição
+
+    Returns:
+        Dicionário backend -> operação -> {'tamanhos', 'mediana_ns', 'min_ns'}
+        (tempos por operação, um valor por tamanho)
+    """
+    processador = ProcessadorVetorialSW()
+    lote_a, lote_b = gerar_dataset(max(tamanhos), semente)
+    curvas: Dict[str, Any] = {}
+    for backend in backends:
+        curvas[backend] = {}
+        for operacao in operacoes:
+            medianas, minimos = [], []
+            for tamanho in tamanhos:
+                carga, n_ops = BACKENDS[backend](processador, operacao, lote_a[:tamanho], lote_b[:tamanho])
+                chamadas = max(1, ops_por_medida // n_ops)
+
+                def carga_repetida(carga=carga, chamadas=chamadas):
+                    for _ in range(chamadas):
+                        carga()
+
+                medida = medir(carga_repetida, n_ops * chamadas, repeticoes)
+                medianas.append(medida['mediana_ns'])
+                minimos.append(medida['min_ns'])
+            curvas[backend][operacao] = {'tamanhos': list(tamanhos), 'mediana_ns': medianas,
+                                         'min_ns': minimos}
+    return curvas
+
+
+def comparar_com_referencia(atual: Dict[str, Any], referencia: Dict[str, Any],
+                            tolerancia: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compara a mediana de cada medida com a de uma execução de referência.
+
+    Args:
+        atual: Resultado de executar_suite
+        referencia: Resultado armazenado anteriormente
+        tolerancia: Aumento relativo máximo aceito na mediana (0.10 = 10%)
+
+    Returns:
+        Lista de regressões encontradas (vazia se nenhuma)
+    """
+    regressoes = []
+    for backend, medidas in atual['resultados'].items():
+        for operacao, medida in medidas.items():
+            base = referencia.get('resultados', {}).get(backend, {}).get(operacao)
+            if base is None:
+                continue
+            variacao = medida['mediana_ns'] / base['mediana_ns'] - 1
+            if variacao > tolerancia:
+                regressoes.append({
+                    'backend': backend,
+                    'operacao': operacao,
+                    'referencia_ns': base['mediana_ns'],
+                    'atual_ns': medida['mediana_ns'],
+                    'variacao': variacao,
+                })
+    return regressoes
+
+
+def imprimir_resultados(suite: Dict[str, Any]):
+    """Imprime uma tabela com as estatísticas de cada medida."""
+    print(f"{'Backend':<18} {'Operação':<17} {'min (ns)':>10} {'mediana':>10} "
+          f"{'p99':>10} {'IC95 média':>21} {'Mops/s':>10}")
+    print("-" * 100)
+    for backend, medidas in suite['resultados'].items():
+        for operacao, m in medidas.items():
+            ic = f"[{m['ic95_ns'][0]:.1f}, {m['ic95_ns'][1]:.1f}]"
+            print(f"{backend:<18} {operacao:<17} {m['min_ns']:>10.1f} {m['mediana_ns']:>10.1f} "
+                  f"{m['p99_ns']:>10.1f} {ic:>21} {m['vazao_mops']:>10.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Função principal: executa a suíte e opcionalmente compara com a referência."""
+    parser = argparse.ArgumentParser(description="Suíte de benchmark do processador vetorial em software")
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument('--operacoes', nargs='+', default=list(OPERACOES), choices=list(OPERACOES))
+    parser.add_argument('--tamanho', type=int, default=1_000_000,
+                        help="Pares de vetores por conjunto de dados (padrão: %(default)s)")
+    parser.add_argument('--tamanho-escalar', type=int, default=5_000,
+                        help="Limite de pares para os backends de uma chamada por par (padrão: %(default)s)")
+    parser.add_argument('--simd', nargs='*', default=[], choices=list(CONFIGURACOES_SIMD),
+                        help="Configurações lanes x largura do ProcessadorSIMD a medir")
+    parser.add_argument('--repeticoes', type=int, default=AMOSTRAS_MINIMAS_P99,
+                        help="Repetições por medida (no mínimo %(default)s, para o p99)")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--escalonamento', action='store_true',
+                        help="Mede também o executor paralelo de 1 até todos os núcleos")
+    parser.add_argument('--tamanhos-lote', type=int, nargs='+',
+                        help="Mede também o tempo por operação destes tamanhos de lote "
+                             "(backends em lote; usado por analise_hw_sw.py)")
+    parser.add_argument('--saida', help="Arquivo JSON de resultados")
+    parser.add_argument('--referencia', help="Arquivo JSON de referência para detectar regressões")
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help="Aumento relativo máximo da mediana (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    print("=" * 100)
+    print("PROCESSADOR VETORIAL - SUÍTE DE BENCHMARK SOFTWARE")
+    print("=" * 100)
+    print()
+
+    suite = executar_suite(args.backends, args.operacoes, args.tamanho,
+                           args.tamanho_escalar, args.repeticoes, args.semente, tuple(args.simd))
+    imprimir_resultados(suite)
+    print()
+
+    if args.simd:
+        print(f"{'Configuração':<14} {'Acumulador':>10} {'Operação':<17} {'Mops/s':>10} {'M elementos/s':>14}")
+        print("-" * 69)
+        for nome in args.simd:
+            for operacao, m in suite['resultados'][f'simd_{nome}'].items():
+                print(f"{nome:<14} {m['largura_acc']:>7} b  {operacao:<17} {m['vazao_mops']:>10.2f} "
+                      f"{m['vazao_melementos']:>14.2f}")
+        print()
+
+    if args.escalonamento:
+        suite['escalonamento'] = curva_escalonamento(args.tamanho, repeticoes=min(args.repeticoes, 5),
+                                                     semente=args.semente)
+        print(f"{'Processos':>10} {'ns/op':>10} {'Mops/s':>10} {'Speedup':>10} {'Eficiência':>12}")
+        print("-" * 56)
+        for ponto in suite['escalonamento']:
+            print(f"{ponto['processos']:>10} {ponto['mediana_ns']:>10.2f} {ponto['vazao_mops']:>10.1f} "
+                  f"{ponto['speedup']:>9.2f}x {ponto['eficiencia']:>11.0%}")
+        print()
+
+    if args.tamanhos_lote:
+        backends_lote = [b for b in args.backends if b not in BACKENDS_POR_PAR]
+        suite['por_tamanho'] = medir_por_tamanho(backends_lote, args.operacoes, args.tamanhos_lote,
+                                                 min(args.repeticoes, 10), args.semente)
+        print(f"{'Backend':<18} {'Operação':<17} " + " ".join(f"{n:>10,}" for n in args.tamanhos_lote))
+        print("-" * (36 + 11 * len(args.tamanhos_lote)))
+        for backend, curvas in suite['por_tamanho'].items():
+            for operacao, curva in curvas.items():
+                print(f"{backend:<18} {operacao:<17} " + " ".join(f"{t:>10.1f}" for t in curva['mediana_ns']))
+        print("(ns por operação)")
+        print()
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(suite, f, indent=2)
+        print(f"Resultados salvos em: {args.saida}")
+
+    if args.referencia:
+        with open(args.referencia, encoding='utf-8') as f:
+            referencia = json.load(f)
+        regressoes = comparar_com_referencia(suite, referencia, args.tolerancia)
+        if regressoes:
+            print(f"{len(regressoes)} regressão(ões) acima de {args.tolerancia:.0%}:")
+            for r in regressoes:
+                print(f"  {r['backend']}/{r['operacao']}: {r['referencia_ns']:.1f} ns -> "
+                      f"{r['atual_ns']:.1f} ns ({r['variacao']:+.1%})")
+            return 1
+        print("Nenhuma regressão em relação à referência.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+"""
+Testes de regressão da exploração do espaço de projeto: por padrão nenhuma
+configuração da fronteira de Pareto usa clock acima do próprio Fmax estimado.
+"""
+
+import numpy as np
+
+from exploracao_projeto import explorar
+
+
+def test_fronteira_respeita_fmax_por_padrao():
+    resultados = explorar()
+    pareto = resultados['pareto']
+    assert pareto.any()
+    assert resultados['dentro_fmax'][pareto].all()
+    assert resultados['pipeline'][pareto].any()
+
+
+def test_ignorar_fmax_mantem_configuracoes_acima_do_fmax():
+    resultados = explorar(limitar_fmax=False)
+    acima = ~resultados['dentro_fmax']
+    assert acima.any()
+    assert resultados['viavel'][acima].any()
+    assert np.array_equal(explorar()['viavel'], resultados['viavel'] & resultados['dentro_fmax'])
@@ -0,0 +1,27 @@
+"""
+Testes de regressão de wrap_acumulador e do ProcessadorSIMD com acumulador
+de 64 bits, que estourava ao reduzir entradas int32.
+"""
+
+import numpy as np
+
+from processador_vetorial_sw import ProcessadorSIMD, wrap_acumulador
+from verificacao import verificar_simd
+
+
+def test_wrap_acumulador_64_bits_aceita_int32():
+    valores = np.array([-(1 << 31), -5, 0, 7, (1 << 31) - 1], dtype=np.int32)
+    reduzidos = wrap_acumulador(valores, 64)
+    assert reduzidos.dtype == np.int64
+    assert reduzidos.tolist() == valores.tolist()
+
+
+def test_produto_escalar_acumulador_64_bits():
+    lote = np.full((2, 4), -128, dtype=np.int8)
+    assert ProcessadorSIMD(4, 8, 64).produto_escalar_lote(lote, lote).tolist() == [65536, 65536]
+
+
+def test_configuracoes_simd_bit_a_bit():
+    relatorio = verificar_simd(pares=2_000)
+    assert relatorio['divergencias']
+    assert not any(relatorio['divergencias'].values()), relatorio['exemplos']
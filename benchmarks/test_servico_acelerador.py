@@ -0,0 +1,82 @@
+"""
+Testes de regressão do despachante de servico_acelerador.py: uma requisição
+inválida ou um cliente que desiste não podem derrubar o laço de agrupamento,
+requisições após o encerramento são rejeitadas e o substituto do FPGA cobra
+ciclos de rajada.
+"""
+
+import asyncio
+
+import pytest
+
+from servico_acelerador import (
+    BYTES_POR_PAR,
+    BYTES_POR_RESULTADO,
+    METODOS_LOTE,
+    PARES_POR_RAJADA,
+    BackendFPGASimulado,
+    BackendSoftware,
+    EnlaceSerial,
+    ServicoAcelerador,
+)
+from simulador_fsmd import ciclos_por_operacao
+
+
+def test_requisicao_invalida_rejeita_somente_o_cliente():
+    async def cenario():
+        async with ServicoAcelerador(BackendSoftware(), janela_s=5e-3) as servico:
+            validas = [asyncio.create_task(servico.submeter('soma', [1, 2, 3, 4], [1, 1, 1, 1]))
+                       for _ in range(3)]
+            with pytest.raises(ValueError):
+                await servico.submeter('soma', [200, 2, 3, 4], [1, 1, 1, 1])
+            with pytest.raises(ValueError):
+                await servico.submeter('produto_escalar', [1, 2, 3], [1, 1, 1, 1])
+            with pytest.raises(ValueError):
+                await servico.submeter('soma', [[1, 2], [3]], [1, 1, 1, 1])
+            resultados = await asyncio.gather(*validas)
+            depois = await servico.submeter('produto_escalar', [1, 2, 3, 4], [1, 1, 1, 1])
+        return resultados, depois
+
+    resultados, depois = asyncio.run(asyncio.wait_for(cenario(), 5))
+    assert resultados == [[2, 3, 4, 5]] * 3
+    assert depois == 10
+
+
+def test_cliente_cancelado_nao_derruba_o_despachante():
+    class BackendLento(BackendSoftware):
+        async def executar(self, operacao, lote_a, lote_b):
+            await asyncio.sleep(0.05)
+            return await super().executar(operacao, lote_a, lote_b)
+
+    async def cenario():
+        async with ServicoAcelerador(BackendLento(), janela_s=1e-3) as servico:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(servico.submeter('soma', [1, 2, 3, 4], [1, 1, 1, 1]), 0.01)
+            return await servico.submeter('subtracao', [1, 2, 3, 4], [1, 1, 1, 1])
+
+    assert asyncio.run(asyncio.wait_for(cenario(), 5)) == [0, 1, 2, 3]
+
+
+def test_requisicao_apos_encerramento_e_rejeitada():
+    async def cenario():
+        async with ServicoAcelerador(BackendSoftware(), janela_s=1e-3) as servico:
+            antes = await servico.submeter('soma', [1, 2, 3, 4], [1, 1, 1, 1])
+        with pytest.raises(RuntimeError):
+            await servico.submeter('soma', [1, 2, 3, 4], [1, 1, 1, 1])
+        return antes
+
+    assert asyncio.run(asyncio.wait_for(cenario(), 5)) == [2, 3, 4, 5]
+
+
+def test_fpga_simulado_executa_em_rajadas():
+    backend = BackendFPGASimulado(enlace=EnlaceSerial(1e9, latencia_quadro_s=0.0, bytes_cabecalho=0))
+    ciclos = ciclos_por_operacao()
+    periodo = 1 / backend.frequencia_hz
+    enlace = backend.enlace.tempo_quadro
+    for operacao in METODOS_LOTE:
+        rajada = ciclos_por_operacao(PARES_POR_RAJADA)[operacao]
+        assert rajada < PARES_POR_RAJADA * ciclos[operacao]
+        n = 2 * PARES_POR_RAJADA + 3
+        esperado = (2 * rajada + ciclos_por_operacao(3)[operacao]) * periodo
+        transferencia = enlace(n * BYTES_POR_PAR) + enlace(n * BYTES_POR_RESULTADO)
+        assert backend.tempo_lote(operacao, n) == pytest.approx(esperado + transferencia)
@@ -0,0 +1,65 @@
+"""
+Testes de consistência entre tb/tb_burst_processador_vetorial.vhdl e o modelo
+de ciclos: os vetores do testbench, executados em rajada no SimuladorFSMD em
+cada variante do produto escalar (generics ARVORE_SOMA/ARVORE_PIPELINE),
+produzem os resultados e as contagens de ciclos que o testbench espera.
+"""
+
+import os
+import re
+
+import numpy as np
+import pytest
+
+from simulador_fsmd import OPERACOES, VARIANTES_DOT, SimuladorFSMD, ciclos_por_operacao
+from verificacao import referencia_add_sub_clip, referencia_produto_escalar
+
+CAMINHO_TB = os.path.join(os.path.dirname(__file__), '..', 'tb', 'tb_burst_processador_vetorial.vhdl')
+
+# Endereços usados pelo testbench (BASE_A_END, BASE_B_END, RES_*_END)
+BASE_A, BASE_B = 0, 8
+BASE_RESULTADO = {'soma': 16, 'subtracao': 24, 'produto_escalar': 16}
+
+# ciclos_por_par_dot do testbench, por variante
+CICLOS_POR_PAR_DOT = {'serial': 5, 'arvore': 2, 'arvore_pipeline': 3}
+
+
+def _vetores_tb(nome: str) -> np.ndarray:
+    """Lê a constante VEC_A/VEC_B (palavras hexadecimais) do testbench."""
+    with open(CAMINHO_TB, encoding='utf-8') as f:
+        fonte = f.read()
+    bloco = re.search(rf"constant {nome} : palavras_t\(.*?\) := \((.*?)\);", fonte, re.S).group(1)
+    return np.array([int(h, 16) for h in re.findall(r'x"([0-9A-Fa-f]{8})"', bloco)], dtype=np.uint32)
+
+
+def _lote(palavras: np.ndarray) -> np.ndarray:
+    return palavras.view(np.int8).reshape(-1, 4)
+
+
+@pytest.mark.parametrize('variante', list(VARIANTES_DOT))
+def test_rajada_do_testbench_no_modelo(variante):
+    palavras_a, palavras_b = _vetores_tb('VEC_A'), _vetores_tb('VEC_B')
+    n = len(palavras_a)
+    lote_a, lote_b = _lote(palavras_a), _lote(palavras_b)
+    esperado = {
+        'soma': referencia_add_sub_clip(lote_a, lote_b, False),
+        'subtracao': referencia_add_sub_clip(lote_a, lote_b, True),
+        'produto_escalar': referencia_produto_escalar(lote_a, lote_b),
+    }
+    ciclos_esperados = {'soma': 2 * n + 3, 'subtracao': 2 * n + 3,
+                        'produto_escalar': CICLOS_POR_PAR_DOT[variante] * n + 4}
+
+    for operacao, codigo in OPERACOES.items():
+        simulador = SimuladorFSMD(1, variante)
+        simulador.reset()
+        simulador.carregar_bram(palavras_a, BASE_A)
+        simulador.carregar_bram(palavras_b, BASE_B)
+        simulador.configurar_burst(BASE_A, BASE_B, BASE_RESULTADO[operacao], n)
+        assert int(simulador.executar(codigo, burst=True)[0]) == ciclos_esperados[operacao]
+        obtido = simulador.resultados(BASE_RESULTADO[operacao], n)[0]
+        if operacao == 'produto_escalar':
+            assert obtido.view(np.int32).tolist() == esperado[operacao].tolist()
+        else:
+            assert _lote(obtido).tolist() == esperado[operacao].tolist()
+
+    assert set(ciclos_por_operacao(0, variante).values()) == {2}
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Verificação Bit a Bit dos Operadores
+Arquivo: verificacao.py
+Descrição: Verificação exaustiva (todas as 65.536 combinações de operandos)
+           do AddSubClip8Bit e do Multiplicador8x8, das configurações do
+           ProcessadorSIMD contra um modelo em inteiros de Python, e
+           varredura aleatória em streaming, distribuída entre processos, do
+           produto escalar de 4 lanes contra o Acumulador24Bit, com
+           relatório de divergências e métricas de cobertura
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from processador_vetorial_sw import (
+    CONFIGURACOES_SIMD,
+    ProcessadorSIMD,
+    ProcessadorVetorialEscalar,
+    ProcessadorVetorialSW,
+    desempacotar,
+    empacotar,
+)
+
+MAX_DIVERGENCIAS_RELATADAS = 10
+
+# Pares da varredura aleatória por processo (~2 s por núcleo)
+AMOSTRAS_POR_PROCESSO = 4_000_000
+
+# Configurações (lanes, largura, largura_acc) do ProcessadorSIMD verificadas;
+# None usa a largura padrão do acumulador. Inclui acumuladores estreitos
+# (wraparound frequente) e de 64 bits
+CONFIGURACOES_VERIFICADAS_SIMD = tuple((lanes, largura, None) for lanes, largura in CONFIGURACOES_SIMD.values()) + (
+    (4, 8, 12), (4, 8, 64), (4, 32, 64))
+
+# Pares aleatórios por configuração do ProcessadorSIMD
+PARES_SIMD = 20_000
+
+
+# -----------------------------------------------------------------------------
+# Modelos de referência, escritos a partir do RTL e independentes dos kernels
+# do processador em software
+# -----------------------------------------------------------------------------
+
+def referencia_add_sub_clip(a: np.ndarray, b: np.ndarray, is_sub: bool) -> np.ndarray:
+    """
+    Modelo do AddSubClip8Bit: operação em 9 bits seguida de saturação.
+
+    Args:
+        a: Operandos A (int8)
+        b: Operandos B (int8)
+        is_sub: True para A - B, False para A + B
+
+    Returns:
+        Resultados saturados (int8)
+    """
+    temp = a.astype(np.int16) - b if is_sub else a.astype(np.int16) + b
+    resultado = np.where(temp > 127, 127, np.where(temp < -128, -128, temp))
+    return resultado.astype(np.int8)
+
+
+def referencia_multiplicador(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Modelo do Multiplicador8x8: produto signed de 16 bits.
+
+    Args:
+        a: Operandos A (int8)
+        b: Operandos B (int8)
+
+    Returns:
+        Produtos (int16)
+    """
+    return (a.astype(np.int32) * b).astype(np.int16)
+
+
+def referencia_produto_escalar(lote_a: np.ndarray, lote_b: np.ndarray) -> np.ndarray:
+    """
+    Modelo do produto escalar acumulado lane a lane no Acumulador24Bit.
+
+    Args:
+        lote_a: Lote (N, 4) int8
+        lote_b: Lote (N, 4) int8
+
+    Returns:
+        Conteúdo final do acumulador para cada par (int32)
+    """
+    acumulador = np.zeros(len(lote_a), dtype=np.int64)
+    for lane in range(4):
+        produto = referencia_multiplicador(lote_a[:, lane], lote_b[:, lane])
+        # Soma de 24 bits em complemento de dois, escrita aqui sem depender
+        # de wrap_24bit (que faz parte do código verificado)
+        acumulador = (acumulador + produto + 2**23) % 2**24 - 2**23
+    return acumulador.astype(np.int32)
+
+
+def referencia_simd(lote_a: np.ndarray, lote_b: np.ndarray, largura: int,
+                    largura_acc: int) -> Dict[str, np.ndarray]:
+    """
+    Modelo em inteiros de Python (precisão arbitrária) de um processador de
+    qualquer número de lanes e largura: soma/subtração saturadas em W bits e
+    produto escalar reduzido ao acumulador de largura_acc bits.
+
+    Args:
+        lote_a: Lote (N, L) de inteiros na faixa de W bits
+        lote_b: Lote (N, L) de inteiros na faixa de W bits
+        largura: Largura do elemento W
+        largura_acc: Largura do acumulador
+
+    Returns:
+        Dicionário operação -> array de objetos (int de Python)
+    """
+    a, b = lote_a.astype(object), lote_b.astype(object)
+    minimo, maximo = -(1 << (largura - 1)), (1 << (largura - 1)) - 1
+    meio = 1 << (largura_acc - 1)
+
+    def saturar(temp: np.ndarray) -> np.ndarray:
+        return np.where(temp > maximo, maximo, np.where(temp < minimo, minimo, temp))
+
+    return {
+        'soma': saturar(a + b),
+        'subtracao': saturar(a - b),
+        'produto_escalar': ((a * b).sum(axis=1) + meio) % (1 << largura_acc) - meio,
+    }
+
+
+# -----------------------------------------------------------------------------
+# Implementações verificadas (DUTs)
+# -----------------------------------------------------------------------------
+
+def _dispositivos(processador: ProcessadorVetorialSW) -> Dict[str, Dict[str, Callable]]:
+    """Kernels do processador em software a verificar, por backend."""
+    return {
+        'lote': {
+            'soma': processador.soma_vetorial_lote,
+            'subtracao': processador.subtracao_vetorial_lote,
+            'produto_escalar': processador.produto_escalar_lote,
+        },
+        'empacotado': {
+            'soma': lambda a, b: desempacotar(processador.soma_empacotada(empacotar(a), empacotar(b))),
+            'subtracao': lambda a, b: desempacotar(processador.subtracao_empacotada(empacotar(a), empacotar(b))),
+            'produto_escalar': lambda a, b: processador.produto_escalar_empacotado(empacotar(a), empacotar(b)),
+        },
+        'lut': {
+            'soma': processador.soma_vetorial_lut,
+            'subtracao': processador.subtracao_vetorial_lut,
+            'produto_escalar': processador.produto_escalar_lut,
+        },
+    }
+
+
+def _por_vetor(funcao: Callable, tipo: np.dtype) -> Callable:
+    """Adapta uma operação de um vetor (ou palavra) por vez a lotes inteiros."""
+    return lambda lote_a, lote_b: np.array(
+        [funcao(a, b) for a, b in zip(lote_a.tolist(), lote_b.tolist())], dtype=tipo)
+
+
+def _dispositivos_por_vetor(processador: ProcessadorVetorialSW,
+                            escalar: ProcessadorVetorialEscalar) -> Dict[str, Dict[str, Callable]]:
+    """Operações de um vetor por vez a verificar, por implementação."""
+    def empacotada(funcao: Callable) -> Callable:
+        por_palavra = _por_vetor(funcao, np.uint32)
+        return lambda a, b: desempacotar(por_palavra(empacotar(a), empacotar(b)))
+
+    return {
+        'vetorial': {
+            'soma': _por_vetor(processador.soma_vetorial, np.int8),
+            'subtracao': _por_vetor(processador.subtracao_vetorial, np.int8),
+            'produto_escalar': _por_vetor(processador.produto_escalar, np.int32),
+        },
+        'escalar': {
+            'soma': _por_vetor(escalar.soma, np.int8),
+            'subtracao': _por_vetor(escalar.subtracao, np.int8),
+            'produto_escalar': _por_vetor(escalar.produto_escalar, np.int32),
+        },
+        'escalar_empacotado': {
+            'soma': empacotada(escalar.soma_empacotada),
+            'subtracao': empacotada(escalar.subtracao_empacotada),
+            'produto_escalar': lambda a, b: _por_vetor(escalar.produto_escalar_empacotado, np.int32)(
+                empacotar(a), empacotar(b)),
+        },
+    }
+
+
+def todos_os_pares() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumera as 65.536 combinações de operandos de 8 bits.
+
+    Returns:
+        Tupla (a, b) de arrays int8 com 65.536 posições
+    """
+    valores = np.arange(-128, 128, dtype=np.int8)
+    a, b = np.meshgrid(valores, valores, indexing='ij')
+    return a.ravel(), b.ravel()
+
+
+def _lotes_exaustivos(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distribui os pares nas 4 lanes com deslocamentos diferentes, de modo que
+    cada lane veja todos os pares e lanes vizinhas tenham operandos distintos.
+    """
+    n = len(a)
+    indices = (np.arange(n)[:, np.newaxis] + np.arange(4) * 12345) % n
+    return a[indices], b[indices]
+
+
+def _registrar_divergencias(relatorio: Dict[str, Any], nome: str, divergentes: np.ndarray,
+                            descricao: Callable[[int], str]):
+    """Acumula o total e os primeiros exemplos de divergência de uma verificação."""
+    indices = np.flatnonzero(divergentes)
+    relatorio['divergencias'][nome] = int(len(indices))
+    relatorio['exemplos'][nome] = [descricao(int(i)) for i in indices[:MAX_DIVERGENCIAS_RELATADAS]]
+
+
+def verificar_exaustivo(processador: Optional[ProcessadorVetorialSW] = None,
+                        escalar: Optional[ProcessadorVetorialEscalar] = None) -> Dict[str, Any]:
+    """
+    Verifica todas as combinações de operandos de soma, subtração e multiplicação.
+
+    A multiplicação é exercitada pelo produto escalar com um único par de
+    operandos não nulo, em cada uma das 4 lanes. Além dos kernels em lote,
+    são verificadas as operações de um vetor por vez do ProcessadorVetorialSW
+    e do ProcessadorVetorialEscalar (tuplas e palavras empacotadas).
+
+    Args:
+        processador: Processador em software a verificar
+        escalar: Caminho escalar (sem NumPy) a verificar
+
+    Returns:
+        Relatório com divergências por verificação e cobertura
+    """
+    processador = processador or ProcessadorVetorialSW()
+    dispositivos = {**_dispositivos(processador),
+                    **_dispositivos_por_vetor(processador, escalar or ProcessadorVetorialEscalar())}
+    a, b = todos_os_pares()
+    lote_a, lote_b = _lotes_exaustivos(a, b)
+    relatorio: Dict[str, Any] = {'divergencias': {}, 'exemplos': {}, 'cobertura': {}}
+
+    for is_sub, operacao in ((False, 'soma'), (True, 'subtracao')):
+        esperado = referencia_add_sub_clip(lote_a, lote_b, is_sub)
+        temp = lote_a.astype(np.int16) - lote_b if is_sub else lote_a.astype(np.int16) + lote_b
+        relatorio['cobertura'][operacao] = {
+            'pares_distintos': int(len(np.unique(a.astype(np.int32) * 256 + b))),
+            'saturacoes_positivas': int((temp > 127).sum()),
+            'saturacoes_negativas': int((temp < -128).sum()),
+        }
+        for backend, kernels in dispositivos.items():
+            obtido = kernels[operacao](lote_a, lote_b)
+            divergentes = (obtido != esperado).any(axis=1)
+            _registrar_divergencias(
+                relatorio, f"{operacao}/{backend}", divergentes,
+                lambda i: f"A={lote_a[i].tolist()} B={lote_b[i].tolist()} "
+                          f"esperado={esperado[i].tolist()} obtido={obtido[i].tolist()}")
+
+    esperado = referencia_multiplicador(a, b).astype(np.int32)
+    relatorio['cobertura']['multiplicador'] = {
+        'pares_distintos': int(len(a)),
+        'lanes': 4,
+        'produto_min': int(esperado.min()),
+        'produto_max': int(esperado.max()),
+    }
+    for backend, kernels in dispositivos.items():
+        divergentes = np.zeros(len(a), dtype=bool)
+        for lane in range(4):
+            lote_a = np.zeros((len(a), 4), dtype=np.int8)
+            lote_b = np.zeros((len(a), 4), dtype=np.int8)
+            lote_a[:, lane] = a
+            lote_b[:, lane] = b
+            divergentes |= kernels['produto_escalar'](lote_a, lote_b) != esperado
+        _registrar_divergencias(
+            relatorio, f"multiplicador/{backend}", divergentes,
+            lambda i: f"a={int(a[i])} b={int(b[i])} esperado={int(esperado[i])}")
+
+    return relatorio
+
+
+def verificar_simd(configuracoes=CONFIGURACOES_VERIFICADAS_SIMD, pares: int = PARES_SIMD,
+                   semente: int = 0) -> Dict[str, Any]:
+    """
+    Verifica as operações em lote do ProcessadorSIMD contra referencia_simd()
+    em pares aleatórios e nos extremos da faixa (todos os elementos no
+    mínimo e no máximo, que maximizam |produto escalar|).
+
+    Args:
+        configuracoes: Tuplas (lanes, largura, largura_acc)
+        pares: Pares aleatórios por configuração
+        semente: Semente do gerador pseudoaleatório
+
+    Returns:
+        Relatório com divergências por configuração e operação e cobertura
+    """
+    relatorio: Dict[str, Any] = {'divergencias': {}, 'exemplos': {}, 'cobertura': {}}
+    rng = np.random.default_rng(semente)
+    for lanes, largura, largura_acc in configuracoes:
+        simd = ProcessadorSIMD(lanes, largura, largura_acc)
+        minimo, maximo = simd.min_val, simd.max_val
+        alternados = ([minimo, maximo] * lanes)[:lanes]
+        extremos = np.array([[minimo] * lanes, [maximo] * lanes, alternados])
+        lote_a = np.concatenate([rng.integers(minimo, maximo, size=(pares, lanes), endpoint=True),
+                                 np.repeat(extremos, len(extremos), axis=0)]).astype(simd.tipo_elemento)
+        lote_b = np.concatenate([rng.integers(minimo, maximo, size=(pares, lanes), endpoint=True),
+                                 np.tile(extremos, (len(extremos), 1))]).astype(simd.tipo_elemento)
+        esperado = referencia_simd(lote_a, lote_b, simd.largura, simd.largura_acc)
+        for operacao, funcao in (('soma', simd.soma_vetorial_lote),
+                                 ('subtracao', simd.subtracao_vetorial_lote),
+                                 ('produto_escalar', simd.produto_escalar_lote)):
+            obtido = funcao(lote_a, lote_b)
+            divergentes = obtido.astype(object) != esperado[operacao]
+            if divergentes.ndim > 1:
+                divergentes = divergentes.any(axis=1)
+            _registrar_divergencias(
+                relatorio, f"{simd}/{operacao}", divergentes,
+                lambda i: f"A={lote_a[i].tolist()} B={lote_b[i].tolist()} "
+                          f"esperado={np.asarray(esperado[operacao][i]).tolist()} "
+                          f"obtido={obtido[i].tolist()}")
+        exato = (lote_a.astype(object) * lote_b.astype(object)).sum(axis=1)
+        relatorio['cobertura'][str(simd)] = {
+            'pares': len(lote_a),
+            'wraparounds_acumulador': int((exato != esperado['produto_escalar']).sum()),
+        }
+    return relatorio
+
+
+def _verificar_bloco_aleatorio(argumentos: Tuple[int, int, int]) -> Dict[str, Any]:
+    """Gera e verifica um bloco de pares aleatórios (executado nos processos)."""
+    semente, indice, tamanho = argumentos
+    rng = np.random.default_rng([semente, indice])
+    lote_a = rng.integers(-128, 128, size=(tamanho, 4), dtype=np.int8)
+    lote_b = rng.integers(-128, 128, size=(tamanho, 4), dtype=np.int8)
+    esperado = referencia_produto_escalar(lote_a, lote_b)
+
+    resultado: Dict[str, Any] = {'divergencias': {}, 'exemplos': {}}
+    for backend, kernels in _dispositivos(ProcessadorVetorialSW()).items():
+        obtido = kernels['produto_escalar'](lote_a, lote_b)
+        divergentes = obtido != esperado
+        _registrar_divergencias(
+            resultado, f"produto_escalar/{backend}", divergentes,
+            lambda i: f"A={lote_a[i].tolist()} B={lote_b[i].tolist()} "
+                      f"esperado={int(esperado[i])} obtido={int(obtido[i])}")
+
+    resultado['cobertura'] = {
+        'pares': tamanho,
+        'acc_min': int(esperado.min()),
+        'acc_max': int(esperado.max()),
+        'operandos_min': int((lote_a == -128).sum() + (lote_b == -128).sum()),
+        'operandos_max': int((lote_a == 127).sum() + (lote_b == 127).sum()),
+        'operandos_zero': int((lote_a == 0).sum() + (lote_b == 0).sum()),
+        'histograma_acc': np.histogram(esperado, bins=16, range=(-65536, 65536))[0],
+    }
+    return resultado
+
+
+def verificar_aleatorio(amostras: int, tamanho_bloco: int = 1 << 20,
+                        processos: Optional[int] = None, semente: int = 0) -> Dict[str, Any]:
+    """
+    Varre pares aleatórios de vetores do produto escalar em blocos distribuídos
+    entre processos. Os blocos são gerados nos próprios processos, de forma
+    que nenhum dado de entrada trafega entre eles.
+
+    Args:
+        amostras: Número total de pares de vetores
+        tamanho_bloco: Pares por bloco
+        processos: Número de processos (padrão: os.cpu_count())
+        semente: Semente base; cada bloco usa (semente, índice do bloco)
+
+    Returns:
+        Relatório com divergências e cobertura agregadas (com amostras=0,
+        sem divergências e com cobertura vazia)
+    """
+    if amostras < 0:
+        raise ValueError(f"Número de amostras negativo: {amostras}")
+    n_blocos = -(-amostras // tamanho_bloco)
+    tarefas = [(semente, i, min(tamanho_bloco, amostras - i * tamanho_bloco)) for i in range(n_blocos)]
+    relatorio: Dict[str, Any] = {'divergencias': {}, 'exemplos': {}, 'cobertura': {}}
+    cobertura = relatorio['cobertura']
+    if not tarefas:
+        cobertura.update(pares=0, histograma_acc=[0] * 16)
+        return relatorio
+    with mp.Pool(processos or os.cpu_count()) as pool:
+        for bloco in pool.imap_unordered(_verificar_bloco_aleatorio, tarefas):
+            for nome, total in bloco['divergencias'].items():
+                relatorio['divergencias'][nome] = relatorio['divergencias'].get(nome, 0) + total
+                exemplos = relatorio['exemplos'].setdefault(nome, [])
+                exemplos.extend(bloco['exemplos'][nome][:MAX_DIVERGENCIAS_RELATADAS - len(exemplos)])
+            c = bloco['cobertura']
+            cobertura['pares'] = cobertura.get('pares', 0) + c['pares']
+            cobertura['acc_min'] = min(cobertura.get('acc_min', c['acc_min']), c['acc_min'])
+            cobertura['acc_max'] = max(cobertura.get('acc_max', c['acc_max']), c['acc_max'])
+            for chave in ('operandos_min', 'operandos_max', 'operandos_zero'):
+                cobertura[chave] = cobertura.get(chave, 0) + c[chave]
+            cobertura['histograma_acc'] = cobertura.get('histograma_acc', 0) + c['histograma_acc']
+    cobertura['histograma_acc'] = cobertura['histograma_acc'].tolist()
+    return relatorio
+
+
+def imprimir_relatorio(titulo: str, relatorio: Dict[str, Any]):
+    """Imprime divergências, exemplos e cobertura de uma verificação."""
+    print(titulo)
+    print("-" * 80)
+    for nome, total in relatorio['divergencias'].items():
+        status = "OK" if total == 0 else f"FALHOU ({total:,} divergências)"
+        print(f"  {nome:<32} {status}")
+        for exemplo in relatorio['exemplos'][nome]:
+            print(f"      {exemplo}")
+    print("  Cobertura:")
+    for nome, valor in relatorio['cobertura'].items():
+        print(f"    {nome}: {valor}")
+    print()
+
+
+def _amostras(texto: str) -> int:
+    """Tipo do argparse para --amostras: inteiro não negativo."""
+    valor = int(texto)
+    if valor < 0:
+        raise argparse.ArgumentTypeError(f"deve ser >= 0: {valor}")
+    return valor
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Função principal: executa as verificações e retorna 1 se houver divergências."""
+    parser = argparse.ArgumentParser(description="Verificação bit a bit dos operadores do processador vetorial")
+    parser.add_argument('--amostras', type=_amostras,
+                        help=f"Pares de vetores da varredura aleatória; 0 a desativa "
+                             f"(padrão: {AMOSTRAS_POR_PROCESSO:,} por processo)")
+    parser.add_argument('--bloco', type=int, default=1 << 20, help="Pares por bloco")
+    parser.add_argument('--processos', type=int, help="Número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args(argv)
+    processos = args.processos or os.cpu_count()
+    amostras = AMOSTRAS_POR_PROCESSO * processos if args.amostras is None else args.amostras
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - VERIFICAÇÃO BIT A BIT")
+    print("=" * 80)
+    print()
+
+    inicio = time.perf_counter()
+    exaustivo = verificar_exaustivo()
+    imprimir_relatorio(f"VERIFICAÇÃO EXAUSTIVA ({time.perf_counter() - inicio:.2f} s)", exaustivo)
+
+    inicio = time.perf_counter()
+    simd = verificar_simd(semente=args.semente)
+    imprimir_relatorio(f"PROCESSADOR SIMD ({time.perf_counter() - inicio:.2f} s)", simd)
+
+    inicio = time.perf_counter()
+    aleatorio = verificar_aleatorio(amostras, args.bloco, processos, args.semente)
+    tempo = time.perf_counter() - inicio
+    if amostras:
+        imprimir_relatorio(f"VARREDURA ALEATÓRIA DO PRODUTO ESCALAR ({amostras:,} pares, {tempo:.2f} s, "
+                           f"{amostras / tempo / 1e6:.1f} M pares/s, {processos} processo(s))", aleatorio)
+    else:
+        print("VARREDURA ALEATÓRIA DO PRODUTO ESCALAR: desativada (--amostras 0)")
+        print()
+
+    total = sum(sum(relatorio['divergencias'].values()) for relatorio in (exaustivo, simd, aleatorio))
+    print("=" * 80)
+    print("Todas as verificações passaram." if total == 0 else f"{total:,} divergências encontradas.")
+    print("=" * 80)
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Processador Vetorial - Gerador de Vetores de Referência
+Arquivo: vetores_referencia.py
+Descrição: Gera, em streaming, arquivos com pares A/B aleatórios e de casos
+           limite e os resultados esperados de soma, subtração e produto
+           escalar calculados pelos kernels SWAR, em formato binário
+           compacto ou hexadecimal lido por tb/tb_vetores_arquivo.vhdl via
+           textio, e confere o arquivo gerado contra os modelos de
+           referência independentes de verificacao.py
+Autor: Equipe Processador Vetorial - INE5406
+Data: 26/11/2025
+
+Cada registro contém cinco palavras de 32 bits no layout da BRAMDualPort
+(elemento i nos bits 8*i+7 downto 8*i): A, B, soma, subtração e produto
+escalar (int32 com sinal, como escrito na BRAM). No formato binário, as
+palavras são little-endian (20 bytes por registro, REGISTRO_DTYPE); no
+formato hexadecimal, cada registro é uma linha com as cinco palavras
+separadas por espaço:
+
+    80808080 7F7F7F7F FFFFFFFF 80808080 FFFF0200
+
+Os casos limite vêm primeiro, seguidos dos pares aleatórios; a geração é
+feita em blocos, de modo que o tamanho do arquivo não é limitado pela RAM.
+"""
+
+import argparse
+import itertools
+import os
+import time
+import numpy as np
+from typing import Iterator, Optional, Tuple
+
+from processador_vetorial_sw import (
+    PALAVRA_DTYPE,
+    desempacotar,
+    empacotar,
+    produto_escalar_swar,
+    soma_swar,
+    subtracao_swar,
+)
+from verificacao import referencia_add_sub_clip, referencia_produto_escalar
+
+REGISTRO_DTYPE = np.dtype([
+    ('a', PALAVRA_DTYPE),
+    ('b', PALAVRA_DTYPE),
+    ('soma', PALAVRA_DTYPE),
+    ('subtracao', PALAVRA_DTYPE),
+    ('produto_escalar', PALAVRA_DTYPE),
+])
+
+FORMATOS = ('hex', 'bin')
+
+# Valores de elemento que exercitam saturação, sinal e o acumulador
+VALORES_LIMITE = (-128, -127, -64, -1, 0, 1, 63, 126, 127)
+
+TAMANHO_BLOCO_PADRAO = 1 << 18  # registros por bloco (5 MiB em binário)
+
+_HEX = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+# Valor de cada dígito hexadecimal (indexado pelo código ASCII)
+_NIBBLE = np.zeros(256, dtype=np.uint32)
+_NIBBLE[_HEX] = np.arange(16, dtype=np.uint32)
+_NIBBLE[np.frombuffer(b'abcdef', dtype=np.uint8)] = np.arange(10, 16, dtype=np.uint32)
+
+BYTES_POR_LINHA_HEX = 5 * 9  # 5 palavras de 8 dígitos + separador/quebra de linha
+
+
+def casos_limite() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monta os pares de casos limite.
+
+    Inclui todas as combinações de VALORES_LIMITE nos 4 elementos de A
+    (pareadas com B em ordem inversa e com B = A), que incluem somas e
+    subtrações que atingem exatamente -128/127, e pares com todos os
+    elementos iguais (ex.: -128 · -128 nos 4 elementos, o maior produto
+    escalar).
+
+    Returns:
+        Lotes (K, 4) int8 de A e de B
+    """
+    valores = np.array(VALORES_LIMITE, dtype=np.int8)
+    combinacoes = np.array(list(itertools.product(valores, repeat=4)), dtype=np.int8)
+    uniformes_a = np.repeat(valores, len(valores))[:, np.newaxis].repeat(4, axis=1)
+    uniformes_b = np.tile(valores, len(valores))[:, np.newaxis].repeat(4, axis=1)
+    lote_a = np.concatenate([combinacoes, combinacoes, uniformes_a])
+    lote_b = np.concatenate([combinacoes[::-1], combinacoes, uniformes_b])
+    return lote_a, lote_b
+
+
+def gerar_registros(n_aleatorios: int, semente: int = 0, incluir_limites: bool = True,
+                    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[np.ndarray]:
+    """
+    Gera blocos de registros com os resultados esperados.
+
+    Args:
+        n_aleatorios: Número de pares aleatórios (uniformes nas 2^64 combinações)
+        semente: Semente do gerador pseudoaleatório
+        incluir_limites: Emite antes os pares de casos_limite()
+        tamanho_bloco: Registros por bloco de pares aleatórios
+
+    Yields:
+        Arrays de REGISTRO_DTYPE
+    """
+    if incluir_limites:
+        lote_a, lote_b = casos_limite()
+        yield calcular_registros(empacotar(lote_a), empacotar(lote_b))
+
+    rng = np.random.default_rng(semente)
+    for inicio in range(0, n_aleatorios, tamanho_bloco):
+        tamanho = min(tamanho_bloco, n_aleatorios - inicio)
+        palavras_a = rng.integers(0, 1 << 32, size=tamanho, dtype=np.uint32)
+        palavras_b = rng.integers(0, 1 << 32, size=tamanho, dtype=np.uint32)
+        yield calcular_registros(palavras_a, palavras_b)
+
+
+def calcular_registros(palavras_a: np.ndarray, palavras_b: np.ndarray) -> np.ndarray:
+    """
+    Calcula os resultados esperados com os kernels SWAR de referência.
+
+    Args:
+        palavras_a: Palavras (K,) uint32 do vetor A
+        palavras_b: Palavras (K,) uint32 do vetor B
+
+    Returns:
+        Array (K,) de REGISTRO_DTYPE
+    """
+    registros = np.empty(len(palavras_a), dtype=REGISTRO_DTYPE)
+    registros['a'] = palavras_a
+    registros['b'] = palavras_b
+    registros['soma'] = soma_swar(palavras_a, palavras_b)
+    registros['subtracao'] = subtracao_swar(palavras_a, palavras_b)
+    registros['produto_escalar'] = produto_escalar_swar(palavras_a, palavras_b)
+    return registros
+
+
+def calcular_registros_referencia(palavras_a: np.ndarray, palavras_b: np.ndarray) -> np.ndarray:
+    """
+    Calcula os resultados esperados com os modelos de referência de
+    verificacao.py, independentes dos kernels SWAR usados na geração.
+
+    Args:
+        palavras_a: Palavras (K,) uint32 do vetor A
+        palavras_b: Palavras (K,) uint32 do vetor B
+
+    Returns:
+        Array (K,) de REGISTRO_DTYPE
+    """
+    lote_a, lote_b = desempacotar(palavras_a), desempacotar(palavras_b)
+    registros = np.empty(len(lote_a), dtype=REGISTRO_DTYPE)
+    registros['a'] = palavras_a
+    registros['b'] = palavras_b
+    registros['soma'] = empacotar(referencia_add_sub_clip(lote_a, lote_b, is_sub=False))
+    registros['subtracao'] = empacotar(referencia_add_sub_clip(lote_a, lote_b, is_sub=True))
+    registros['produto_escalar'] = referencia_produto_escalar(lote_a, lote_b).view(PALAVRA_DTYPE)
+    return registros
+
+
+def formatar_hex(registros: np.ndarray) -> bytes:
+    """
+    Converte registros em linhas de texto hexadecimal sem laço em Python.
+
+    Args:
+        registros: Array (K,) de REGISTRO_DTYPE
+
+    Returns:
+        Texto ASCII com uma linha por registro
+    """
+    palavras = registros.view(PALAVRA_DTYPE).reshape(len(registros), 5)
+    # Nibbles do mais para o menos significativo de cada palavra
+    deslocamentos = np.arange(28, -4, -4, dtype=np.uint32)
+    nibbles = (palavras[:, :, np.newaxis] >> deslocamentos) & np.uint32(0xF)
+    linhas = np.full((len(registros), 5, 9), ord(' '), dtype=np.uint8)
+    linhas[:, :, :8] = _HEX[nibbles]
+    linhas[:, -1, 8] = ord('\n')
+    return linhas.tobytes()
+
+
+def escrever_arquivo(caminho: str, n_aleatorios: int, formato: str = 'hex', semente: int = 0,
+                     incluir_limites: bool = True, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> int:
+    """
+    Escreve um arquivo de vetores de referência bloco a bloco.
+
+    Args:
+        caminho: Arquivo de saída
+        n_aleatorios: Número de pares aleatórios
+        formato: 'hex' (lido pelo testbench) ou 'bin' (REGISTRO_DTYPE)
+        semente: Semente do gerador pseudoaleatório
+        incluir_limites: Inclui os casos limite no início do arquivo
+        tamanho_bloco: Registros por bloco
+
+    Returns:
+        Número de registros escritos
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato} (use {', '.join(FORMATOS)})")
+    total = 0
+    with open(caminho, 'wb') as f:
+        for registros in gerar_registros(n_aleatorios, semente, incluir_limites, tamanho_bloco):
+            if formato == 'hex':
+                f.write(formatar_hex(registros))
+            else:
+                registros.tofile(f)
+            total += len(registros)
+    return total
+
+
+def ler_binario(caminho: str) -> np.ndarray:
+    """
+    Mapeia em memória um arquivo binário de registros (sem carregá-lo).
+
+    Args:
+        caminho: Arquivo gerado com formato 'bin'
+
+    Returns:
+        np.memmap somente leitura de REGISTRO_DTYPE
+    """
+    return np.memmap(caminho, dtype=REGISTRO_DTYPE, mode='r')
+
+
+def ler_hex(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[np.ndarray]:
+    """
+    Lê um arquivo hexadecimal de registros bloco a bloco.
+
+    Args:
+        caminho: Arquivo gerado com formato 'hex'
+        tamanho_bloco: Registros por bloco
+
+    Yields:
+        Arrays de REGISTRO_DTYPE
+    """
+    deslocamentos = np.arange(28, -4, -4, dtype=np.uint32)
+    with open(caminho, 'rb') as f:
+        while True:
+            dados = f.read(tamanho_bloco * BYTES_POR_LINHA_HEX)
+            if not dados:
+                return
+            if len(dados) % BYTES_POR_LINHA_HEX:
+                raise ValueError(f"{caminho}: linha incompleta ou fora do formato de {BYTES_POR_LINHA_HEX} bytes")
+            linhas = np.frombuffer(dados, dtype=np.uint8).reshape(-1, 5, 9)
+            palavras = (_NIBBLE[linhas[:, :, :8]] << deslocamentos).sum(axis=2, dtype=np.uint32)
+            yield np.ascontiguousarray(palavras, dtype=PALAVRA_DTYPE).view(REGISTRO_DTYPE).reshape(-1)
+
+
+def conferir_registros(blocos: Iterator[np.ndarray]) -> Optional[int]:
+    """
+    Confere blocos de registros contra os modelos de referência de
+    verificacao.py.
+
+    Args:
+        blocos: Arrays de REGISTRO_DTYPE, na ordem do arquivo
+
+    Returns:
+        Índice do primeiro registro divergente ou None
+    """
+    inicio = 0
+    for bloco in blocos:
+        esperado = calcular_registros_referencia(bloco['a'], bloco['b'])
+        divergentes = np.flatnonzero(bloco != esperado)
+        if len(divergentes):
+            return inicio + int(divergentes[0])
+        inicio += len(bloco)
+    return None
+
+
+def conferir_binario(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Optional[int]:
+    """
+    Confere um arquivo binário contra os modelos de referência, bloco a bloco.
+
+    Args:
+        caminho: Arquivo gerado com formato 'bin'
+        tamanho_bloco: Registros por bloco
+
+    Returns:
+        Índice do primeiro registro divergente ou None
+    """
+    registros = ler_binario(caminho)
+    return conferir_registros(registros[inicio:inicio + tamanho_bloco]
+                              for inicio in range(0, len(registros), tamanho_bloco))
+
+
+def conferir_hex(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Optional[int]:
+    """
+    Confere um arquivo hexadecimal (o lido pelo testbench) contra os modelos
+    de referência, bloco a bloco.
+
+    Args:
+        caminho: Arquivo gerado com formato 'hex'
+        tamanho_bloco: Registros por bloco
+
+    Returns:
+        Índice do primeiro registro divergente ou None
+    """
+    return conferir_registros(ler_hex(caminho, tamanho_bloco))
+
+
+def main():
+    """Função principal: gera um arquivo de vetores de referência."""
+    parser = argparse.ArgumentParser(description="Gerador de vetores de referência para o testbench")
+    parser.add_argument('saida', help="Arquivo de saída")
+    parser.add_argument('--vetores', type=int, default=1_000_000, help="Pares aleatórios (padrão: %(default)s)")
+    parser.add_argument('--formato', choices=FORMATOS, default='hex')
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--sem-limites', action='store_true', help="Omite os casos limite")
+    parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO_PADRAO, help="Registros por bloco")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PROCESSADOR VETORIAL - VETORES DE REFERÊNCIA")
+    print("=" * 80)
+    print()
+
+    inicio = time.perf_counter()
+    total = escrever_arquivo(args.saida, args.vetores, args.formato, args.semente,
+                             not args.sem_limites, args.bloco)
+    tempo = time.perf_counter() - inicio
+    tamanho = os.path.getsize(args.saida)
+    print(f"Arquivo: {args.saida} ({args.formato}, {tamanho / 2**20:.1f} MiB)")
+    print(f"Registros: {total:,} ({tempo:.2f} s, {total / tempo / 1e6:.2f} M registros/s)")
+    conferir = conferir_binario if args.formato == 'bin' else conferir_hex
+    inicio = time.perf_counter()
+    divergente = conferir(args.saida, args.bloco)
+    tempo = time.perf_counter() - inicio
+    print(f"Conferência com verificacao.py: "
+          f"{'OK' if divergente is None else f'divergência no registro {divergente}'} ({tempo:.2f} s)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
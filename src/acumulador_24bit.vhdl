@@ -10,11 +10,14 @@ use ieee.std_logic_1164.all;
 use ieee.numeric_std.all;
 
 entity Acumulador24Bit is
+    generic (
+        LARGURA_ENTRADA : integer := 16              -- Largura do dado de entrada
+    );
     port (
         clk    : in  std_logic;                      -- Clock
         rst    : in  std_logic;                      -- Reset síncrono (ativo alto)
         enable : in  std_logic;                      -- Enable (acumula o dado)
-        d      : in  std_logic_vector(15 downto 0);  -- Dado de entrada (signed 16 bits)
+        d      : in  std_logic_vector(LARGURA_ENTRADA-1 downto 0);  -- Dado de entrada (signed)
         q      : out std_logic_vector(23 downto 0)   -- Saída acumulada (signed 24 bits)
     );
 end entity Acumulador24Bit;
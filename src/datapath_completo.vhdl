@@ -1,6 +1,11 @@
 -- =============================================================================
 -- Arquivo: datapath_completo.vhdl
 -- Descrição: Datapath completo do processador vetorial
+--            Porta de acesso do host (host_en = '1') multiplexada na porta A
+--            da BRAM, para carregar operandos e ler resultados com a FSM em IDLE
+--            ARVORE_SOMA = true: o produto escalar soma os 4 produtos em uma
+--            árvore de somadores e acumula em um ciclo (opcionalmente com um
+--            registrador de pipeline após o primeiro nível, ARVORE_PIPELINE)
 -- Autor: Equipe Processador Vetorial
 -- Data: 26/11/2025
 -- =============================================================================
@@ -10,6 +15,10 @@ use ieee.std_logic_1164.all;
 use ieee.numeric_std.all;
 
 entity DatapathCompleto is
+    generic (
+        ARVORE_SOMA     : boolean := false;
+        ARVORE_PIPELINE : boolean := false
+    );
     port (
         clk         : in  std_logic;
         rst         : in  std_logic;
@@ -25,6 +34,13 @@ entity DatapathCompleto is
         mux_sel     : in  std_logic_vector(1 downto 0);
         op_sel      : in  std_logic_vector(1 downto 0);
         
+        -- Acesso do host à BRAM (porta A)
+        host_en     : in  std_logic := '0';
+        host_we     : in  std_logic := '0';
+        host_addr   : in  std_logic_vector(4 downto 0) := "00000";
+        host_di     : in  std_logic_vector(31 downto 0) := (others => '0');
+        host_do     : out std_logic_vector(31 downto 0);
+        
         -- Saída para BRAM
         result_out  : out std_logic_vector(31 downto 0)
     );
@@ -72,11 +88,14 @@ architecture Structural of DatapathCompleto is
     end component;
     
     component Acumulador24Bit is
+        generic (
+            LARGURA_ENTRADA : integer := 16
+        );
         port (
             clk    : in  std_logic;
             rst    : in  std_logic;
             enable : in  std_logic;
-            d      : in  std_logic_vector(15 downto 0);
+            d      : in  std_logic_vector(LARGURA_ENTRADA-1 downto 0);
             q      : out std_logic_vector(23 downto 0)
         );
     end component;
@@ -84,12 +103,24 @@ architecture Structural of DatapathCompleto is
     -- Sinais internos
     signal bram_val_a, bram_val_b, reg_a_out, reg_b_out, soma_sub_result, mux_out : std_logic_vector(31 downto 0);
     signal prod_0, prod_1, prod_2, prod_3 : std_logic_vector(15 downto 0);
-    signal acc_in : std_logic_vector(15 downto 0);
+    signal prod_mux : std_logic_vector(15 downto 0);
+    signal acc_in : std_logic_vector(17 downto 0); -- soma de 4 produtos: 18 bits
+    signal parcial_01, parcial_23 : signed(16 downto 0);
+    signal parcial_01_reg, parcial_23_reg : signed(16 downto 0) := (others => '0');
     signal acc_out : std_logic_vector(23 downto 0);
+    signal porta_a_addr : std_logic_vector(4 downto 0);
+    signal porta_a_we : std_logic;
+    signal porta_a_di : std_logic_vector(31 downto 0);
     
 begin
+    -- Porta A da BRAM: host ou FSM
+    porta_a_addr <= host_addr when host_en = '1' else bram_addr_a;
+    porta_a_we   <= host_we   when host_en = '1' else bram_we;
+    porta_a_di   <= host_di   when host_en = '1' else mux_out;
+    host_do      <= bram_val_a;
+    
     -- BRAM
-    BRAM_inst : BRAMDualPort port map (clk, bram_we, bram_addr_a, bram_addr_b, mux_out, bram_val_a, bram_val_b);
+    BRAM_inst : BRAMDualPort port map (clk, porta_a_we, porta_a_addr, bram_addr_b, porta_a_di, bram_val_a, bram_val_b);
     
     -- Registradores
     RegA_inst : Registrador32Bit port map (clk, rst, reg_a_load, bram_val_a, reg_a_out);
@@ -106,13 +137,38 @@ begin
     
     -- MUX para entrada do acumulador
     with mux_sel(1 downto 0) select
-        acc_in <= prod_0 when "00",
-                  prod_1 when "01",
-                  prod_2 when "10",
-                  prod_3 when "11";
+        prod_mux <= prod_0 when "00",
+                    prod_1 when "01",
+                    prod_2 when "10",
+                    prod_3 when "11";
+    
+    -- Primeiro nível da árvore de somadores
+    parcial_01 <= resize(signed(prod_0), 17) + resize(signed(prod_1), 17);
+    parcial_23 <= resize(signed(prod_2), 17) + resize(signed(prod_3), 17);
+    
+    -- Entrada do acumulador: um produto por ciclo (mux) ou a soma dos 4
+    Serial_gen : if not ARVORE_SOMA generate
+        acc_in <= std_logic_vector(resize(signed(prod_mux), 18));
+    end generate;
+    
+    Arvore_gen : if ARVORE_SOMA and not ARVORE_PIPELINE generate
+        acc_in <= std_logic_vector(resize(parcial_01, 18) + resize(parcial_23, 18));
+    end generate;
+    
+    ArvorePipeline_gen : if ARVORE_SOMA and ARVORE_PIPELINE generate
+        process(clk)
+        begin
+            if rising_edge(clk) then
+                parcial_01_reg <= parcial_01;
+                parcial_23_reg <= parcial_23;
+            end if;
+        end process;
+        acc_in <= std_logic_vector(resize(parcial_01_reg, 18) + resize(parcial_23_reg, 18));
+    end generate;
     
     -- Acumulador
-    Acc_inst : Acumulador24Bit port map (clk, acc_rst, acc_en, acc_in, acc_out);
+    Acc_inst : Acumulador24Bit generic map (LARGURA_ENTRADA => 18)
+                               port map (clk, acc_rst, acc_en, acc_in, acc_out);
     
     -- MUX de saída
     with mux_sel(1 downto 0) select
@@ -1,20 +1,38 @@
 -- =============================================================================
 -- Arquivo: fsm_completa.vhdl
 -- Descrição: FSM completa para controlar as 3 operações
+--            Modo rajada (burst = '1' junto com start): processa `contagem`
+--            pares a partir de base_a/base_b e grava a partir de base_res,
+--            sobrepondo a leitura do próximo par à escrita/acumulação atual
+--            ARVORE_SOMA / ARVORE_PIPELINE devem ser iguais aos do datapath:
+--            com a árvore de somadores o produto escalar acumula em 1 ciclo
+--            (EXEC_DOT_ARVORE), precedido de EXEC_DOT_PIPE se houver pipeline
 -- Autor: Equipe Processador Vetorial
 -- Data: 26/11/2025
 -- =============================================================================
 
 library ieee;
 use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
 
 entity FSMCompleta is
+    generic (
+        ARVORE_SOMA     : boolean := false;
+        ARVORE_PIPELINE : boolean := false
+    );
     port (
         clk           : in  std_logic;
         rst           : in  std_logic;
         start         : in  std_logic;
         op_sel        : in  std_logic_vector(1 downto 0); -- 00:SOMA, 01:SUB, 10:PROD_ESC
         
+        -- Configuração do modo rajada (amostrada junto com start)
+        burst         : in  std_logic := '0';
+        base_a        : in  std_logic_vector(4 downto 0) := "00000";
+        base_b        : in  std_logic_vector(4 downto 0) := "00000";
+        base_res      : in  std_logic_vector(4 downto 0) := "00000";
+        contagem      : in  std_logic_vector(5 downto 0) := "000000"; -- 0 a 32 pares
+        
         -- Sinais de controle para o Datapath
         bram_addr_a   : out std_logic_vector(4 downto 0);
         bram_addr_b   : out std_logic_vector(4 downto 0);
@@ -29,35 +47,95 @@ entity FSMCompleta is
 end entity FSMCompleta;
 
 architecture Behavioral of FSMCompleta is
-    type state_t is (IDLE, LOAD_A, LOAD_B, EXEC_SUM_SUB, EXEC_DOT_0, EXEC_DOT_1, EXEC_DOT_2, EXEC_DOT_3, WRITE_BACK, DONE_STATE);
+    type state_t is (IDLE, LOAD_A, LOAD_B, EXEC_SUM_SUB, EXEC_DOT_0, EXEC_DOT_1, EXEC_DOT_2, EXEC_DOT_3, WRITE_BACK, DONE_STATE,
+                     BURST_LER, BURST_CARGA, BURST_FIM, BURST_DOT_0, BURST_DOT_1, BURST_DOT_2, BURST_DOT_3, BURST_DOT_WB,
+                     EXEC_DOT_PIPE, EXEC_DOT_ARVORE, BURST_DOT_PIPE, BURST_DOT_ARVORE);
     signal estado_atual, proximo_estado : state_t;
+    
+    -- Primeiro estado de execução do produto escalar conforme o datapath
+    function inicio_dot(unica : boolean) return state_t is
+    begin
+        if not ARVORE_SOMA then
+            if unica then return EXEC_DOT_0; else return BURST_DOT_0; end if;
+        elsif ARVORE_PIPELINE then
+            if unica then return EXEC_DOT_PIPE; else return BURST_DOT_PIPE; end if;
+        else
+            if unica then return EXEC_DOT_ARVORE; else return BURST_DOT_ARVORE; end if;
+        end if;
+    end function;
+    
+    -- Registros do modo rajada
+    signal base_a_reg, base_b_reg, base_res_reg : unsigned(4 downto 0) := (others => '0');
+    signal contagem_reg : unsigned(5 downto 0) := (others => '0');
+    signal idx_leitura  : unsigned(5 downto 0) := (others => '0'); -- próximo par a ler
+    signal idx_escrita  : unsigned(5 downto 0) := (others => '0'); -- próximo resultado a escrever
+    
+    -- Endereços da rajada (soma módulo 32)
+    signal end_leitura_a, end_leitura_b, end_escrita : std_logic_vector(4 downto 0);
 begin
-    -- Processo síncrono: Atualiza o estado atual
+    end_leitura_a <= std_logic_vector(base_a_reg + idx_leitura(4 downto 0));
+    end_leitura_b <= std_logic_vector(base_b_reg + idx_leitura(4 downto 0));
+    end_escrita   <= std_logic_vector(base_res_reg + idx_escrita(4 downto 0));
+    
+    -- Processo síncrono: Atualiza o estado atual e os contadores da rajada
     process(clk)
     begin
         if rising_edge(clk) then
             if rst = '1' then
                 estado_atual <= IDLE;
+                idx_leitura  <= (others => '0');
+                idx_escrita  <= (others => '0');
             else
                 estado_atual <= proximo_estado;
+                case estado_atual is
+                    when IDLE =>
+                        if start = '1' and burst = '1' then
+                            base_a_reg   <= unsigned(base_a);
+                            base_b_reg   <= unsigned(base_b);
+                            base_res_reg <= unsigned(base_res);
+                            contagem_reg <= unsigned(contagem);
+                            idx_leitura  <= (others => '0');
+                            idx_escrita  <= (others => '0');
+                        end if;
+                    when BURST_LER =>
+                        idx_leitura <= idx_leitura + 1;
+                    when BURST_CARGA =>
+                        if idx_leitura > 1 then
+                            idx_escrita <= idx_escrita + 1;
+                        end if;
+                    when BURST_DOT_3 | BURST_DOT_ARVORE =>
+                        if idx_leitura < contagem_reg then
+                            idx_leitura <= idx_leitura + 1;
+                        end if;
+                    when BURST_FIM | BURST_DOT_WB =>
+                        idx_escrita <= idx_escrita + 1;
+                    when others =>
+                        null;
+                end case;
             end if;
         end if;
     end process;
     
     -- Processo combinacional: Lógica de próximo estado
-    process(estado_atual, start, op_sel)
+    process(estado_atual, start, op_sel, burst, contagem, contagem_reg, idx_leitura, idx_escrita)
     begin
         proximo_estado <= estado_atual;
         case estado_atual is
             when IDLE =>
                 if start = '1' then
-                    proximo_estado <= LOAD_A;
+                    if burst = '0' then
+                        proximo_estado <= LOAD_A;
+                    elsif unsigned(contagem) = 0 then
+                        proximo_estado <= DONE_STATE;
+                    else
+                        proximo_estado <= BURST_LER;
+                    end if;
                 end if;
             when LOAD_A =>
                 proximo_estado <= LOAD_B;
             when LOAD_B =>
                 if op_sel = "10" then -- Produto Escalar
-                    proximo_estado <= EXEC_DOT_0;
+                    proximo_estado <= inicio_dot(true);
                 else -- Soma ou Subtração
                     proximo_estado <= EXEC_SUM_SUB;
                 end if;
@@ -71,17 +149,52 @@ begin
                 proximo_estado <= EXEC_DOT_3;
             when EXEC_DOT_3 =>
                 proximo_estado <= WRITE_BACK;
+            when EXEC_DOT_PIPE =>
+                proximo_estado <= EXEC_DOT_ARVORE;
+            when EXEC_DOT_ARVORE =>
+                proximo_estado <= WRITE_BACK;
             when WRITE_BACK =>
                 proximo_estado <= DONE_STATE;
             when DONE_STATE =>
                 proximo_estado <= IDLE;
+            -- Rajada: o par k é lido em BURST_LER e carregado em BURST_CARGA
+            when BURST_LER =>
+                proximo_estado <= BURST_CARGA;
+            when BURST_CARGA =>
+                if op_sel = "10" then
+                    proximo_estado <= inicio_dot(false);
+                elsif idx_leitura < contagem_reg then
+                    proximo_estado <= BURST_LER;
+                else
+                    proximo_estado <= BURST_FIM;
+                end if;
+            when BURST_FIM =>
+                proximo_estado <= DONE_STATE;
+            when BURST_DOT_0 =>
+                proximo_estado <= BURST_DOT_1;
+            when BURST_DOT_1 =>
+                proximo_estado <= BURST_DOT_2;
+            when BURST_DOT_2 =>
+                proximo_estado <= BURST_DOT_3;
+            when BURST_DOT_3 =>
+                proximo_estado <= BURST_DOT_WB;
+            when BURST_DOT_PIPE =>
+                proximo_estado <= BURST_DOT_ARVORE;
+            when BURST_DOT_ARVORE =>
+                proximo_estado <= BURST_DOT_WB;
+            when BURST_DOT_WB =>
+                if idx_leitura > idx_escrita + 1 then
+                    proximo_estado <= inicio_dot(false);
+                else
+                    proximo_estado <= DONE_STATE;
+                end if;
             when others =>
                 proximo_estado <= IDLE;
         end case;
     end process;
     
     -- Processo combinacional: Saídas (Máquina de Moore)
-    process(estado_atual, op_sel)
+    process(estado_atual, op_sel, idx_leitura, idx_escrita, end_leitura_a, end_leitura_b, end_escrita)
     begin
         -- Valores padrão
         bram_addr_a <= "00000";
@@ -103,6 +216,9 @@ begin
             when LOAD_B =>
                 bram_addr_b <= "00001";
                 reg_b_load  <= '1';
+                if ARVORE_SOMA then
+                    acc_rst <= '1'; -- EXEC_DOT_ARVORE acumula sobre zero
+                end if;
             when EXEC_SUM_SUB =>
                 mux_sel <= "00";
             when EXEC_DOT_0 =>
@@ -117,6 +233,10 @@ begin
             when EXEC_DOT_3 =>
                 acc_en  <= '1';
                 mux_sel <= "01";
+            when EXEC_DOT_PIPE =>
+                null; -- registrador de pipeline da árvore captura as somas parciais
+            when EXEC_DOT_ARVORE =>
+                acc_en <= '1';
             when WRITE_BACK =>
                 bram_addr_a <= "00010";
                 bram_we     <= '1';
@@ -127,6 +247,55 @@ begin
                 end if;
             when DONE_STATE =>
                 done <= '1';
+            -- Soma/subtração em rajada: 2 ciclos por par. Em BURST_CARGA o
+            -- resultado do par anterior (ainda nos registradores) é escrito
+            -- na mesma borda em que o par lido em BURST_LER é carregado.
+            when BURST_LER =>
+                bram_addr_a <= end_leitura_a;
+                bram_addr_b <= end_leitura_b;
+            when BURST_CARGA =>
+                bram_addr_a <= end_escrita;
+                reg_a_load  <= '1';
+                reg_b_load  <= '1';
+                acc_rst     <= '1';
+                if idx_leitura > 1 then
+                    bram_we <= '1';
+                end if;
+            when BURST_FIM =>
+                bram_addr_a <= end_escrita;
+                bram_we     <= '1';
+            -- Produto escalar em rajada: 5 ciclos por par. O próximo par é
+            -- lido em BURST_DOT_3 e carregado em BURST_DOT_WB, que também
+            -- escreve o acumulador e o zera para o próximo par.
+            when BURST_DOT_0 =>
+                acc_en  <= '1';
+                mux_sel <= "00";
+            when BURST_DOT_1 =>
+                acc_en  <= '1';
+                mux_sel <= "01";
+            when BURST_DOT_2 =>
+                acc_en  <= '1';
+                mux_sel <= "10";
+            when BURST_DOT_3 =>
+                acc_en      <= '1';
+                mux_sel     <= "11";
+                bram_addr_a <= end_leitura_a;
+                bram_addr_b <= end_leitura_b;
+            when BURST_DOT_PIPE =>
+                null;
+            when BURST_DOT_ARVORE =>
+                acc_en      <= '1';
+                bram_addr_a <= end_leitura_a;
+                bram_addr_b <= end_leitura_b;
+            when BURST_DOT_WB =>
+                bram_addr_a <= end_escrita;
+                bram_we     <= '1';
+                acc_rst     <= '1';
+                mux_sel     <= "01";
+                if idx_leitura > idx_escrita + 1 then
+                    reg_a_load <= '1';
+                    reg_b_load <= '1';
+                end if;
             when others =>
                 null;
         end case;
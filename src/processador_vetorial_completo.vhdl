@@ -9,23 +9,50 @@ library ieee;
 use ieee.std_logic_1164.all;
 
 entity ProcessadorVetorialCompleto is
+    generic (
+        ARVORE_SOMA     : boolean := false; -- produto escalar com árvore de somadores
+        ARVORE_PIPELINE : boolean := false  -- registrador de pipeline na árvore
+    );
     port (
         clk    : in  std_logic;
         rst    : in  std_logic;
         start  : in  std_logic;
         op_sel : in  std_logic_vector(1 downto 0);
-        done   : out std_logic
+        done   : out std_logic;
+        
+        -- Modo rajada
+        burst     : in  std_logic := '0';
+        base_a    : in  std_logic_vector(4 downto 0) := "00000";
+        base_b    : in  std_logic_vector(4 downto 0) := "00000";
+        base_res  : in  std_logic_vector(4 downto 0) := "00000";
+        contagem  : in  std_logic_vector(5 downto 0) := "000000";
+        
+        -- Acesso do host à BRAM
+        host_en   : in  std_logic := '0';
+        host_we   : in  std_logic := '0';
+        host_addr : in  std_logic_vector(4 downto 0) := "00000";
+        host_di   : in  std_logic_vector(31 downto 0) := (others => '0');
+        host_do   : out std_logic_vector(31 downto 0)
     );
 end entity ProcessadorVetorialCompleto;
 
 architecture Structural of ProcessadorVetorialCompleto is
     -- Componentes
     component FSMCompleta is
+        generic (
+            ARVORE_SOMA     : boolean := false;
+            ARVORE_PIPELINE : boolean := false
+        );
         port (
             clk           : in  std_logic;
             rst           : in  std_logic;
             start         : in  std_logic;
             op_sel        : in  std_logic_vector(1 downto 0);
+            burst         : in  std_logic := '0';
+            base_a        : in  std_logic_vector(4 downto 0) := "00000";
+            base_b        : in  std_logic_vector(4 downto 0) := "00000";
+            base_res      : in  std_logic_vector(4 downto 0) := "00000";
+            contagem      : in  std_logic_vector(5 downto 0) := "000000";
             bram_addr_a   : out std_logic_vector(4 downto 0);
             bram_addr_b   : out std_logic_vector(4 downto 0);
             bram_we       : out std_logic;
@@ -39,6 +66,10 @@ architecture Structural of ProcessadorVetorialCompleto is
     end component;
     
     component DatapathCompleto is
+        generic (
+            ARVORE_SOMA     : boolean := false;
+            ARVORE_PIPELINE : boolean := false
+        );
         port (
             clk         : in  std_logic;
             rst         : in  std_logic;
@@ -51,6 +82,11 @@ architecture Structural of ProcessadorVetorialCompleto is
             acc_en      : in  std_logic;
             mux_sel     : in  std_logic_vector(1 downto 0);
             op_sel      : in  std_logic_vector(1 downto 0);
+            host_en     : in  std_logic := '0';
+            host_we     : in  std_logic := '0';
+            host_addr   : in  std_logic_vector(4 downto 0) := "00000";
+            host_di     : in  std_logic_vector(31 downto 0) := (others => '0');
+            host_do     : out std_logic_vector(31 downto 0);
             result_out  : out std_logic_vector(31 downto 0)
         );
     end component;
@@ -63,11 +99,19 @@ architecture Structural of ProcessadorVetorialCompleto is
     
 begin
     -- Instanciação da FSM
-    FSM_inst : FSMCompleta port map (
+    FSM_inst : FSMCompleta generic map (
+        ARVORE_SOMA     => ARVORE_SOMA,
+        ARVORE_PIPELINE => ARVORE_PIPELINE
+    ) port map (
         clk           => clk,
         rst           => rst,
         start         => start,
         op_sel        => op_sel,
+        burst         => burst,
+        base_a        => base_a,
+        base_b        => base_b,
+        base_res      => base_res,
+        contagem      => contagem,
         bram_addr_a   => bram_addr_a_s,
         bram_addr_b   => bram_addr_b_s,
         bram_we       => bram_we_s,
@@ -80,7 +124,10 @@ begin
     );
     
     -- Instanciação do Datapath
-    Datapath_inst : DatapathCompleto port map (
+    Datapath_inst : DatapathCompleto generic map (
+        ARVORE_SOMA     => ARVORE_SOMA,
+        ARVORE_PIPELINE => ARVORE_PIPELINE
+    ) port map (
         clk         => clk,
         rst         => rst,
         bram_addr_a => bram_addr_a_s,
@@ -92,6 +139,11 @@ begin
         acc_en      => acc_en_s,
         mux_sel     => mux_sel_s,
         op_sel      => op_sel,
+        host_en     => host_en,
+        host_we     => host_we,
+        host_addr   => host_addr,
+        host_di     => host_di,
+        host_do     => host_do,
         result_out  => result_out_s
     );
     
@@ -0,0 +1,305 @@
+-- =============================================================================
+-- Arquivo: tb_burst_processador_vetorial.vhdl
+-- Descrição: Testbench do modo rajada (burst) do processador vetorial
+--            Carrega 8 pares na BRAM pela porta do host, executa soma,
+--            subtração e produto escalar em rajada e confere os resultados
+--            com a definição das operações (calculada no próprio
+--            testbench) e o número de ciclos com a contagem documentada da
+--            FSM, para a variante do produto escalar escolhida pelos
+--            generics (ex.: -gARVORE_SOMA=true)
+-- Autor: Equipe Processador Vetorial
+-- Data: 26/11/2025
+-- =============================================================================
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity tb_BurstProcessadorVetorial is
+    generic (
+        ARVORE_SOMA     : boolean := false;
+        ARVORE_PIPELINE : boolean := false
+    );
+end entity tb_BurstProcessadorVetorial;
+
+architecture Behavioral of tb_BurstProcessadorVetorial is
+    -- Componente a ser testado
+    component ProcessadorVetorialCompleto is
+        generic (
+            ARVORE_SOMA     : boolean := false;
+            ARVORE_PIPELINE : boolean := false
+        );
+        port (
+            clk       : in  std_logic;
+            rst       : in  std_logic;
+            start     : in  std_logic;
+            op_sel    : in  std_logic_vector(1 downto 0);
+            done      : out std_logic;
+            burst     : in  std_logic := '0';
+            base_a    : in  std_logic_vector(4 downto 0) := "00000";
+            base_b    : in  std_logic_vector(4 downto 0) := "00000";
+            base_res  : in  std_logic_vector(4 downto 0) := "00000";
+            contagem  : in  std_logic_vector(5 downto 0) := "000000";
+            host_en   : in  std_logic := '0';
+            host_we   : in  std_logic := '0';
+            host_addr : in  std_logic_vector(4 downto 0) := "00000";
+            host_di   : in  std_logic_vector(31 downto 0) := (others => '0');
+            host_do   : out std_logic_vector(31 downto 0)
+        );
+    end component;
+
+    type palavras_t is array (natural range <>) of std_logic_vector(31 downto 0);
+
+    -- Vetores de teste (lanes int8 empacotadas, lane 0 nos bits 7..0)
+    constant N_PARES : integer := 8;
+    constant VEC_A : palavras_t(0 to N_PARES-1) := (
+        x"80807F7F", x"80808080", x"0100807F", x"DCE780B1",
+        x"9633F968", x"3366399F", x"D99C3B7D", x"5CB03E2B");
+    constant VEC_B : palavras_t(0 to N_PARES-1) := (
+        x"80FF7F01", x"80808080", x"FF007F80", x"0CE10880",
+        x"92449E83", x"43A67873", x"9769D295", x"37E0E19F");
+
+    -- Resultados esperados calculados aqui mesmo, lane a lane, pela definição
+    -- das operações (soma/subtração com saturação em int8 e soma dos quatro
+    -- produtos int8 x int8 estendida para 32 bits), sem passar pelo modelo
+    -- de ciclos em Python
+    function saturar(valor : integer) return std_logic_vector is
+    begin
+        if valor > 127 then
+            return std_logic_vector(to_signed(127, 8));
+        elsif valor < -128 then
+            return std_logic_vector(to_signed(-128, 8));
+        else
+            return std_logic_vector(to_signed(valor, 8));
+        end if;
+    end function;
+
+    function lane(palavra : std_logic_vector(31 downto 0); i : integer) return integer is
+    begin
+        return to_integer(signed(palavra(8*i+7 downto 8*i)));
+    end function;
+
+    function esperado_add_sub(subtrai : boolean) return palavras_t is
+        variable resultado : palavras_t(0 to N_PARES-1);
+        variable valor     : integer;
+    begin
+        for p in 0 to N_PARES-1 loop
+            for i in 0 to 3 loop
+                if subtrai then
+                    valor := lane(VEC_A(p), i) - lane(VEC_B(p), i);
+                else
+                    valor := lane(VEC_A(p), i) + lane(VEC_B(p), i);
+                end if;
+                resultado(p)(8*i+7 downto 8*i) := saturar(valor);
+            end loop;
+        end loop;
+        return resultado;
+    end function;
+
+    function esperado_dot return palavras_t is
+        variable resultado : palavras_t(0 to N_PARES-1);
+        variable soma      : integer;
+    begin
+        for p in 0 to N_PARES-1 loop
+            soma := 0;
+            for i in 0 to 3 loop
+                soma := soma + lane(VEC_A(p), i) * lane(VEC_B(p), i);
+            end loop;
+            resultado(p) := std_logic_vector(to_signed(soma, 32));
+        end loop;
+        return resultado;
+    end function;
+
+    constant ESPERADO_SOMA : palavras_t(0 to N_PARES-1) := esperado_add_sub(false);
+    constant ESPERADO_SUB  : palavras_t(0 to N_PARES-1) := esperado_add_sub(true);
+    constant ESPERADO_DOT  : palavras_t(0 to N_PARES-1) := esperado_dot;
+
+    -- Ciclos por par do produto escalar em rajada: 4 de acumulação + escrita
+    -- (serial), 1 + escrita (árvore) ou 2 + escrita (árvore com pipeline)
+    function ciclos_por_par_dot return integer is
+    begin
+        if not ARVORE_SOMA then
+            return 5;
+        elsif ARVORE_PIPELINE then
+            return 3;
+        else
+            return 2;
+        end if;
+    end function;
+
+    -- Ciclos de IDLE (amostrando start) até DONE_STATE, inclusive
+    constant CICLOS_SOMA_SUB : integer := 2*N_PARES + 3;
+    constant CICLOS_DOT      : integer := ciclos_por_par_dot*N_PARES + 4;
+
+    -- Endereços na BRAM
+    constant BASE_A_END   : integer := 0;
+    constant BASE_B_END   : integer := 8;
+    constant RES_SOMA_END : integer := 16;
+    constant RES_SUB_END  : integer := 24;
+    constant RES_DOT_END  : integer := 16;
+
+    -- Sinais do testbench
+    signal clk_tb       : std_logic := '0';
+    signal rst_tb       : std_logic := '0';
+    signal start_tb     : std_logic := '0';
+    signal op_sel_tb    : std_logic_vector(1 downto 0) := "00";
+    signal done_tb      : std_logic;
+    signal burst_tb     : std_logic := '0';
+    signal base_a_tb    : std_logic_vector(4 downto 0) := "00000";
+    signal base_b_tb    : std_logic_vector(4 downto 0) := "00000";
+    signal base_res_tb  : std_logic_vector(4 downto 0) := "00000";
+    signal contagem_tb  : std_logic_vector(5 downto 0) := "000000";
+    signal host_en_tb   : std_logic := '0';
+    signal host_we_tb   : std_logic := '0';
+    signal host_addr_tb : std_logic_vector(4 downto 0) := "00000";
+    signal host_di_tb   : std_logic_vector(31 downto 0) := (others => '0');
+    signal host_do_tb   : std_logic_vector(31 downto 0);
+
+    -- Constantes
+    constant CLK_PERIOD : time := 10 ns;
+
+begin
+    -- Instanciação do DUT (Device Under Test)
+    DUT : ProcessadorVetorialCompleto generic map (
+        ARVORE_SOMA     => ARVORE_SOMA,
+        ARVORE_PIPELINE => ARVORE_PIPELINE
+    ) port map (
+        clk       => clk_tb,
+        rst       => rst_tb,
+        start     => start_tb,
+        op_sel    => op_sel_tb,
+        done      => done_tb,
+        burst     => burst_tb,
+        base_a    => base_a_tb,
+        base_b    => base_b_tb,
+        base_res  => base_res_tb,
+        contagem  => contagem_tb,
+        host_en   => host_en_tb,
+        host_we   => host_we_tb,
+        host_addr => host_addr_tb,
+        host_di   => host_di_tb,
+        host_do   => host_do_tb
+    );
+
+    -- Geração de clock
+    clk_tb <= not clk_tb after CLK_PERIOD/2;
+
+    -- Processo de estímulos
+    stimulus_proc : process
+        variable erros : integer := 0;
+
+        -- Escreve uma palavra na BRAM pela porta do host
+        procedure escrever(endereco : integer; palavra : std_logic_vector(31 downto 0)) is
+        begin
+            host_en_tb   <= '1';
+            host_we_tb   <= '1';
+            host_addr_tb <= std_logic_vector(to_unsigned(endereco, 5));
+            host_di_tb   <= palavra;
+            wait until rising_edge(clk_tb);
+            host_we_tb   <= '0';
+            host_en_tb   <= '0';
+        end procedure;
+
+        -- Lê uma palavra da BRAM pela porta do host (leitura síncrona)
+        procedure ler(endereco : integer; palavra : out std_logic_vector(31 downto 0)) is
+        begin
+            host_en_tb   <= '1';
+            host_we_tb   <= '0';
+            host_addr_tb <= std_logic_vector(to_unsigned(endereco, 5));
+            wait until rising_edge(clk_tb);
+            wait for 1 ns;
+            palavra := host_do_tb;
+            host_en_tb   <= '0';
+        end procedure;
+
+        -- Executa uma rajada e mede os ciclos até done
+        procedure executar_rajada(op : std_logic_vector(1 downto 0); base_res : integer;
+                                  n : integer; ciclos : out integer) is
+            variable contador : integer := 0;
+        begin
+            op_sel_tb   <= op;
+            burst_tb    <= '1';
+            base_a_tb   <= std_logic_vector(to_unsigned(BASE_A_END, 5));
+            base_b_tb   <= std_logic_vector(to_unsigned(BASE_B_END, 5));
+            base_res_tb <= std_logic_vector(to_unsigned(base_res, 5));
+            contagem_tb <= std_logic_vector(to_unsigned(n, 6));
+            start_tb    <= '1';
+            loop
+                wait until rising_edge(clk_tb);
+                start_tb <= '0';
+                contador := contador + 1;
+                exit when done_tb = '1';
+            end loop;
+            burst_tb <= '0';
+            ciclos   := contador;
+        end procedure;
+
+        -- Confere os resultados e os ciclos de uma rajada
+        procedure conferir(nome : string; base_res : integer; esperado : palavras_t;
+                           ciclos, ciclos_esperados : integer) is
+            variable palavra : std_logic_vector(31 downto 0);
+        begin
+            if ciclos /= ciclos_esperados then
+                report nome & ": " & integer'image(ciclos) & " ciclos, esperado "
+                       & integer'image(ciclos_esperados) severity error;
+                erros := erros + 1;
+            end if;
+            for i in esperado'range loop
+                ler(base_res + i, palavra);
+                if palavra /= esperado(i) then
+                    report nome & ": resultado " & integer'image(i) & " = " & to_hstring(palavra)
+                           & ", esperado " & to_hstring(esperado(i)) severity error;
+                    erros := erros + 1;
+                end if;
+            end loop;
+            report nome & " em rajada: " & integer'image(ciclos) & " ciclos para "
+                   & integer'image(esperado'length) & " pares" severity note;
+        end procedure;
+
+        variable ciclos : integer;
+    begin
+        report "===========================================" severity note;
+        report "Testbench do Modo Rajada (ARVORE_SOMA = " & boolean'image(ARVORE_SOMA)
+               & ", ARVORE_PIPELINE = " & boolean'image(ARVORE_PIPELINE) & ")" severity note;
+        report "===========================================" severity note;
+
+        -- Reset
+        rst_tb <= '1';
+        wait for 2*CLK_PERIOD;
+        rst_tb <= '0';
+        wait until rising_edge(clk_tb);
+
+        -- Carga dos operandos pela porta do host
+        for i in 0 to N_PARES-1 loop
+            escrever(BASE_A_END + i, VEC_A(i));
+            escrever(BASE_B_END + i, VEC_B(i));
+        end loop;
+
+        executar_rajada("00", RES_SOMA_END, N_PARES, ciclos);
+        conferir("SOMA", RES_SOMA_END, ESPERADO_SOMA, ciclos, CICLOS_SOMA_SUB);
+
+        executar_rajada("01", RES_SUB_END, N_PARES, ciclos);
+        conferir("SUBTRAÇÃO", RES_SUB_END, ESPERADO_SUB, ciclos, CICLOS_SOMA_SUB);
+
+        executar_rajada("10", RES_DOT_END, N_PARES, ciclos);
+        conferir("PRODUTO ESCALAR", RES_DOT_END, ESPERADO_DOT, ciclos, CICLOS_DOT);
+
+        -- Rajada vazia: IDLE -> DONE_STATE
+        executar_rajada("00", RES_SOMA_END, 0, ciclos);
+        if ciclos /= 2 then
+            report "Rajada vazia: " & integer'image(ciclos) & " ciclos, esperado 2" severity error;
+            erros := erros + 1;
+        end if;
+
+        report "===========================================" severity note;
+        if erros = 0 then
+            report "Todos os testes do modo rajada passaram!" severity note;
+        else
+            report integer'image(erros) & " erro(s) no modo rajada" severity failure;
+        end if;
+        report "===========================================" severity note;
+
+        wait;
+    end process stimulus_proc;
+
+end architecture Behavioral;
@@ -15,12 +15,26 @@ end entity tb_ProcessadorVetorialCompleto;
 architecture Behavioral of tb_ProcessadorVetorialCompleto is
     -- Componente a ser testado
     component ProcessadorVetorialCompleto is
+        generic (
+            ARVORE_SOMA     : boolean := false;
+            ARVORE_PIPELINE : boolean := false
+        );
         port (
             clk    : in  std_logic;
             rst    : in  std_logic;
             start  : in  std_logic;
             op_sel : in  std_logic_vector(1 downto 0);
-            done   : out std_logic
+            done   : out std_logic;
+            burst     : in  std_logic := '0';
+            base_a    : in  std_logic_vector(4 downto 0) := "00000";
+            base_b    : in  std_logic_vector(4 downto 0) := "00000";
+            base_res  : in  std_logic_vector(4 downto 0) := "00000";
+            contagem  : in  std_logic_vector(5 downto 0) := "000000";
+            host_en   : in  std_logic := '0';
+            host_we   : in  std_logic := '0';
+            host_addr : in  std_logic_vector(4 downto 0) := "00000";
+            host_di   : in  std_logic_vector(31 downto 0) := (others => '0');
+            host_do   : out std_logic_vector(31 downto 0)
         );
     end component;
     
@@ -41,7 +55,8 @@ begin
         rst    => rst_tb,
         start  => start_tb,
         op_sel => op_sel_tb,
-        done   => done_tb
+        done   => done_tb,
+        host_do => open
     );
     
     -- Geração de clock
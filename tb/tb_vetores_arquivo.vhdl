@@ -0,0 +1,244 @@
+-- =============================================================================
+-- Arquivo: tb_vetores_arquivo.vhdl
+-- Descrição: Testbench dirigido por arquivo do processador vetorial
+--            Lê com textio os registros gerados por
+--            benchmarks/vetores_referencia.py (A, B, soma, subtração e
+--            produto escalar em hexadecimal, um registro por linha),
+--            carrega blocos de até 8 pares na BRAM pela porta do host,
+--            executa as três operações em rajada e confere os resultados.
+--            O arquivo é escolhido pelo generic ARQUIVO, sem recompilar
+--            (ex.: -gARQUIVO=vetores.hex)
+-- Autor: Equipe Processador Vetorial
+-- Data: 26/11/2025
+-- =============================================================================
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+use std.textio.all;
+
+entity tb_VetoresArquivo is
+    generic (
+        ARQUIVO         : string  := "vetores_referencia.hex";
+        MAX_ERROS       : integer := 10;  -- divergências detalhadas no relatório
+        ARVORE_SOMA     : boolean := false;
+        ARVORE_PIPELINE : boolean := false
+    );
+end entity tb_VetoresArquivo;
+
+architecture Behavioral of tb_VetoresArquivo is
+    -- Componente a ser testado
+    component ProcessadorVetorialCompleto is
+        generic (
+            ARVORE_SOMA     : boolean := false;
+            ARVORE_PIPELINE : boolean := false
+        );
+        port (
+            clk       : in  std_logic;
+            rst       : in  std_logic;
+            start     : in  std_logic;
+            op_sel    : in  std_logic_vector(1 downto 0);
+            done      : out std_logic;
+            burst     : in  std_logic := '0';
+            base_a    : in  std_logic_vector(4 downto 0) := "00000";
+            base_b    : in  std_logic_vector(4 downto 0) := "00000";
+            base_res  : in  std_logic_vector(4 downto 0) := "00000";
+            contagem  : in  std_logic_vector(5 downto 0) := "000000";
+            host_en   : in  std_logic := '0';
+            host_we   : in  std_logic := '0';
+            host_addr : in  std_logic_vector(4 downto 0) := "00000";
+            host_di   : in  std_logic_vector(31 downto 0) := (others => '0');
+            host_do   : out std_logic_vector(31 downto 0)
+        );
+    end component;
+
+    -- Pares por rajada: A em 0..7, B em 8..15, resultados em 16..23
+    constant N_BLOCO      : integer := 8;
+    constant BASE_A_END   : integer := 0;
+    constant BASE_B_END   : integer := 8;
+    constant BASE_RES_END : integer := 16;
+
+    type palavras_t is array (0 to N_BLOCO-1) of std_logic_vector(31 downto 0);
+    type resultados_t is array (0 to 2) of palavras_t;  -- índice = op_sel
+
+    function nome_op(op : integer) return string is
+    begin
+        case op is
+            when 0      => return "SOMA";
+            when 1      => return "SUBTRAÇÃO";
+            when others => return "PRODUTO ESCALAR";
+        end case;
+    end function;
+
+    -- Sinais do testbench
+    signal clk_tb       : std_logic := '0';
+    signal rst_tb       : std_logic := '0';
+    signal start_tb     : std_logic := '0';
+    signal op_sel_tb    : std_logic_vector(1 downto 0) := "00";
+    signal done_tb      : std_logic;
+    signal burst_tb     : std_logic := '0';
+    signal base_a_tb    : std_logic_vector(4 downto 0) := std_logic_vector(to_unsigned(BASE_A_END, 5));
+    signal base_b_tb    : std_logic_vector(4 downto 0) := std_logic_vector(to_unsigned(BASE_B_END, 5));
+    signal base_res_tb  : std_logic_vector(4 downto 0) := std_logic_vector(to_unsigned(BASE_RES_END, 5));
+    signal contagem_tb  : std_logic_vector(5 downto 0) := "000000";
+    signal host_en_tb   : std_logic := '0';
+    signal host_we_tb   : std_logic := '0';
+    signal host_addr_tb : std_logic_vector(4 downto 0) := "00000";
+    signal host_di_tb   : std_logic_vector(31 downto 0) := (others => '0');
+    signal host_do_tb   : std_logic_vector(31 downto 0);
+    signal fim_tb       : boolean := false;
+
+    -- Constantes
+    constant CLK_PERIOD : time := 10 ns;
+
+begin
+    -- Instanciação do DUT (Device Under Test)
+    DUT : ProcessadorVetorialCompleto generic map (
+        ARVORE_SOMA     => ARVORE_SOMA,
+        ARVORE_PIPELINE => ARVORE_PIPELINE
+    ) port map (
+        clk       => clk_tb,
+        rst       => rst_tb,
+        start     => start_tb,
+        op_sel    => op_sel_tb,
+        done      => done_tb,
+        burst     => burst_tb,
+        base_a    => base_a_tb,
+        base_b    => base_b_tb,
+        base_res  => base_res_tb,
+        contagem  => contagem_tb,
+        host_en   => host_en_tb,
+        host_we   => host_we_tb,
+        host_addr => host_addr_tb,
+        host_di   => host_di_tb,
+        host_do   => host_do_tb
+    );
+
+    -- Geração de clock (para ao fim do arquivo, encerrando a simulação)
+    clk_tb <= not clk_tb after CLK_PERIOD/2 when not fim_tb;
+
+    -- Processo de estímulos
+    stimulus_proc : process
+        file vetores : text open read_mode is ARQUIVO;
+        variable linha     : line;
+        variable numero    : integer := 0;  -- linha atual do arquivo
+        variable n         : integer;       -- pares no bloco atual
+        variable vec_a     : palavras_t;
+        variable vec_b     : palavras_t;
+        variable esperado  : resultados_t;
+        variable palavra   : std_logic_vector(31 downto 0);
+        variable total     : integer := 0;
+        variable erros     : integer := 0;
+
+        -- Escreve uma palavra na BRAM pela porta do host
+        procedure escrever(endereco : integer; valor : std_logic_vector(31 downto 0)) is
+        begin
+            host_en_tb   <= '1';
+            host_we_tb   <= '1';
+            host_addr_tb <= std_logic_vector(to_unsigned(endereco, 5));
+            host_di_tb   <= valor;
+            wait until rising_edge(clk_tb);
+            host_we_tb   <= '0';
+            host_en_tb   <= '0';
+        end procedure;
+
+        -- Lê uma palavra da BRAM pela porta do host (leitura síncrona)
+        procedure ler(endereco : integer; valor : out std_logic_vector(31 downto 0)) is
+        begin
+            host_en_tb   <= '1';
+            host_we_tb   <= '0';
+            host_addr_tb <= std_logic_vector(to_unsigned(endereco, 5));
+            wait until rising_edge(clk_tb);
+            wait for 1 ns;
+            valor := host_do_tb;
+            host_en_tb   <= '0';
+        end procedure;
+
+        -- Lê a próxima palavra hexadecimal da linha atual; uma palavra
+        -- ausente ou malformada aborta a simulação indicando a linha
+        procedure ler_hex(valor : out std_logic_vector(31 downto 0)) is
+            variable bom : boolean;
+        begin
+            hread(linha, valor, bom);
+            assert bom report "Linha " & integer'image(numero) & " malformada" severity failure;
+        end procedure;
+
+        -- Executa uma rajada sobre os n pares carregados e aguarda done
+        procedure executar_rajada(op : std_logic_vector(1 downto 0); pares : integer) is
+        begin
+            op_sel_tb   <= op;
+            burst_tb    <= '1';
+            contagem_tb <= std_logic_vector(to_unsigned(pares, 6));
+            start_tb    <= '1';
+            loop
+                wait until rising_edge(clk_tb);
+                start_tb <= '0';
+                exit when done_tb = '1';
+            end loop;
+            burst_tb <= '0';
+        end procedure;
+
+    begin
+        report "===========================================" severity note;
+        report "Testbench dirigido por arquivo: " & ARQUIVO severity note;
+        report "===========================================" severity note;
+
+        -- Reset
+        rst_tb <= '1';
+        wait for 2*CLK_PERIOD;
+        rst_tb <= '0';
+        wait until rising_edge(clk_tb);
+
+        while not endfile(vetores) loop
+            -- Lê até N_BLOCO registros
+            n := 0;
+            while n < N_BLOCO and not endfile(vetores) loop
+                readline(vetores, linha);
+                numero := numero + 1;
+                next when linha'length = 0;
+                ler_hex(vec_a(n));
+                ler_hex(vec_b(n));
+                for op in 0 to 2 loop
+                    ler_hex(esperado(op)(n));
+                end loop;
+                n := n + 1;
+            end loop;
+            exit when n = 0;
+
+            for i in 0 to n-1 loop
+                escrever(BASE_A_END + i, vec_a(i));
+                escrever(BASE_B_END + i, vec_b(i));
+            end loop;
+
+            for op in 0 to 2 loop
+                executar_rajada(std_logic_vector(to_unsigned(op, 2)), n);
+                for i in 0 to n-1 loop
+                    ler(BASE_RES_END + i, palavra);
+                    if palavra /= esperado(op)(i) then
+                        erros := erros + 1;
+                        if erros <= MAX_ERROS then
+                            report nome_op(op) & " (registro " & integer'image(total + i + 1) & "): A = "
+                                   & to_hstring(vec_a(i)) & ", B = " & to_hstring(vec_b(i))
+                                   & ", obtido " & to_hstring(palavra)
+                                   & ", esperado " & to_hstring(esperado(op)(i)) severity error;
+                        end if;
+                    end if;
+                end loop;
+            end loop;
+            total := total + n;
+        end loop;
+
+        report "===========================================" severity note;
+        report integer'image(total) & " registros conferidos (3 operações cada)" severity note;
+        if erros = 0 then
+            report "Todos os vetores do arquivo passaram!" severity note;
+        else
+            report integer'image(erros) & " divergência(s) em " & ARQUIVO severity failure;
+        end if;
+        report "===========================================" severity note;
+
+        fim_tb <= true;
+        wait;
+    end process stimulus_proc;
+
+end architecture Behavioral;